@@ -0,0 +1,170 @@
+## Banded storage for symmetric stiffness matrices
+## The continuous beam couples only neighbouring nodes, so every row of K has at
+## most 3 non-zero terms on each side of the diagonal (bandwidth 4 including it).
+
+## Lower band storage : Kb[j, i] = K[i + j, i], j = 0..p (p = 3 for Bernoulli beam)
+## Example: K (6x6) --> Kb (4x6)
+##   row 0 : K[0,0] K[1,1] K[2,2] ...   (diagonal)
+##   row 1 : K[1,0] K[2,1] K[3,2] ...   (1st sub-diagonal)
+##   ...
+
+import numpy as np
+
+BAND = 3  # half bandwidth of the beam stiffness matrix
+
+
+# Dense --> banded
+def to_banded(K, p=BAND):
+    """
+    K : np.array of symmetric matrix (n x n)
+    p : half bandwidth
+    return Kb : np.array (p+1 x n) in lower band storage
+    """
+    n = K.shape[0]
+    Kb = np.zeros((p + 1, n))
+    for j in range(p + 1):
+        Kb[j, : n - j] = np.diagonal(K, -j)
+    return Kb
+
+
+# Banded --> dense (for printing and checking only)
+def to_dense(Kb):
+    p = Kb.shape[0] - 1
+    n = Kb.shape[1]
+    K = np.zeros((n, n))
+    for j in range(p + 1):
+        idx = np.arange(n - j)
+        K[idx + j, idx] = Kb[j, : n - j]
+        K[idx, idx + j] = Kb[j, : n - j]
+    return K
+
+
+# Extract the rows/cols of index J from a banded matrix
+def reduce_banded(Kb, J):
+    """
+    Kb : np.array of lower band storage of K
+    J : sorted index of unknown displacement
+    return Kb of K[J][:, J], the bandwidth never grows when rows/cols are removed
+    """
+    J = np.asarray(J, dtype=int)
+    p = Kb.shape[0] - 1
+    n = len(J)
+    Kr = np.zeros((p + 1, n))
+    for j in range(min(p + 1, n)):
+        rows = J[j:]
+        cols = J[: n - j]
+        diff = rows - cols
+        ok = diff <= p
+        Kr[j, : n - j][ok] = Kb[diff[ok], cols[ok]]
+    return Kr
+
+
+# Column j of the full matrix from the lower band storage
+def band_column(Kb, j):
+    p = Kb.shape[0] - 1
+    n = Kb.shape[1]
+    col = np.zeros(n)
+    for i in range(p + 1):
+        if j + i < n:
+            col[j + i] = Kb[i, j]  # below diagonal
+        if i and j - i >= 0:
+            col[j - i] = Kb[i, j - i]  # above diagonal (symmetric)
+    return col
+
+
+# Product of banded matrix and vector(s) : [K][d]
+def banded_dot(Kb, d, rows=None):
+    """
+    Kb : np.array of lower band storage of K (n x n)
+    d : np.array (n,) or (n, m)
+    rows : index of the rows of [K][d] to compute, None --> all rows
+    """
+    p = Kb.shape[0] - 1
+    n = Kb.shape[1]
+    d = np.asarray(d, dtype=float)
+    x = d.reshape(n, -1)
+    if rows is not None:
+        return banded_rows(Kb, x, rows).reshape((-1,) + d.shape[1:])
+
+    y = Kb[0][:, None] * x
+    for j in range(1, p + 1):
+        band = Kb[j, : n - j][:, None]
+        y[j:] += band * x[: n - j]  # below diagonal
+        y[: n - j] += band * x[j:]  # above diagonal (symmetric)
+    return y.reshape(d.shape)
+
+
+# Rows r of [K][d] : K[r, r - j] = Kb[j, r - j], K[r, r + j] = Kb[j, r]
+def banded_rows(Kb, x, rows):
+    p = Kb.shape[0] - 1
+    n = Kb.shape[1]
+    r = np.asarray(rows, dtype=int)
+    y = Kb[0, r][:, None] * x[r]
+    for j in range(1, p + 1):
+        lo = r >= j
+        y[lo] += Kb[j, r[lo] - j][:, None] * x[r[lo] - j]  # below diagonal
+        up = r + j < n
+        y[up] += Kb[j, r[up]][:, None] * x[r[up] + j]  # above diagonal
+    return y
+
+
+# Factorization [K] = [L][D][L]^T
+def ldl_factor(Kb):
+    """
+    Kb : np.array of lower band storage of a symmetric, non-singular matrix
+    return (Lb, D) : unit lower band factor (same storage) and diagonal D
+    Time and memory are linear in n for a fixed bandwidth.
+    """
+    p = Kb.shape[0] - 1
+    n = Kb.shape[1]
+    Lb = np.zeros_like(Kb, dtype=float)
+    Lb[0] = 1.0
+    D = np.zeros(n)
+    for j in range(n):
+        k0 = max(0, j - p)
+        # D[j] = K[j, j] - sum(L[j, k]^2 * D[k])
+        s = Kb[0, j]
+        for k in range(k0, j):
+            s -= Lb[j - k, k] ** 2 * D[k]
+        if abs(s) <= 1e-10 * abs(Kb[0, j]):
+            raise np.linalg.LinAlgError(
+                "Singular stiffness matrix : unstable structure"
+            )
+        D[j] = s
+
+        # L[i, j] = (K[i, j] - sum(L[i, k] * L[j, k] * D[k])) / D[j]
+        for i in range(j + 1, min(n, j + p + 1)):
+            s = Kb[i - j, j]
+            for k in range(max(0, i - p), j):
+                s -= Lb[i - k, k] * Lb[j - k, k] * D[k]
+            Lb[i - j, j] = s / D[j]
+
+    return Lb, D
+
+
+# Solve [K][x] = [b] from the factorization
+def ldl_solve(factor, b):
+    """
+    factor : (Lb, D) from ldl_factor()
+    b : np.array (n,) or block of right-hand sides (n, m)
+    """
+    Lb, D = factor
+    p = Lb.shape[0] - 1
+    n = Lb.shape[1]
+    b = np.asarray(b, dtype=float)
+    x = b.reshape(n, -1).copy()
+
+    # Forward : [L][y] = [b]
+    for i in range(n):
+        for k in range(max(0, i - p), i):
+            x[i] -= Lb[i - k, k] * x[k]
+
+    # Diagonal : [D][z] = [y]
+    x /= D[:, None]
+
+    # Backward : [L]^T[x] = [z]
+    for i in range(n - 1, -1, -1):
+        for k in range(i + 1, min(n, i + p + 1)):
+            x[i] -= Lb[k - i, i] * x[k]
+
+    return x.reshape(b.shape)
@@ -0,0 +1,85 @@
+## Batched analysis of same-topology beams
+## Parametric studies run one support layout with different spans, E, I and load
+## magnitudes. Every design of the batch is one slice of stacked arrays :
+##   [K] (B x ndof x ndof), [Qf] (B x ndof), solved by np.linalg.solve over B.
+
+import numpy as np
+
+from element_table import element_stiffness
+from load_table import fef
+from stiffness_matrix import free_dofs
+
+
+def analyze_batch(
+    E, I, spans, support_type, table, value=None, a=None, l=None, R0=None
+):
+    """
+    E, I : GPa, m4 ; scalar, (B) or (B x n) per design and span
+    spans : np.array (B x n) of span lengths, m
+    support_type : list of support type (same for all designs)
+    table : load_table.LoadTable, loads of the template beam
+    value, a, l : optional (B x nloads) or (nloads) magnitudes / positions of the
+                  table loads for each design, default from table
+    R0 : optional known nodal external force (ndof) or (B x ndof), N, N-m
+    return dict
+        dy, R : np.array (B x ndof) of nodal displacement and nodal force
+        u, F : np.array (B x n x 4) of local displacement and end force
+        QF : np.array (B x n x 4) of local FEF
+    """
+    spans = np.atleast_2d(np.asarray(spans, dtype=float))
+    B, n = spans.shape
+    ndof = 2 * (n + 1)
+    if len(support_type) != n + 1:
+        raise ValueError("support_type must have one entry per node")
+
+    # Stacked element stiffness (B x n x 4 x 4)
+    E = np.asarray(E, dtype=float)
+    I = np.asarray(I, dtype=float)
+    E = E[:, None] if E.ndim == 1 else E
+    I = I[:, None] if I.ndim == 1 else I
+    k = element_stiffness(E, I, spans)
+
+    # Scatter into [K] (B x ndof x ndof)
+    dof = 2 * np.arange(n)[:, None] + np.arange(4)
+    K = np.zeros((B, ndof, ndof))
+    np.add.at(
+        K,
+        (slice(None), dof[:, :, None], dof[:, None, :]),
+        k,
+    )
+
+    # Local FEF of every load of every design, scattered by span
+    QF = np.zeros((B, n, 4))
+    if len(table):
+        value = table.value if value is None else value
+        a = table.a if a is None else a
+        l = table.l if l is None else l
+        value, a, l = np.broadcast_arrays(
+            np.asarray(value, dtype=float),
+            np.asarray(a, dtype=float),
+            np.asarray(l, dtype=float),
+            np.zeros((B, len(table))),
+        )[:3]
+        Q = fef(table.type, value, a, l, spans[:, table.span])  # (4 x B x nloads)
+        np.add.at(QF, (slice(None), table.span), np.moveaxis(Q, 0, -1))
+
+    Qf = np.zeros((B, ndof))
+    np.add.at(Qf, (slice(None), dof), QF)
+
+    Ro = np.zeros((B, ndof))
+    if R0 is not None and len(R0) != 0:
+        Ro[:] = R0
+
+    # [di] = [Ki]^-1 ([Ri] - [Qfi]) for all designs
+    J = free_dofs(support_type)
+    dy = np.zeros((B, ndof))
+    if len(J):
+        Kff = K[:, J[:, None], J]
+        dy[:, J] = np.linalg.solve(Kff, (Ro[:, J] - Qf[:, J])[..., None])[..., 0]
+
+    # [R] = [K][d] + [Qf], [Fi] = [ki][ui] + [QFi]
+    R = np.einsum("bij,bj->bi", K, dy) + Qf
+    u = dy[:, dof]
+    F = np.einsum("bnij,bnj->bni", k, u) + QF
+
+    return {"dy": dy, "R": R, "u": u, "F": F, "QF": QF}
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+## Batch design of a section schedule, no prompt
+## Every row of the schedule (b, h, cover, fc, fy, fv, Mu, Vu, Tu) goes through
+## the same steps as beam_design.main : classification, main bar required,
+## stirrup and torsion design, with the rules of shear_torsion.py in place of
+## input(). Beam / Torsion print every step, their output is discarded.
+
+import contextlib
+import io
+import json
+import math
+import os
+import time
+import traceback
+
+import pandas as pd
+
+from absl import app, flags
+from absl.flags import FLAGS
+
+from beam_class import Beam
+from rebar import Rebar
+from shear_torsion import bars, shear_torsion
+from utils import summary
+
+# Defaults of the columns missing in the schedule
+DEFAULTS = {
+    "fc": 24,  # MPa
+    "fy": 390,  # MPa
+    "fv": 235,  # MPa
+    "c": 3,  # cm
+    "main": 16,  # mm
+    "trav": 9,  # mm
+    "Vu": 0,  # kN
+    "Tu": 0,  # kN-m
+}
+
+rebar = Rebar()
+
+
+# Rows of the schedule as list of dict
+def read_schedule(path):
+    """
+    csv : one section per row, columns name, b, h, c, fc, fy, fv, Mu, Vu, Tu (main, trav optional)
+    json : [{...}, ...] or {"fc": 24, ..., "sections": [{...}, ...]}
+    b, h, c : cm ; fc, fy, fv : MPa ; Mu : kN-m ; Vu : kN ; Tu : kN-m ; main, trav : mm
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path) as f:
+            schedule = json.load(f)
+        if isinstance(schedule, dict):
+            common = {k: v for k, v in schedule.items() if k != "sections"}
+            rows = [{**common, **row} for row in schedule["sections"]]
+        else:
+            rows = schedule
+    else:
+        rows = pd.read_csv(path).to_dict("records")
+
+    rows = [
+        {**DEFAULTS, **{k: v for k, v in row.items() if pd.notna(v)}} for row in rows
+    ]
+    for i, row in enumerate(rows):
+        row["row"] = i
+        row.setdefault("name", f"S{i + 1}")
+    return rows
+
+
+# Main bars of one face, Beam after capacity()
+def face_bars(beam, Mu, main, Al=0.0):
+    """
+    Mu : kN-m, designed on |Mu| (the sign only gives the tension face)
+    Al : torsion longitudinal steel, cm2, Al / 4 on the face as Torsion.design()
+    return dict class, As_req, As1_req, fs1, N, As, N1, As1 (cm2, MPa)
+    A face without moment is not designed : class "no_moment", bars for Al only
+    """
+    if Mu == 0:
+        cls, fs, As_req, As1_req = "no_moment", beam.fy, 0.0, 0.0
+    else:
+        beam.classification(abs(Mu))
+        beam.mainbar_req(abs(Mu))
+        cls = beam.section_classification
+        if len(beam.data) == 1:
+            fs, As_req, As1_req = beam.fy, beam.data[0], 0.0
+        else:
+            fs, As_req, As1_req = beam.data
+
+    N = bars(As_req + Al / 4, main)
+    N1 = bars(As1_req, main)
+    return {
+        "class": cls,
+        "As_req": As_req,
+        "As1_req": As1_req,
+        "fs1": fs,
+        "N": N,
+        "As": N * rebar.A[str(main)],
+        "N1": N1,
+        "As1": N1 * rebar.A[str(main)],
+    }
+
+
+def design_section(row, s_min=7.5):
+    b, h, c = row["b"], row["h"], row["c"]
+    fc, fy, fv = row["fc"], row["fy"], row["fv"]
+    Mu, Vu, Tu = row["Mu"], row["Vu"], row["Tu"]
+    main, trav = int(row["main"]), int(row["trav"])
+
+    beam = Beam(fc=fc, fy=fy, fv=fv, c=c)
+    beam.section_properties(main, trav, b, h)
+    d, d1 = beam.eff_depth()
+    beam.capacity()
+
+    # Shear and torsion, then the main bars with the torsion steel
+    st = shear_torsion(b, h, c, d, fc, fy, fv, Vu, Tu, trav, s_min)
+    Al = st["Al"]
+    effect = st["torsion"]
+    flexure = face_bars(beam, Mu, main, Al)
+    N_long = 2 * math.ceil(bars(Al, main) / 2) if effect else 0  # 2 sides
+
+    return {
+        "d": d,
+        "d1": d1,
+        "𝜙Mn1": beam.𝜙Mn1,
+        "class": flexure["class"],
+        "face": "bottom" if Mu >= 0 else "top",  # tension face of As
+        "As_req": flexure["As_req"],
+        "As1_req": flexure["As1_req"],
+        "fs1": flexure["fs1"],
+        "Al": Al,
+        "N": flexure["N"],
+        "main": main,
+        "As": flexure["As"],
+        "N1": flexure["N1"],
+        "As1": flexure["As1"],
+        "N_long": N_long / 2,  # each side, as Torsion.design()
+        "trav": trav,
+        "stirrup": st["stirrup"],
+        "Av": st["Av"],
+        "s": st["s"],
+        "torsion": effect,
+    }
+
+
+# Design one row, failures are reported in the table
+def design_row(row, s_min=7.5):
+    out = {k: row.get(k) for k in ("row", "name", "b", "h", "c", "fc", "fy", "fv")}
+    out.update({k: row.get(k) for k in ("Mu", "Vu", "Tu")})
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            out.update(design_section(row, s_min))
+        out["status"] = "ok"
+        out["error"] = ""
+    except Exception as e:
+        out["status"] = "failed"
+        out["error"] = f"{type(e).__name__}: {e}"
+        out["traceback"] = traceback.format_exc()
+    return out
+
+
+def design_schedule(rows, s_min=7.5):
+    """
+    rows : list of dict from read_schedule()
+    return pd.DataFrame, one row per section in the order of the schedule
+    """
+    return pd.DataFrame([design_row(row, s_min) for row in rows]).set_index("row")
+
+
+def main(_argv):
+    print("=============== BATCH DESIGN : USD METHOD ===============")
+    rows = read_schedule(FLAGS.schedule)
+    print(f"{len(rows)} sections")
+
+    t0 = time.perf_counter()
+    df = design_schedule(rows, FLAGS.s_min)
+    summary(df, time.perf_counter() - t0, FLAGS.out)
+
+
+if __name__ == "__main__":
+    # Flags of the script only, the module is imported by other tools
+    flags.DEFINE_string("schedule", None, "section schedule (csv or json)")
+    flags.DEFINE_string("out", "batch_design.csv", "output table (csv)")
+    flags.DEFINE_float("s_min", 7.5, "smallest single stirrup spacing, cm")
+    flags.mark_flag_as_required("schedule")
+    app.run(main)
+
+"""
+-run script
+    % cd <path to project directory>
+    % conda activate <your conda env name>
+    % python app/batch_design.py --schedule=schedule.csv --out=batch_design.csv
+"""
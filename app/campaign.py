@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+## Design campaign : analysis + design of every beam of a project
+## Each beam of the project file is one job (analysis by stiffness_matrix.analyze,
+## design by the rules of batch_design / shear_torsion). Jobs are distributed over
+## a ProcessPoolExecutor in chunks; executor.map keeps the order of the project
+## file, so the output table is the same for any number of workers.
+
+import contextlib
+import io
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from absl import app, flags
+from absl.flags import FLAGS
+
+from batch_design import face_bars
+from beam_class import Beam
+from load_table import LoadTable
+from shear_torsion import shear_torsion
+from stiffness_matrix import analyze
+from utils import summary
+
+# Project defaults, overridden by the project file then by each beam
+DEFAULTS = {
+    "fc": 24,  # MPa
+    "fy": 390,  # MPa
+    "fv": 235,  # MPa
+    "c": 3,  # cm
+    "E": 23.5,  # GPa
+    "main": 16,  # mm
+    "trav": 9,  # mm
+    "Tu": 0,  # kN-m, design torsion of the beam
+    "s_min": 7.5,  # cm, smallest single stirrup spacing
+    "R0": None,
+}
+
+
+# List of jobs from the project file
+def read_project(path):
+    """
+    {
+      "fc": 24, "fy": 390, "fv": 235, "c": 3, "E": 23.5,
+      "beams": [
+        {"name": "B1", "b": 30, "h": 60, "spans": [4, 5], "supports": [2, 1, 2],
+         "loads": [{"span": 0, "type": 1, "value": 20000, "a": 0, "l": 4}, ...]},
+        ...
+      ]
+    }
+    b, h : cm ; spans : m ; loads : N, N/m, N-m (Down+) as load_table.LoadTable
+    return list of job dict, one per beam
+    """
+    with open(path) as f:
+        project = json.load(f)
+
+    common = {**DEFAULTS, **{k: v for k, v in project.items() if k != "beams"}}
+    return [{**common, "job": i, **beam} for i, beam in enumerate(project["beams"])]
+
+
+# Non-interactive design of one beam
+def design_job(job):
+    """
+    job : dict from read_project()
+    return dict, one row of the output table (status = "ok" or "failed")
+    """
+    row = {"job": job["job"], "name": job.get("name", f"B{job['job'] + 1}")}
+    t0 = time.perf_counter()
+    try:
+        row.update(design(job))
+        row["status"] = "ok"
+        row["error"] = ""
+    except Exception as e:
+        row["status"] = "failed"
+        row["error"] = f"{type(e).__name__}: {e}"
+        row["traceback"] = traceback.format_exc()
+    row["time"] = time.perf_counter() - t0
+    return row
+
+
+def design(job):
+    b, h = job["b"], job["h"]  # cm
+    I = (1 / 12) * b * h**3 * 1e-8  # m4
+
+    # Analysis
+    loads = job["loads"]
+    table = LoadTable(
+        [f["span"] for f in loads],
+        [f["type"] for f in loads],
+        [f["value"] for f in loads],
+        [f.get("a", 0) for f in loads],
+        [f.get("l", 0) for f in loads],
+    )
+    result = analyze(job["E"], I, job["spans"], job["supports"], table, job["R0"])
+    Mu_pos = max(result.maxMoment.max(), 0) / 1000  # kN-m, bottom steel
+    Mu_neg = min(result.minMoment.min(), 0) / 1000  # kN-m, top steel
+    Vu = max(abs(result.maxShear).max(), abs(result.minShear).max()) / 1000  # kN
+
+    # Design : same rules as batch_design, Beam prints every step
+    main, trav = job["main"], job["trav"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        beam = Beam(fc=job["fc"], fy=job["fy"], fv=job["fv"], c=job["c"])
+        beam.section_properties(main, trav, b, h)
+        d, d1 = beam.eff_depth()
+        beam.capacity()
+
+        st = shear_torsion(
+            b,
+            h,
+            job["c"],
+            d,
+            job["fc"],
+            job["fy"],
+            job["fv"],
+            Vu,
+            job["Tu"],
+            trav,
+            job["s_min"],
+        )
+
+        # As : tension steel of the face, As1 : compression steel on the opposite face
+        row = {"b": b, "h": h, "d": d, "Mu+": Mu_pos, "Mu-": Mu_neg, "Vu": Vu}
+        row["Tu"] = job["Tu"]
+        for side, Mu in (("bottom", Mu_pos), ("top", Mu_neg)):
+            face = face_bars(beam, Mu, main, st["Al"])
+            for k in ("class", "As_req", "As1_req", "N", "As", "N1", "As1"):
+                row[f"{k}_{side}"] = face[k]
+        row["main"] = main
+
+    row["trav"] = trav
+    row.update({k: st[k] for k in ("stirrup", "Av", "s", "torsion", "Al")})
+    return row
+
+
+# Run all jobs of the project
+def run_campaign(jobs, workers=None, chunksize=None):
+    """
+    jobs : list of job dict
+    workers : number of processes, None = os.cpu_count()
+    chunksize : jobs per chunk sent to a worker, None = about 4 chunks per worker
+    return pd.DataFrame, one row per job in the order of the project file
+    """
+    workers = workers or os.cpu_count()
+    chunksize = chunksize or max(1, len(jobs) // (4 * workers))
+
+    if workers == 1:
+        rows = list(map(design_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(design_job, jobs, chunksize=chunksize))
+
+    return pd.DataFrame(rows).set_index("job").sort_index()
+
+
+def main(_argv):
+    print("=============== DESIGN CAMPAIGN ===============")
+    jobs = read_project(FLAGS.project)
+    workers = FLAGS.workers or os.cpu_count()
+    print(f"{len(jobs)} beams, {workers} workers")
+
+    t0 = time.perf_counter()
+    df = run_campaign(jobs, workers, FLAGS.chunksize or None)
+    summary(df, time.perf_counter() - t0, FLAGS.out)
+
+
+if __name__ == "__main__":
+    # Flags of the script only, the module is imported by other tools
+    flags.DEFINE_string("project", None, "project file (json) listing the beams")
+    flags.DEFINE_string("out", "campaign.csv", "output table (csv)")
+    flags.DEFINE_integer("workers", 0, "number of processes, 0 = all cores")
+    flags.DEFINE_integer("chunksize", 0, "jobs per chunk, 0 = automatic")
+    flags.mark_flag_as_required("project")
+    app.run(main)
+
+"""
+-run script
+    % cd <path to project directory>
+    % conda activate <your conda env name>
+    % python app/campaign.py --project=project.json --out=campaign.csv --workers=8
+"""
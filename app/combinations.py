@@ -0,0 +1,125 @@
+## Load combinations and envelopes
+## Each load case (D, L, W, ...) is analysed once by LoadCases, then every
+## combination is a superposition of the case results:
+##   [V_combo] = [factors] @ [V_case],  [M_combo] = [factors] @ [M_case]
+
+import numpy as np
+
+from load_cases import LoadCases
+from load_table import LoadTable
+from stiffness_matrix import shear_values, moment_values
+from utils import xi_coordinate, X_coordinate
+
+# Factor tables {combination name : {load case name : factor}}
+ACI318_99 = {
+    "1.4D+1.7L": {"D": 1.4, "L": 1.7},
+    "0.75(1.4D+1.7L+1.7W)": {"D": 1.05, "L": 1.275, "W": 1.275},
+    "0.9D+1.3W": {"D": 0.9, "W": 1.3},
+}
+
+ASCE7_05 = {
+    "1.4D": {"D": 1.4},
+    "1.2D+1.6L": {"D": 1.2, "L": 1.6},
+    "1.2D+1.0L+1.6W": {"D": 1.2, "L": 1.0, "W": 1.6},
+    "0.9D+1.6W": {"D": 0.9, "W": 1.6},
+}
+
+
+# Combination factors as matrix
+def factor_matrix(table, names):
+    """
+    table : dict {combination name : {load case name : factor}}
+    names : list of load case names in the order of the case results
+    return combo : list of combination names, A : np.array (n_combo x n_case)
+    Load cases not analysed (ex. no wind case) take zero.
+    """
+    combo = list(table)
+    A = np.zeros((len(combo), len(names)))
+    for r, c_name in enumerate(combo):
+        for case, factor in table[c_name].items():
+            if case in names:
+                A[r, names.index(case)] = factor
+    return combo, A
+
+
+# Shear and moment of each load case at all stations
+def case_diagrams(model, cases, results):
+    """
+    model : LoadCases
+    cases : dict {name : loads}, list of loads in each stretch or LoadTable
+    results : return of model.analyse(cases)
+    return X : np.array of stations along the beam, m
+           V, M : np.array (n_case x n_station) of shear (N) and moment (N-m, sagging +)
+    """
+    numS, Xt = xi_coordinate(model.spans)
+    X = np.array(X_coordinate(model.spans, model.stretch, Xt))
+
+    V = []
+    M = []
+    for name in cases:
+        F = results[name]["F"]
+        loads = cases[name]
+        if isinstance(loads, LoadTable):
+            V.append(np.concatenate(loads.shear_values(model.spans, F, Xt)))
+            M.append(np.concatenate(loads.moment_values(model.spans, F, Xt)))
+        else:
+            V.append(np.concatenate(shear_values(model.spans, model.stretch, loads, F)))
+            M.append(
+                np.concatenate(moment_values(model.spans, model.stretch, loads, F))
+            )
+
+    return X, np.array(V), np.array(M)
+
+
+# Superposition of case results
+def combine(values, A):
+    """
+    values : np.array (n_case x ...) of any case result (V, M, R, dy)
+    A : np.array (n_combo x n_case) from factor_matrix()
+    return np.array (n_combo x ...)
+    """
+    values = np.asarray(values, dtype=float)
+    return np.tensordot(A, values, axes=(1, 0))
+
+
+# Max/min envelope at every station
+def envelope(E, I, spans, support_type, cases, table=ACI318_99, R0=None):
+    """
+    E : GPa, I : m4, spans : m
+    support_type : list of support type
+    cases : dict {load case name : loads}, one analysis per case
+    table : combination factor table
+    return dict
+        X : stations, m
+        combo : list of combination names
+        V, M : np.array (n_combo x n_station), N, N-m
+        R : np.array (n_combo x ndof) of nodal reactions
+        Vmax, Vmin, Mmax, Mmin : np.array (n_station) envelopes
+        iVmax, iVmin, iMmax, iMmin : index of the governing combination
+    """
+    model = LoadCases(E, I, spans, support_type, R0)
+    results = model.analyse(cases)
+    names = list(cases)
+
+    X, V_case, M_case = case_diagrams(model, cases, results)
+    R_case = np.array([results[name]["R"][:, 0] for name in names])
+
+    combo, A = factor_matrix(table, names)
+    V = combine(V_case, A)
+    M = combine(M_case, A)
+
+    return {
+        "X": X,
+        "combo": combo,
+        "V": V,
+        "M": M,
+        "R": combine(R_case, A),
+        "Vmax": V.max(axis=0),
+        "Vmin": V.min(axis=0),
+        "Mmax": M.max(axis=0),
+        "Mmin": M.min(axis=0),
+        "iVmax": V.argmax(axis=0),
+        "iVmin": V.argmin(axis=0),
+        "iMmax": M.argmax(axis=0),
+        "iMmin": M.argmin(axis=0),
+    }
@@ -0,0 +1,169 @@
+## Cracked-section deflection (ACI 318 effective moment of inertia)
+## The spans are subdivided (mesh.Mesh) and each element gets Branson's
+##   Ie = (Mcr/Ma)^3 Ig + (1 - (Mcr/Ma)^3) Icr <= Ig
+## with Ma = largest moment of the element. Ie depends on the moments, which
+## depend on Ie, so the analysis is repeated; between iterations only the
+## elements whose Ie changed are rebuilt (ElementTable.update) and the FEF,
+## DOF map and scatter indices are kept.
+## Long-term : Δ = Δi (1 + sustained λ), λ = ξ / (1 + 50 ρ'), limit L / 240.
+
+import numpy as np
+
+from deflection import exact_deflection
+from diagram import span_diagrams, extrema
+from dofs import DofMap
+from element_table import ElementTable
+from load_table import LoadTable
+from mesh import Mesh
+
+Es = 2e5  # MPa
+
+
+# Ig, Icr, Mcr of rectangular sections, vectorized
+def section_inertia(b, h, d, d1, As, As1, fc, Ec):
+    """
+    b, h, d, d1 : cm (d1 = depth of the compression steel, as Beam.eff_depth())
+    As, As1 : tension and compression steel, cm2
+    fc : MPa, Ec : MPa
+    return Ig, Icr : m4, Mcr : N-m
+    """
+    n = Es / Ec
+    Ig = b * h**3 / 12  # cm4
+
+    # Neutral axis of the cracked transformed section :
+    # b c^2 / 2 + (n - 1) As1 (c - d1) = n As (d - c)
+    A = b / 2
+    B = (n - 1) * As1 + n * As
+    C = -(n - 1) * As1 * d1 - n * As * d
+    c = (-B + np.sqrt(B**2 - 4 * A * C)) / (2 * A)
+    Icr = b * c**3 / 3 + n * As * (d - c) ** 2 + (n - 1) * As1 * (c - d1) ** 2
+
+    fr = 0.62 * np.sqrt(fc)  # MPa, modulus of rupture
+    Mcr = fr * Ig / (h / 2)  # MPa cm3 = N-m
+    return Ig * 1e-8, Icr * 1e-8, Mcr
+
+
+# Branson's effective inertia
+def effective_inertia(Ma, Ig, Icr, Mcr):
+    with np.errstate(divide="ignore"):
+        r = np.where(Ma > 0, (Mcr / np.abs(Ma)) ** 3, np.inf)
+    r = np.minimum(r, 1.0)
+    return np.minimum(r * Ig + (1 - r) * Icr, Ig)
+
+
+def cracked_deflection(
+    spans,
+    support_type,
+    loads,
+    b,
+    h,
+    d,
+    As,
+    As_top,
+    fc,
+    d1=None,
+    E=None,
+    R0=None,
+    n_sub=10,
+    tol=1e-3,
+    max_iter=20,
+    xi=2.0,
+    sustained=1.0,
+    limit=240,
+):
+    """
+    spans : list of span length, m
+    support_type : list of support type, fixd=0, vert-scroll=1, pin=2, free=3
+    loads : list of loads in each stretch or LoadTable (service loads), N, N-m
+    b, h, d, d1 : cm, scalar or one value per span (d1 default h - d)
+    As, As_top : bottom and top steel, cm2, scalar or one value per span
+    fc : MPa ; E : Ec in GPa, default 4700 sqrt(fc)
+    n_sub : elements per span
+    tol : convergence of Ie, max relative change between two iterations
+    xi : time-dependent factor (2.0 for 5 years or more)
+    sustained : sustained part of the loads for the long-term deflection
+    limit : allowable deflection L / limit
+    return dict
+        X, deflection : stations along the beam (m) and immediate deflection (m, Up+)
+        Ie, Ig, Icr : np.array (n_elements), m4 ; Ma : np.array (n_elements), N-m
+        iterations, converged, history : number of iterations, flag, elements changed per iteration
+        immediate, long_term, allowable : np.array per span, m (largest absolute value)
+        ratio, ok : long_term / allowable and check per span
+    """
+    spans = np.asarray(spans, dtype=float)
+    n = len(spans)
+    mesh = Mesh(spans, support_type, n_sub)
+    table = loads if isinstance(loads, LoadTable) else LoadTable.from_loads(loads)
+    table = mesh.loads(table)
+
+    # Section of every element, both signs of moment
+    def per_element(v):
+        return np.broadcast_to(np.asarray(v, dtype=float), (n,))[mesh.span_of]
+
+    b, h, d, As, As_top = (per_element(v) for v in (b, h, d, As, As_top))
+    d1 = h - d if d1 is None else per_element(d1)
+    Ec = 4700 * np.sqrt(fc) if E is None else E * 1e3  # MPa
+    Ig, Icr_pos, Mcr = section_inertia(b, h, d, d1, As, As_top, fc, Ec)
+    _, Icr_neg, _ = section_inertia(b, h, d, d1, As_top, As, fc, Ec)
+
+    # Assembly structure and loads are the same for all iterations
+    E = Ec * 1e-3  # GPa, as stiffness_matrix
+    elements = ElementTable(E, Ig, mesh.L)
+    dofs = DofMap(mesh.support_type)
+    QF = table.fixed_end_forces(mesh.L)
+    Qf = elements.scatter(QF).reshape(-1, 1)
+    Ro = mesh.nodal_force(R0)
+    Ro = None if Ro is None else Ro.reshape(-1, 1)
+
+    history = []
+    converged = False
+    for iteration in range(1, max_iter + 1):
+        Kb = elements.banded()
+        dy = dofs.displacement(Kb, Qf, Ro, banded=True)
+        u, F = elements.end_forces(dy, QF)
+
+        # Largest sagging / hogging moment of every element
+        shear, moment = span_diagrams(mesh.L, table, F)
+        Mmax, _, Mmin, _ = (np.array(v) for v in extrema(moment))
+        hogging = -Mmin > Mmax
+        Ma = np.where(hogging, -Mmin, Mmax)
+        Icr = np.where(hogging, Icr_neg, Icr_pos)
+        Ie = effective_inertia(Ma, Ig, Icr, Mcr)
+
+        changed = np.flatnonzero(np.abs(Ie - elements.I) > tol * Ig)
+        history.append(len(changed))
+        if len(changed) == 0:
+            converged = True
+            break
+        if iteration == max_iter:
+            break  # keep Ie consistent with the last solution
+        elements.update(changed, I=Ie[changed])
+
+    # Immediate deflection with the converged Ie
+    Xt = [np.linspace(0, L, 20) for L in mesh.L]
+    Y = exact_deflection(mesh.L, table, F, dy, elements.E * elements.I, Xt)
+    X = np.concatenate([x + x0 for x, x0 in zip(Xt, np.cumsum(mesh.L) - mesh.L)])
+
+    # Serviceability checks of all spans at once
+    Ymax = mesh.per_span([np.abs(y).max() for y in Y]).max(axis=(1, 2))
+    rho1 = mesh.per_span(As_top / (b * d))[:, n_sub // 2, 0]  # ρ' at midspan
+    lam = xi / (1 + 50 * rho1)
+    long_term = Ymax * (1 + sustained * lam)
+    allowable = spans / limit
+
+    return {
+        "X": X,
+        "deflection": np.concatenate(Y),
+        "Ie": elements.I.copy(),
+        "Ig": Ig,
+        "Icr": Icr,
+        "Ma": Ma,
+        "iterations": iteration,
+        "converged": converged,
+        "history": history,
+        "immediate": Ymax,
+        "long_term": long_term,
+        "allowable": allowable,
+        "ratio": long_term / allowable,
+        "ok": long_term <= allowable,
+    }
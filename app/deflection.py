@@ -1,83 +1,73 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from utils import xi_coordinate
+from load_table import LoadTable
 
+## Exact deflection
+## On each span EI y'' = M (y Up+, M sagging +) with M from the load events and
+## the end forces, so y = chord + simply supported deflection under M :
+##   y(x) = d1 + (d2 - d1) x / L + (Y(x) - Y(L) x / L) / EI,  Y'' = M, Y(0) = 0
+## Y is the sum of the load events integrated twice : an event p(x) = c0 + c1 x + c2 x^2
+## acting for x >= b gives P2(x) - P2(b) - P1(b) (x - b), P1' = p, P2' = P1.
 
-def cubic_interpolation_deflection(L, d1, θ1, d2, θ2, M1, M2, E, I, num_points=100):
-    """
-    Interpolates the deflection curve for a span using cubic shape functions,
-    accounting for fixed-end moments.
-
-    Parameters:
-    - L: Length of the span
-    - d1: Displacement at the start of the span
-    - θ1: Rotation at the start of the span
-    - d2: Displacement at the end of the span
-    - θ2: Rotation at the end of the span
-    - M1: Fixed-end moment at the start of the span
-    - M2: Fixed-end moment at the end of the span
-    - E: Modulus of elasticity
-    - I: Moment of inertia of the cross section
-    - num_points: Number of points to use in the interpolation
-
-    Returns:
-    - x: Array of x-coordinates along the span
-    - y: Array of deflections corresponding to the x-coordinates
-    """
-    x = np.linspace(0, L, num_points)
 
-    # Adjust for initial and final curvature due to fixed-end moments
-    if θ1 == 0:
-        θ1 = -M1 * L / (2 * E * I * 1e9)  # Adjust rotation based on fixed-end moment
-    if θ2 == 0:
-        θ2 = -M2 * L / (2 * E * I * 1e9)  # Adjust rotation based on fixed-end moment
+# Moment events --> events of Y (5 coefficients)
+def integrate_events(events):
+    span, b, strict, dc = events
+    c0, c1, c2 = dc.T
+    P1 = c0 * b + c1 * b**2 / 2 + c2 * b**3 / 3
+    P2 = c0 * b**2 / 2 + c1 * b**3 / 6 + c2 * b**4 / 12
+    dY = np.column_stack([P1 * b - P2, -P1, c0 / 2, c1 / 6, c2 / 12])
+    return span, b, strict, dY
 
-    # Cubic shape functions for deflection
-    N1 = 1 - 3 * (x / L) ** 2 + 2 * (x / L) ** 3
-    N2 = L * (x / L - 2 * (x / L) ** 2 + (x / L) ** 3)
-    N3 = 3 * (x / L) ** 2 - 2 * (x / L) ** 3
-    N4 = L * (-((x / L) ** 2) + (x / L) ** 3)
 
-    y = N1 * d1 + N2 * θ1 + N3 * d2 + N4 * θ2
-    return x, y
-
-
-def deflection(spans, di, Qf, E, I):
+def exact_deflection(spans, table, F, dy, EI, Xt, scale=1e9):
     """
-    -stretch: lengths of spans in meters
-    -di: Node displacements, e.g., [d1, θ1, d2, θ2, d3, θ3,  ...]
-    Example: θ1 = 0.01 rad, d1 = 0 mm, θ2 = -0.02 rad, d2 = -5 mm, θ3 = 0.015 rad, d3 = 3 mm
-    -
+    spans : list of span length, m
+    table : LoadTable
+    F : np.array (num_of_spans x 4) of end forces, N, N-m
+    dy : np.array of nodal displacement [d1, θ1, d2, θ2, ...] of the stiffness model
+    EI : E * I of each span in the units of the stiffness model (E in GPa)
+    Xt : list of np.array of stations of each span
+    scale : model units --> m (1e9 when E is given in GPa)
+    return list of np.array, deflection at the stations of each span, m (Up+)
     """
-
-    # Get x-coordinates for each span
-    numS, Xt = xi_coordinate(spans)
-
-    # Initialize lists for the full beam's x-coordinates and deflections
-    X_full = []
-    deflection_full = []
-
-    # Interpolate and calculate deflections for each span
-    for i in range(len(spans)):
-        # Current span's nodal displacements and rotations
-        d1, θ1 = (di[2 * i], di[2 * i + 1])
-        d2, θ2 = di[2 * i + 2], di[2 * i + 3]
-
-        # Fixed-end moments for the current span
-        M1 = Qf[2 * i + 1]
-        M2 = Qf[2 * i + 3]
-
-        # Interpolate deflection along this span
-        x, y = cubic_interpolation_deflection(
-            spans[i], d1, θ1, d2, θ2, M1, M2, E, I, numS
+    spans = np.asarray(spans, dtype=float)
+    n = len(spans)
+    F = np.asarray(F, dtype=float).reshape(n, 4)
+    EI = np.broadcast_to(np.asarray(EI, dtype=float), (n,))
+    d = np.asarray(dy, dtype=float).ravel()
+
+    # Loads + end moments : M = M0 - M1 + (M1 + M2) x / L
+    span, x, strict, dc = table.moment_events(spans)
+    end = np.column_stack([-F[:, 1], (F[:, 3] + F[:, 1]) / spans, np.zeros(n)])
+    events = integrate_events(
+        (
+            np.concatenate([span, np.arange(n)]),
+            np.concatenate([x, np.zeros(n)]),
+            np.concatenate([strict, np.zeros(n, bool)]),
+            np.vstack([dc, end]),
         )
+    )
 
-        # Adjust x-coordinates to be relative to the entire beam
-        if i > 0:
-            x = x + sum(spans[:i])
+    Y = LoadTable.evaluate(events, spans, Xt)
+    YL = np.concatenate(LoadTable.evaluate(events, spans, [[L] for L in spans]))
 
-        # Append to full lists
-        X_full.extend(x)
-        deflection_full.extend(y)
+    d1 = d[0:-2:2]
+    d2 = d[2::2]
+    return [
+        (d1[i] + (d2[i] - d1[i]) * Xt[i] / spans[i]) / scale
+        + (Y[i] - YL[i] * Xt[i] / spans[i]) / (EI[i] * scale)
+        for i in range(n)
+    ]
 
-    return deflection_full
+
+# Largest deflection (absolute value) of each span
+def max_deflection(Y, Xt):
+    """
+    Y : list of np.array from exact_deflection()
+    return ymax, xmax : np.array per span, signed value and location
+    """
+    k = [np.argmax(np.abs(y)) for y in Y]
+    return (
+        np.array([y[j] for y, j in zip(Y, k)]),
+        np.array([x[j] for x, j in zip(Xt, k)]),
+    )
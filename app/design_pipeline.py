@@ -0,0 +1,245 @@
+## From the analysis to the design table, no hand-off
+## The shear / moment arrays of stiffness_matrix.analyze() (or the envelopes of
+## pattern_load.pattern_envelope()) are scanned span by span for the critical
+## stations :
+##   face      : faces of the supports (support_width)
+##   shear_d   : d from the faces (ACI critical section for shear)
+##   M+, M-    : largest sagging / hogging moment of the span
+##   curtail   : where |M| falls to the capacity of the continuing bars,
+##               extended by max(d, 12 ø) (ACI 9.7.3.3)
+## Every station is designed at once : flexure.flexure() for both faces at the
+## depth d = h - y of every bar layout, rebar_optimizer.select_rebar() for the
+## bars (tension steel of the face and compression steel of the other face),
+## shear_torsion.shear_torsion() for the stirrups and the torsion reinforcement.
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+
+from flexure import flexure, 𝜙b
+from rebar import Rebar
+from rebar_optimizer import rebar_layouts, select_rebar
+from shear_torsion import shear_torsion
+
+rebar = Rebar()
+
+
+# Shear / moment envelope of an analysis result, an envelope dict or arrays
+def envelope_of(source):
+    """
+    source : stiffness_matrix.AnalysisResult, dict of pattern_envelope()
+             or dict X, V, M
+    return dict X, Vmax, Vmin, Mmax, Mmin (N, N-m, M sagging +)
+    """
+    if not isinstance(source, dict):
+        source = {"X": source.X, "V": source.V, "M": source.M}
+    if "V" in source:
+        V, M = (np.ravel(source[k]) for k in ("V", "M"))
+        return {"X": np.ravel(source["X"]), "Vmax": V, "Vmin": V, "Mmax": M, "Mmin": M}
+    return {k: np.ravel(source[k]) for k in ("X", "Vmax", "Vmin", "Mmax", "Mmin")}
+
+
+# Span of every station, the station at an interior support is given twice
+def station_span(X, spans):
+    ends = np.cumsum(spans)
+    span = np.searchsorted(ends, X, side="left")
+    second = np.r_[False, X[1:] == X[:-1]] & np.isin(X, ends[:-1])
+    return np.minimum(span + second, len(spans) - 1)
+
+
+# Points where y crosses level (linear interpolation)
+def crossings(x, y, level):
+    f = y - level
+    i = np.flatnonzero(np.sign(f[:-1]) * np.sign(f[1:]) < 0)
+    t = f[i] / (f[i] - f[i + 1])
+    xc = x[i] + t * (x[i + 1] - x[i])
+    return xc, np.sign(f[i + 1] - f[i])  # +1 : |M| rising above level
+
+
+# Design moment of N bars, kN-m
+def bar_capacity(N, dia, b, d, fc, fy):
+    As = N * rebar.A[str(dia)]  # cm2
+    a = As * fy / (0.85 * fc * b)  # cm
+    return 𝜙b * As * fy * (d - a / 2) * 1e-3
+
+
+def critical_stations(
+    spans,
+    support_type,
+    envelope,
+    d,
+    support_width=0.0,
+    M_continue=(0.0, 0.0),
+    extension=0.0,
+):
+    """
+    spans : m ; support_type : list of support type (free = 3 has no face)
+    envelope : dict from envelope_of()
+    d : effective depth, m ; support_width : m
+    M_continue : capacity of the continuing bottom / top bars, N-m
+    extension : extension of the bars past the theoretical cut-off, m
+    return pd.DataFrame span, kind, x (in the span), X (along the beam), m
+    """
+    spans = np.asarray(spans, dtype=float)
+    X = envelope["X"]
+    span = station_span(X, spans)
+    start = np.cumsum(spans) - spans
+    rows = []
+
+    for j, L in enumerate(spans):
+        on = span == j
+        x = X[on] - start[j]
+        Mmax, Mmin = envelope["Mmax"][on], envelope["Mmin"][on]
+
+        # Faces and shear at d, supported ends only
+        for end, node in ((0, j), (1, j + 1)):
+            if support_type[node] == 3:
+                continue
+            for kind, dx in (
+                ("face", support_width / 2),
+                ("shear_d", support_width / 2 + d),
+            ):
+                rows.append((j, kind, dx if end == 0 else L - dx))
+
+        # Moment peaks
+        if Mmax.max() > 0:
+            rows.append((j, "M+", x[Mmax.argmax()]))
+        if Mmin.min() < 0:
+            rows.append((j, "M-", x[Mmin.argmin()]))
+
+        # Cut-off points of the bottom / top bars
+        for M, Mc in ((Mmax, M_continue[0]), (-Mmin, M_continue[1])):
+            if Mc <= 0 or M.max() <= Mc:
+                continue
+            xc, rising = crossings(x, M, Mc)
+            for xi in xc - rising * extension:
+                rows.append((j, "curtail", xi))
+
+    df = pd.DataFrame(rows, columns=["span", "kind", "x"])
+    df["x"] = np.clip(df["x"], 0, spans[df["span"]])
+    df["X"] = df["x"] + start[df["span"]]
+    return df.sort_values(["span", "x"], kind="stable").reset_index(drop=True)
+
+
+def design_pipeline(
+    source,
+    spans,
+    support_type,
+    b,
+    h,
+    fc=24,
+    fy=390,
+    fv=235,
+    c=3,
+    main=16,
+    trav=9,
+    Tu=0.0,
+    support_width=0.0,
+    n_continue=2,
+    objective="steel",
+    s_min=7.5,
+    max_iter=10,
+):
+    """
+    source : AnalysisResult, pattern_envelope() dict or dict X, V, M (N, N-m)
+    spans : m ; support_type : list of support type
+    b, h, c : cm ; fc, fy, fv : MPa ; main, trav : mm
+    Tu : torsion, kN-m (scalar or function of X along the beam, m)
+    support_width : m ; n_continue : bars of diameter main running through the span
+    objective : bar selection, "steel" or "count" (rebar_optimizer)
+    max_iter : passes of the bar selection of both faces
+    return pd.DataFrame, one row per critical station
+        As_{face}, As1_{face} : tension / compression steel required at d_{face}, cm2
+        N_{face}, dia_{face}, layers_{face} : bars of the face (0 if none fits)
+        status : "ok", or "not converged" if the bars still change after max_iter
+    """
+    env = envelope_of(source)
+    d = h - (c + trav / 10 + main / 10 / 2)  # cm, as Beam.eff_depth()
+
+    # Critical stations
+    Mc = bar_capacity(n_continue, main, b, d, fc, fy) * 1e3  # N-m
+    ext = max(d / 100, 12 * main / 1000)  # m
+    df = critical_stations(
+        spans, support_type, env, d / 100, support_width, (Mc, Mc), ext
+    )
+
+    # Envelope at the stations, interpolated in their own span
+    span = station_span(env["X"], spans)
+    for k in ("Vmax", "Vmin", "Mmax", "Mmin"):
+        df[k] = [
+            np.interp(X, env["X"][span == j], env[k][span == j])
+            for j, X in zip(df["span"], df["X"])
+        ]
+    df["Mu+"] = np.maximum(df["Mmax"], 0) / 1000  # kN-m
+    df["Mu-"] = np.minimum(df["Mmin"], 0) / 1000  # kN-m
+    df["Vu"] = np.maximum(np.abs(df["Vmax"]), np.abs(df["Vmin"])) / 1000  # kN
+    df["Tu"] = Tu(df["X"].to_numpy()) if callable(Tu) else Tu
+    df = df.drop(columns=["Vmax", "Vmin", "Mmax", "Mmin"])
+
+    # Shear and torsion, station by station (Beam / Torsion print every step)
+    st = []
+    for Vu, T in zip(df["Vu"], df["Tu"]):
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                st.append(
+                    {
+                        **shear_torsion(b, h, c, d, fc, fy, fv, Vu, T, trav, s_min),
+                        "error": "",
+                    }
+                )
+        except ValueError as e:
+            st.append({"error": str(e)})
+    st = pd.DataFrame(st, index=df.index)
+    Al = st.get("Al", pd.Series(0.0, index=df.index)).fillna(0).to_numpy()
+
+    # Flexure of both faces at the depth of every layout, d = h - y
+    layouts = rebar_layouts(b, c, trav)
+    A_min = n_continue * rebar.A[str(main)]
+    d_layout = h - layouts["y"]
+    Mu = {"bot": df["Mu+"].to_numpy(), "top": df["Mu-"].to_numpy()}
+    f, As, As1 = {}, {}, {}
+    for face in Mu:
+        on = (Mu[face] != 0)[:, None]
+        f[face] = flexure(Mu[face][:, None], b, h, fc, fy, c, main, trav, d=d_layout)
+        # cm2 (station x layout), torsion Al shared by the 4 corners as Torsion.design()
+        As[face] = np.where(on, f[face]["As"], 0) + Al[:, None] / 4
+        As1[face] = np.where(on, f[face]["As1"], 0)
+
+    # The tension bars of a face are the compression steel of the other face
+    rows = np.arange(len(df))
+    opposite = {"bot": "top", "top": "bot"}
+    i = {face: np.full(len(df), -1) for face in Mu}
+    moved = np.ones(len(df), dtype=bool)
+    for _ in range(max_iter):
+        compression = {
+            face: np.where(i[face] >= 0, As1[face][rows, i[face]], 0) for face in Mu
+        }
+        chosen = {
+            face: select_rebar(
+                np.maximum(
+                    As[face], np.maximum(A_min, compression[opposite[face]])[:, None]
+                ),
+                layouts,
+                objective,
+            )
+            for face in Mu
+        }
+        moved = np.any([chosen[face] != i[face] for face in Mu], axis=0)
+        i = chosen
+        if not moved.any():
+            break
+
+    for face in Mu:
+        ok = i[face] >= 0
+        j = np.where(ok, i[face], 0)
+        df[f"double_{face}"] = f[face]["double"][rows, j] & ok & (Mu[face] != 0)
+        df[f"d_{face}"] = np.where(ok, d_layout[j], np.nan)
+        df[f"As_{face}"] = np.where(ok, As[face][rows, j], np.nan)
+        df[f"As1_{face}"] = np.where(ok, As1[face][rows, j], np.nan)
+        for k in ("N", "dia", "layers"):
+            df[f"{k}_{face}"] = np.where(ok, layouts[k][j], 0).astype(int)
+    df["status"] = np.where(moved, "not converged", "ok")
+
+    return pd.concat([df, st], axis=1)
@@ -0,0 +1,166 @@
+## Exact shear and bending moment diagrams
+## On each span the diagrams are piecewise polynomials (shear : degree 1,
+## moment : degree 2) with breakpoints at the load boundaries. The coefficients
+## come from the load events of LoadTable plus the end forces of
+## ElementTable.end_forces(), so design values do not depend on the
+## number of stations.
+
+import numpy as np
+
+from load_table import LoadTable
+
+
+class PiecewisePolynomial:
+    """Diagram of one span : y = c0 + c1 x + c2 x^2 on [breaks[k], breaks[k+1]].
+    breaks : np.array (n_seg + 1) of breakpoints, x from the left end of the span
+    coeffs : np.array (n_seg x 3) of [c0, c1, c2] of each segment
+    """
+
+    def __init__(self, breaks, coeffs):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coeffs = np.asarray(coeffs, dtype=float).reshape(-1, 3)
+
+    def __str__(self):
+        return f"Piecewise polynomial : {len(self.coeffs)} segments on [{self.breaks[0]}, {self.breaks[-1]}]"
+
+    # Segment of the sections
+    def segment(self, x, side="right"):
+        k = np.searchsorted(self.breaks, x, side=side) - 1
+        return np.clip(k, 0, len(self.coeffs) - 1)
+
+    def value_at(self, x, side="right"):
+        """
+        x : section(s) from the left end of the span, scalar or np.array
+        side : "right" or "left" limit at a breakpoint (jump of point load/moment)
+        """
+        x = np.asarray(x, dtype=float)
+        c = self.coeffs[self.segment(x, side)]
+        return c[..., 0] + c[..., 1] * x + c[..., 2] * x**2
+
+    def __call__(self, x, side="right"):
+        return self.value_at(x, side)
+
+    # Exact maximum and minimum of the span
+    def extrema(self):
+        """
+        Candidates : both ends of every segment (left and right limit of jumps)
+        and the vertex of the parabola (dy/dx = 0) inside the segment.
+        return ymax, xmax, ymin, xmin
+        """
+        x0 = self.breaks[:-1]
+        x1 = self.breaks[1:]
+        c0, c1, c2 = self.coeffs.T
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xv = np.where(c2 != 0, -c1 / (2 * c2), x0)
+        xv = np.clip(xv, x0, x1)
+
+        x = np.concatenate([x0, x1, xv])
+        c = np.tile(self.coeffs, (3, 1))
+        y = c[:, 0] + c[:, 1] * x + c[:, 2] * x**2
+
+        imax = np.argmax(y)
+        imin = np.argmin(y)
+        return y[imax], x[imax], y[imin], x[imin]
+
+    # Sections where the diagram is zero (inflection points of the moment)
+    def roots(self):
+        x0 = self.breaks[:-1]
+        x1 = self.breaks[1:]
+        roots = []
+        for k, (c0, c1, c2) in enumerate(self.coeffs):
+            if c2 != 0:
+                r = np.roots([c2, c1, c0])
+                r = r[np.isreal(r)].real
+            elif c1 != 0:
+                r = np.array([-c0 / c1])
+            else:
+                r = np.array([])
+            roots += [v for v in r if x0[k] < v < x1[k]]
+        return np.array(sorted(roots))
+
+    # Points for plotting, breakpoints included on both sides
+    def sample(self, num=50):
+        """
+        num : points per segment
+        return x, y
+        """
+        t = np.linspace(0, 1, num)
+        x0 = self.breaks[:-1, None]
+        x1 = self.breaks[1:, None]
+        x = x0 + (x1 - x0) * t
+        c = self.coeffs[:, None, :]
+        y = c[..., 0] + c[..., 1] * x + c[..., 2] * x**2
+        return x.ravel(), y.ravel()
+
+
+# Coefficients of every segment of every span in one pass
+def build(events, spans, end_terms):
+    """
+    events : return of LoadTable.shear_events() / moment_events()
+    end_terms : np.array (num_of_spans x 3), polynomial from the end forces
+    return list of PiecewisePolynomial, one per span
+    """
+    span, x, strict, dc = events
+    n = len(spans)
+    spans = np.asarray(spans, dtype=float)
+    W = 2 * spans.max() + 1  # key = span * W + x sorts by span, then x
+
+    # End forces act from the left end of each span
+    span = np.concatenate([span, np.arange(n)])
+    x = np.concatenate([x, np.zeros(n)])
+    dc = np.vstack([dc, end_terms])
+
+    key = span * W + x
+    order = np.argsort(key, kind="stable")
+    key = key[order]
+    cum = np.vstack([np.zeros((1, 3)), np.cumsum(dc[order], axis=0)])
+
+    # Breakpoints : span ends and load boundaries inside the span
+    inside = (x > 0) & (x < spans[span])
+    b_span = np.concatenate([np.arange(n), span[inside], np.arange(n)])
+    b_x = np.concatenate([np.zeros(n), x[inside], spans])
+    b_key, first = np.unique(b_span * W + b_x, return_index=True)
+    b_span = b_span[first]
+    b_x = b_x[first]
+
+    # Segment [b_k, b_k+1) : all events of the span with breakpoint <= b_k
+    start = np.searchsorted(key, np.arange(n) * W, side="left")
+    C = cum[np.searchsorted(key, b_key, side="right")] - cum[start[b_span]]
+
+    diagrams = []
+    bounds = np.searchsorted(b_span, np.arange(n + 1))
+    for i in range(n):
+        j0, j1 = bounds[i], bounds[i + 1]
+        diagrams.append(PiecewisePolynomial(b_x[j0:j1], C[j0 : j1 - 1]))
+    return diagrams
+
+
+def span_diagrams(spans, loads, F):
+    """
+    spans : list of span length, m
+    loads : list of loads in each stretch or LoadTable
+    F : list of local end forces (4x1), [Fi] = [ki][ui] + [QFi] of each span
+    return shear, moment : list of PiecewisePolynomial per span, N and N-m (sagging +)
+    """
+    table = loads if isinstance(loads, LoadTable) else LoadTable.from_loads(loads)
+    spans = np.asarray(spans, dtype=float)
+    F = np.array([np.asarray(f, dtype=float).ravel() for f in F])
+
+    # Shear : V = F1y + loads ; Moment : M = -M1 + (M1 + M2) x / L + loads
+    V_end = np.column_stack([F[:, 0], np.zeros(len(F)), np.zeros(len(F))])
+    M_end = np.column_stack([-F[:, 1], (F[:, 3] + F[:, 1]) / spans, np.zeros(len(F))])
+
+    shear = build(table.shear_events(spans), spans, V_end)
+    moment = build(table.moment_events(spans), spans, M_end)
+    return shear, moment
+
+
+# Extrema of all spans (AnalysisResult.maxShear, maxMoment, ...)
+def extrema(diagrams):
+    """
+    return maxV, XmaxV, minV, XminV : lists, one value per span
+    """
+    values = [d.extrema() for d in diagrams]
+    ymax, xmax, ymin, xmin = (list(v) for v in zip(*values))
+    return ymax, xmax, ymin, xmin
@@ -0,0 +1,93 @@
+## DOF numbering of a continuous beam : [d1y, θ1, d2y, θ2, ...]
+## Each support fixes some DOF of its node; a DOF is either free (unknown
+## displacement, known force R0) or constrained (zero displacement, unknown reaction).
+##   [Rf]   [Kff Kfc] [df]   [Qff]
+##   [Rc] = [Kcf Kcc] [0 ] + [Qfc]  -->  [df] = [Kff]^-1 ([R0f] - [Qff])
+##                                        [Rc] = [Kcf][df] + [Qfc]
+
+import numpy as np
+
+from banded import reduce_banded, banded_dot, ldl_factor, ldl_solve
+
+# support type : (d free, θ free), fixd=0, vert-scroll=1, pin=2, free=3
+FREE = {0: (False, False), 1: (True, False), 2: (False, True), 3: (True, True)}
+
+
+class DofMap:
+    """Free / constrained DOF of a support layout.
+    support_type : list of support type, fixd=0, vert-scroll=1, pin=2, free=3
+    """
+
+    def __init__(self, support_type):
+        self.support_type = list(support_type)
+        self.nodes = len(self.support_type)
+        self.ndof = 2 * self.nodes
+
+        for s in self.support_type:
+            if s not in FREE:
+                raise ValueError(f"support type must be 0, 1, 2 or 3, not {s}")
+
+        self.free = np.array([FREE[s] for s in self.support_type], dtype=bool).ravel()
+        self.constrained = ~self.free
+        self.J = np.flatnonzero(self.free)  # unknown displacement
+        self.C = np.flatnonzero(self.constrained)  # unknown reaction
+
+    def __str__(self):
+        return (
+            f"DOF map : {self.ndof} DOF, {len(self.J)} free, {len(self.C)} constrained"
+        )
+
+    # Labels as stiffness_matrix.report() prints them
+    def displacement_labels(self):
+        node = np.repeat(np.arange(1, self.nodes + 1), 2)
+        name = np.tile(["d", "θ"], self.nodes)
+        return [f"{n}{i}" if f else 0 for n, i, f in zip(name, node, self.free)]
+
+    def force_labels(self, R0=None):
+        node = np.repeat(np.arange(1, self.nodes + 1), 2)
+        name = np.tile(["F", "M"], self.nodes)
+        R = [f"{n}{i}" if c else 0 for n, i, c in zip(name, node, self.constrained)]
+        if R0 is not None and len(R0) != 0:
+            R = [R0[i] if R0[i] != 0 else R[i] for i in range(self.ndof)]
+        return R
+
+    # ------------------------------------------------------------------
+    ## Blocks of the stiffness matrix
+    def K_ff(self, K, banded=False):
+        return reduce_banded(K, self.J) if banded else K[np.ix_(self.J, self.J)]
+
+    def K_fc(self, K):
+        return K[np.ix_(self.J, self.C)]
+
+    # [df] = [Kff]^-1 ([R0f] - [Qff])
+    def displacement(self, K, Qf, R0=None, banded=False):
+        """
+        K : np.array of global stiffness (band storage if banded=True)
+        Qf : np.array of global FEF (ndof x 1) or (ndof x N)
+        R0 : known nodal external force, same shape as Qf, default 0
+        return dy : np.array of nodal displacement, same shape as Qf
+        """
+        Qf = np.asarray(Qf, dtype=float)
+        rhs = -Qf[self.J] if R0 is None else np.asarray(R0)[self.J] - Qf[self.J]
+
+        dy = np.zeros_like(Qf)
+        if len(self.J):
+            if banded:
+                dy[self.J] = ldl_solve(ldl_factor(self.K_ff(K, True)), rhs)
+            else:
+                dy[self.J] = np.linalg.solve(self.K_ff(K), rhs)
+        return dy
+
+    # [R] : known force on the free rows, [Kcf][df] + [Qfc] on the constrained rows
+    def reaction(self, K, dy, Qf, R0=None, banded=False):
+        """
+        return R : np.array of nodal force, same shape as Qf
+        """
+        Qf = np.asarray(Qf, dtype=float)
+        R = np.zeros_like(Qf) if R0 is None else np.array(R0, dtype=float)
+        R = R.reshape(Qf.shape)
+        if banded:
+            R[self.C] = banded_dot(K, dy, self.C) + Qf[self.C]
+        else:
+            R[self.C] = K[np.ix_(self.C, self.J)] @ dy[self.J] + Qf[self.C]
+        return R
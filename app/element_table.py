@@ -0,0 +1,140 @@
+## Element table : all Bernoulli beam elements as arrays
+## E, I, L of every span are columns; the element stiffness matrices are one
+## stacked (n x 4 x 4) tensor, assembled with precomputed scatter indices and
+## end forces of all spans are recovered with one einsum.
+
+import numpy as np
+
+from banded import BAND, to_dense
+
+
+# Stacked stiffness matrices, same as BeamB.k
+def element_stiffness(E, I, L):
+    """
+    E, I, L : np.array (n) or broadcastable, any leading shape
+    return np.array (..., 4, 4)
+    """
+    E = np.asarray(E, dtype=float)
+    I = np.asarray(I, dtype=float)
+    L = np.asarray(L, dtype=float)
+    E, I, L = np.broadcast_arrays(E, I, L)
+    one = np.ones_like(L)
+    k = np.stack(
+        [
+            np.stack([12.0 * one, 6 * L, -12 * one, 6 * L], -1),
+            np.stack([6 * L, 4 * L**2, -6 * L, 2 * L**2], -1),
+            np.stack([-12 * one, -6 * L, 12 * one, -6 * L], -1),
+            np.stack([6 * L, 2 * L**2, -6 * L, 4 * L**2], -1),
+        ],
+        -2,
+    )
+    return (E * I / L**3)[..., None, None] * k
+
+
+# Stacked consistent mass matrices, same as BeamB.mass
+def element_mass(m, L):
+    """
+    m : mass per unit length, kg/m ; L : element length, any leading shape
+    return np.array (..., 4, 4)
+    """
+    m = np.asarray(m, dtype=float)
+    L = np.asarray(L, dtype=float)
+    m, L = np.broadcast_arrays(m, L)
+    one = np.ones_like(L)
+    M = np.stack(
+        [
+            np.stack([156 * one, 22 * L, 54 * one, -13 * L], -1),
+            np.stack([22 * L, 4 * L**2, 13 * L, -3 * L**2], -1),
+            np.stack([54 * one, 13 * L, 156 * one, -22 * L], -1),
+            np.stack([-13 * L, -3 * L**2, -22 * L, 4 * L**2], -1),
+        ],
+        -2,
+    )
+    return (m * L / 420)[..., None, None] * M
+
+
+class ElementTable:
+    """Spans of a continuous beam as arrays.
+    E : Modulus of elasticity (scalar or per span)
+    I : Inertia of the cross section (scalar or per span)
+    L : Span lengths
+    m : mass per unit length, kg/m (scalar or per span), for modal analysis
+    """
+
+    def __init__(self, E, I, L, m=0):
+        self.L = np.asarray(L, dtype=float)
+        self.n = len(self.L)
+        self.E = np.broadcast_to(np.asarray(E, dtype=float), (self.n,)).copy()
+        self.I = np.broadcast_to(np.asarray(I, dtype=float), (self.n,)).copy()
+        self.m = np.broadcast_to(np.asarray(m, dtype=float), (self.n,)).copy()
+        self.nodes = self.n + 1
+        self.ndof = 2 * self.nodes
+
+        # DOF of each element : [2i, 2i+1, 2i+2, 2i+3]
+        self.dof = 2 * np.arange(self.n)[:, None] + np.arange(4)
+
+        # Scatter index of the lower band : Kb[r - c, c] += k[r, c], r >= c
+        r, c = np.tril_indices(4)
+        self.band_row = np.broadcast_to(r - c, (self.n, len(r)))
+        self.band_col = self.dof[:, c]
+        self.band_r = r
+        self.band_c = c
+
+        self.k = self.stiffness()
+
+    def __len__(self):
+        return self.n
+
+    # Stacked element stiffness, one matrix per distinct (E, I, L)
+    def stiffness(self):
+        triples = np.column_stack([self.E, self.I, self.L])
+        unique, inverse = np.unique(triples, axis=0, return_inverse=True)
+        k = element_stiffness(unique[:, 0], unique[:, 1], unique[:, 2])
+        return k[inverse.ravel()]
+
+    # Change E, I of some elements (ex. cracked section) and rebuild only them
+    def update(self, index, E=None, I=None):
+        index = np.atleast_1d(index)
+        if E is not None:
+            self.E[index] = E
+        if I is not None:
+            self.I[index] = I
+        self.k[index] = element_stiffness(self.E[index], self.I[index], self.L[index])
+
+    # ------------------------------------------------------------------
+    ## Assembly
+    def banded(self, k=None):
+        """
+        k : optional stacked element matrices, default self.k
+        return Kb : global stiffness in lower band storage (BAND+1 x ndof)
+        """
+        k = self.k if k is None else k
+        Kb = np.zeros((BAND + 1, self.ndof))
+        np.add.at(Kb, (self.band_row, self.band_col), k[:, self.band_r, self.band_c])
+        return Kb
+
+    # Consistent mass in the same band storage
+    def banded_mass(self):
+        return self.banded(element_mass(self.m, self.L))
+
+    def dense(self):
+        return to_dense(self.banded())
+
+    # Scatter of local vectors (n x 4) into the global vector (ndof)
+    def scatter(self, QF):
+        Qf = np.zeros(self.ndof)
+        np.add.at(Qf, self.dof, np.asarray(QF, dtype=float).reshape(self.n, 4))
+        return Qf
+
+    # ------------------------------------------------------------------
+    ## Force recovery
+    def end_forces(self, dy, QF):
+        """
+        dy : np.array of nodal displacement (ndof) or (ndof x 1)
+        QF : np.array (n x 4) of local FEF
+        return u, F : np.array (n x 4) of local displacement and end force
+        [Fi] = [ki][ui] + [QFi] for all spans at once
+        """
+        u = np.asarray(dy, dtype=float).ravel()[self.dof]
+        F = np.einsum("nij,nj->ni", self.k, u) + np.asarray(QF).reshape(self.n, 4)
+        return u, F
@@ -0,0 +1,104 @@
+## Vectorized flexural design, same formulas as beam_class.Beam
+## Beam works on one Mu at a time, prints every step and keeps the result on self
+## (section_classification, data). Here every argument may be an np.array, they
+## are broadcast together and all steps are done in one pass without state :
+##   β1 --> d, d' --> pmin, pb, pmax --> 𝜙Mn1 (p = 0.5 pb) --> classification
+##   --> singly (As_major) / double (As_major, As_minor, fs') reinforcement
+## Units as Beam : b, h, d, c : cm ; main, trav : mm ; fc, fy : MPa ; Mu : kN-m ; As : cm2
+
+import numpy as np
+
+Es = 2e5  # MPa
+𝜙b = 0.9
+
+
+# β1 of ACI, vectorized Beam.beta()
+def beta1(fc):
+    fc = np.asarray(fc, dtype=float)
+    return np.where(
+        fc <= 30, 0.85, np.where(fc < 55, 0.85 - 0.05 * (fc - 30) / 7, 0.65)
+    )
+
+
+def flexure(Mu, b, h=None, fc=24, fy=390, c=3, main=16, trav=9, d=None, d1=None):
+    """
+    Mu : kN-m (sign ignored, |Mu| is designed as Beam.double_reinf())
+    b, h : cm ; d, d1 : cm, default from c, main, trav as Beam.eff_depth()
+    return dict of np.array (broadcast shape of the arguments)
+        β1, d, d1, pmin, pb, pmax
+        𝜙Mn1 : capacity of the section with p = 0.5 pb, kN-m (Beam.capacity())
+        double : mask of double reinforcement (|Mu| > 𝜙Mn1), singly = ~double
+        Ru : MPa, p_req : required ratio of the singly reinforced sections
+        As : tension steel (As_major), As1 : compression steel (As_minor), cm2
+        fs1 : stress of the compression steel, MPa ; yield : mask fs' = fy
+        𝜙Mn : capacity with As (and As1), kN-m
+    """
+    Mu = np.abs(np.asarray(Mu, dtype=float))
+    b, fc, fy = (np.asarray(v, dtype=float) for v in (b, fc, fy))
+    if d1 is None:
+        d1 = c + np.asarray(trav) / 10 + np.asarray(main) / 10 / 2
+    if d is None:
+        d = np.asarray(h, dtype=float) - d1
+    d, d1 = np.broadcast_arrays(np.asarray(d, dtype=float), d1)
+    Mu, b, fc, fy, d, d1 = np.broadcast_arrays(Mu, b, fc, fy, d, d1)
+
+    # Percent reinforcement
+    β1 = beta1(fc)
+    pmin = np.maximum(np.sqrt(fc) / (4 * fy), 1.4 / fy)
+    pb = (0.85 * fc / fy) * β1 * (600 / (600 + fy))
+    pmax = 0.75 * pb
+
+    # Section capacity
+    As0 = 0.5 * pb * b * d  # cm2
+    a = As0 * fy / (0.85 * fc * b)  # cm
+    𝜙Mn1 = 𝜙b * As0 * fy * (d - a / 2) * 1e-3  # kN-m
+
+    # Classification
+    double = Mu - 𝜙Mn1 > 0
+    singly = ~double
+
+    # Singly reinforcement
+    Ru = Mu * 1000 / (b * d**2)  # MPa
+    with np.errstate(invalid="ignore"):
+        p_req = 0.85 * (fc / fy) * (1 - np.sqrt(1 - 2 * (Ru / 𝜙b) / (0.85 * fc)))
+    p_req = np.where(singly, p_req, np.nan)
+    As_singly = np.maximum(p_req, pmin) * b * d
+
+    # Double reinforcement
+    As1 = pmax * b * d  # cm2
+    As2 = (np.maximum(Mu - 𝜙Mn1, 0) * 1000 / 𝜙b) / (fy * (d - d1))  # cm2
+    p1 = (As1 + As2) / b * d  # as Beam.double_reinf()
+    p2 = As2 / b * d
+    yielded = p1 - p2 > 0.85 * fc * d1 * β1 * (600 / (600 - fy)) / (fy * d)
+    fs_ny = 600 * (1 - (d1 / d) * (600 + fy) / 600)
+    a_b = β1 * d * (600 / (600 + fy))  # Eq 2.28d
+    with np.errstate(divide="ignore", invalid="ignore"):
+        As_minor = np.where(yielded, As2, (As1 * fy - 0.85 * fc * a_b * b) / fs_ny)
+
+    As = np.where(double, As1 + As2, As_singly)
+    As_minor = np.where(double, As_minor, 0.0)
+    fs1 = np.where(double & ~yielded, fs_ny, fy)
+
+    # Capacity with the required steel
+    a = np.where(double, As1, As) * fy / (0.85 * fc * b)
+    𝜙Mn = 𝜙b * np.where(double, As1, As) * fy * (d - a / 2) * 1e-3
+    𝜙Mn = 𝜙Mn + np.where(double, 𝜙b * As2 * fy * (d - d1) * 1e-3, 0)
+
+    return {
+        "β1": β1,
+        "d": d,
+        "d1": d1,
+        "pmin": pmin,
+        "pb": pb,
+        "pmax": pmax,
+        "𝜙Mn1": 𝜙Mn1,
+        "double": double,
+        "singly": singly,
+        "Ru": Ru,
+        "p_req": p_req,
+        "As": As,
+        "As1": As_minor,
+        "fs1": fs1,
+        "yield": ~(double & ~yielded),
+        "𝜙Mn": 𝜙Mn,
+    }
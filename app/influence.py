@@ -0,0 +1,108 @@
+## Influence lines of shear, moment and support reactions
+## A unit PointLoad (1 N, down+) moves over every station of the beam.
+## Each load position is one column of the FEF block [Qf] (ndof x n_position),
+## so the whole influence surface needs one factorization of [Ki]
+## (LoadCases) and one batched forward/backward substitution.
+
+import numpy as np
+
+from load_cases import LoadCases
+from utils import xi_coordinate, X_coordinate
+
+
+# Equivalent nodal reactions of a unit point load at positions a (vector of PointLoad.Qf)
+def unit_point_FEF(a, L):
+    """
+    a : np.array of load positions with respect to the left end of the span
+    L : span length
+    return np.array (4 x len(a)) : [RL, ML, RR, MR] for P = 1
+    """
+    a = np.asarray(a, dtype=float)
+    b = L - a
+    return (
+        1
+        / L**2
+        * np.array(
+            [
+                b**2 / L * (3 * a + b),  # RL
+                a * b**2,  # ML
+                a**2 / L * (a + 3 * b),  # RR
+                -(a**2) * b,  # MR
+            ]
+        )
+    )
+
+
+def influence_lines(E, I, spans, support_type, numS=200, stations=None):
+    """
+    E : GPa, I : m4, spans : list of span length, m
+    support_type : list of support type, fixd=0, vert-scroll=1, pin=2, free=3
+    numS : number of load positions per span (utils.xi_coordinate)
+    stations : np.array of response stations along the beam, m
+               (None --> the load positions ; at an interior support the right span)
+    return dict
+        X : np.array of load positions along the beam, m
+        Xr : np.array of response stations along the beam, m
+        V : np.array (n_station x n_position), shear at Xr[r] due to unit load at X[p], N/N
+        M : np.array (n_station x n_position), moment (sagging +) at Xr[r], N-m/N
+        R : np.array (n_reaction x n_position), reaction of constrained DOF, N/N or N-m/N
+        dof : index of the constrained DOF of R in [F1y, M1, F2y, M2, ...]
+    """
+    model = LoadCases(E, I, spans, support_type)
+    numS, Xt = xi_coordinate(spans, numS)
+    X = np.array(X_coordinate(spans, model.stretch, Xt))
+    n = model.num_of_spans
+    nP = len(X)
+
+    # Span index and local position of each unit load
+    span_of = np.repeat(np.arange(n), numS)
+    a = np.concatenate(Xt)
+
+    # Span index and local position of each response station
+    if stations is None:
+        Xr, station_span, xr = X, span_of, a
+    else:
+        Xr = np.asarray(stations, dtype=float).ravel()
+        start = np.concatenate([[0], np.cumsum(spans)[:-1]])
+        station_span = np.clip(np.searchsorted(start, Xr, side="right") - 1, 0, n - 1)
+        xr = Xr - start[station_span]
+
+    # Local FEF of the loaded span, scattered into the global FEF block
+    QF = np.zeros((4, nP))
+    for i in range(n):
+        cols = span_of == i
+        QF[:, cols] = unit_point_FEF(a[cols], spans[i])
+
+    Qf = np.zeros((model.ndof, nP))
+    rows = 2 * span_of[None, :] + np.arange(4)[:, None]
+    np.add.at(Qf, (rows, np.broadcast_to(np.arange(nP), rows.shape)), QF)
+
+    # All load positions in one block solve
+    dy, R = model.solve(Qf, np.zeros((model.ndof, 1)))
+
+    V = np.zeros((len(Xr), nP))
+    M = np.zeros((len(Xr), nP))
+    for s in range(n):
+        L = spans[s]
+        rows = station_span == s
+        x = xr[rows][:, None]  # response stations of span s
+        loaded = span_of == s  # loads acting on span s
+
+        # [Fs] = [ks][us] + [QFs] for every load position
+        F = model.stretch[s].k @ dy[2 * s : 2 * s + 4, :]
+        F[:, loaded] += QF[:, loaded]
+
+        # Shear : left end force + unit load on the left of the section
+        Vs = np.broadcast_to(F[0], (len(x), nP)).copy()
+        Vs[:, loaded] -= a[loaded] < x
+
+        # Moment : continuity + simply supported span under the unit load
+        Ms = -F[1] + (F[3] + F[1]) / L * x
+        al = a[loaded]
+        Ms[:, loaded] += np.where(x < al, (1 - al / L) * x, al * (1 - x / L))
+
+        V[rows] = Vs
+        M[rows] = Ms
+
+    dof = np.setdiff1d(np.arange(model.ndof), model.J)
+    return {"X": X, "Xr": Xr, "V": V, "M": M, "R": R[dof], "dof": dof}
@@ -0,0 +1,130 @@
+## Multi load-case analysis
+## Dead, live, wind, ... on the same beam only change [Qf] and [R0],
+## so the reduced stiffness [Ki] is factorized once and all cases are solved
+## together as one block right-hand side (ndof x N).
+
+import numpy as np
+
+from banded import reduce_banded, banded_dot, ldl_factor, ldl_solve
+from element_table import ElementTable
+from stiffness_matrix import BeamB, free_dofs, local_FEF
+from load_table import LoadTable
+
+
+class LoadCases:
+    """Stiffness model of one beam shared by many load cases.
+    E : Modulus of elasticity, GPa, scalar or one value per span
+    I : Inertia of the cross section, m4, scalar or one value per span
+    spans : list of length of each span in meters
+    support_type : list of support type, fixd=0, vert-scroll=1, pin=2, free=3
+    R0 : list of nodal external loads ['F1y', 'M1', 'F2y', 'M2', ...], N, N-m
+    """
+
+    def __init__(self, E, I, spans, support_type, R0=None):
+        self.E = E
+        self.I = I
+        self.spans = list(spans)
+        self.support_type = list(support_type)
+
+        # BeamB(Elasticity, Inertia, Length) for each stretch, E and I per span
+        self.elements = ElementTable(E, I, self.spans)
+        e = self.elements
+        self.stretch = [BeamB(Ei, Ii, L) for Ei, Ii, L in zip(e.E, e.I, e.L)]
+        self.num_of_spans = len(self.stretch)
+        self.nodes = self.num_of_spans + 1
+        self.ndof = 2 * self.nodes
+
+        # Known nodal external force
+        self.R0 = np.zeros((self.ndof, 1))
+        if R0 is not None and len(R0) != 0:
+            self.R0[:, 0] = R0
+
+        # Global stiffness in band storage, index of unknown displacement
+        self.K = self.elements.banded()
+        self.J = free_dofs(self.support_type)
+
+        # [Ki] = [L][D][L]^T : only once for every load case
+        self.factor = ldl_factor(reduce_banded(self.K, self.J)) if len(self.J) else None
+
+    # Local and global FEF of one load set
+    def fixed_end_forces(self, loads):
+        """
+        loads : list of loads in each stretch or LoadTable
+        return QF : list of local FEF (4x1), Qf : np.array global FEF (ndof x 1)
+        """
+        if isinstance(loads, LoadTable):
+            QF = loads.local_FEF(self.spans)  # vectorized, scattered by span
+        else:
+            QF = local_FEF(self.num_of_spans, loads, self.stretch)
+        Qf = np.zeros((self.ndof, 1))
+        for i in range(self.num_of_spans):
+            Qf[2 * i : 2 * i + 4, :] += QF[i]
+        return QF, Qf
+
+    # Solve a block of load cases
+    def solve(self, Qf, R0=None):
+        """
+        Qf : np.array global FEF, one column per load case (ndof x N)
+        R0 : known nodal external force (ndof x 1) or (ndof x N), default self.R0
+        return dy, R : nodal displacement and nodal force (ndof x N)
+        [Ri] = [Ki][di] + [Qfi] --> [di] = [Ki]^-1 ([Ri] - [Qfi])
+        """
+        Qf = np.asarray(Qf, dtype=float).reshape(self.ndof, -1)
+        R0 = (
+            self.R0
+            if R0 is None
+            else np.asarray(R0, dtype=float).reshape(self.ndof, -1)
+        )
+
+        dy = np.zeros_like(Qf)
+        if self.factor is not None:
+            rhs = R0[self.J] - Qf[self.J]
+            dy[self.J] = ldl_solve(self.factor, rhs)
+
+        # [R] = [K][d] + [Qf]
+        R = banded_dot(self.K, dy) + Qf
+        return dy, R
+
+    # Analyse all named load cases
+    def analyse(self, cases):
+        """
+        cases : dict {name : loads}, loads = list of loads in each stretch or LoadTable
+                ex. {"D": [[q1], [q2]], "L": [[P1], []]}
+        return dict {name : {"dy", "R", "u", "F", "QF"}}
+            dy, R : np.array (ndof x 1) as stiffness_matrix.analyze()
+            u, F : list of local displacement and force, [Fi] = [ki][ui] + [QFi]
+        """
+        names = list(cases)
+        QFs = []
+        Qf = np.zeros((self.ndof, len(names)))
+        for c, name in enumerate(names):
+            QF, Qf_c = self.fixed_end_forces(cases[name])
+            QFs.append(QF)
+            Qf[:, c] = Qf_c[:, 0]
+
+        dy, R = self.solve(Qf)
+
+        # [Fi] = [ki][ui] + [QFi] : one einsum for all spans and all cases
+        kU = np.einsum("nij,njc->nic", self.elements.k, dy[self.elements.dof])
+
+        results = {}
+        for c, name in enumerate(names):
+            u = [dy[2 * i : 2 * i + 4, c : c + 1] for i in range(self.num_of_spans)]
+            F = [kU[i][:, c : c + 1] + QFs[c][i] for i in range(self.num_of_spans)]
+            results[name] = {
+                "dy": dy[:, c : c + 1],
+                "R": R[:, c : c + 1],
+                "u": u,
+                "F": F,
+                "QF": QFs[c],
+            }
+        return results
+
+
+# Shortcut
+def solve_load_cases(E, I, spans, support_type, cases, R0=None):
+    """
+    Analyse N named load cases with one factorization of the reduced stiffness
+    cases : dict {name : loads}
+    """
+    return LoadCases(E, I, spans, support_type, R0).analyse(cases)
@@ -0,0 +1,276 @@
+## Struct-of-arrays load table
+## One row per load, same type code as Load.type :
+##   type = 0 : Point Load          value = P, a = position
+##   type = 1 : Distributed Load    value = q, a = start, l = length
+##   type = 2 : Concentrated Moment value = M, a = position
+## Used instead of lists of load objects when a beam carries tens of thousands
+## of loads (measured axle loads, discretised pressures, ...).
+## stiffness_matrix.table_to_loads() converts back to load objects.
+
+import numpy as np
+
+POINT, DISTRIBUTED, MOMENT = 0, 1, 2
+
+
+# Equivalent nodal reactions of many loads at once (vector of Load.Qf)
+def fef(type, value, a, l, L):
+    """
+    type, value, a, l, L : np.array (broadcast), L = length of the loaded span
+    return np.array (4, ...) : [RL, ML, RR, MR] of each load
+    """
+    type = np.asarray(type)
+    value = np.asarray(value, dtype=float)
+    a = np.asarray(a, dtype=float)
+    l = np.asarray(l, dtype=float)
+    L = np.asarray(L, dtype=float)
+
+    # Point load
+    b = L - a
+    point = (
+        value
+        / L**2
+        * np.array(
+            [
+                b**2 / L * (3 * a + b),
+                a * b**2,
+                a**2 / L * (a + 3 * b),
+                -(a**2) * b,
+            ]
+        )
+    )
+
+    # Concentrated moment
+    moment = (
+        value
+        / L**2
+        * np.array(
+            [
+                -6 * a * b / L,
+                b * (b - 2 * a),
+                6 * a * b / L,
+                a * (a - 2 * b),
+            ]
+        )
+    )
+
+    # Distributed load
+    b = L - a - l
+    distributed = (
+        value
+        * L
+        / 2
+        * np.array(
+            [
+                1
+                - a / L**4 * (2 * L**3 - 2 * a**2 * L + a**3)
+                - b**3 / L**4 * (2 * L - b),
+                L
+                / 6
+                * (
+                    1
+                    - a**2 / L**4 * (6 * L**2 - 8 * a * L + 3 * a**2)
+                    - b**3 / L**4 * (4 * L - 3 * b)
+                ),
+                1
+                - a**3 / L**4 * (2 * L - a)
+                - b / L**4 * (2 * L**3 - 2 * b**2 * L + b**3),
+                -L
+                / 6
+                * (
+                    1
+                    - a**3 / L**4 * (4 * L - 3 * a)
+                    - b**2 / L**4 * (6 * L**2 - 8 * b * L + 3 * b**2)
+                ),
+            ]
+        )
+    )
+
+    return np.select([type == POINT, type == DISTRIBUTED], [point, distributed], moment)
+
+
+class LoadTable:
+    """Loads of a beam as columns of arrays.
+    span : index of the loaded span (0 = first span)
+    type : 0 = Point Load, 1 = Distributed Load, 2 = Concentrated Moment
+    value : P (N), q (N/m) or M (N-m) ; Down+ Up-, counterclockwise+
+    a : position / start of the load with respect to the left end of the span, m
+    l : length of distributed load, m (0 for the others)
+    """
+
+    def __init__(self, span, type, value, a, l=None):
+        self.span = np.asarray(span, dtype=int)
+        self.type = np.asarray(type, dtype=int)
+        self.value = np.asarray(value, dtype=float)
+        self.a = np.asarray(a, dtype=float)
+        self.l = np.zeros(len(self.span)) if l is None else np.asarray(l, dtype=float)
+
+    def __len__(self):
+        return len(self.span)
+
+    def __str__(self):
+        return f"Load table : {len(self)} loads on {len(np.unique(self.span))} spans"
+
+    # From the list of load objects in each stretch
+    @classmethod
+    def from_loads(cls, loads):
+        rows = []
+        for i in range(len(loads)):
+            for f in loads[i]:
+                if f.type == POINT:
+                    rows.append((i, POINT, f.P, f.a, 0.0))
+                elif f.type == DISTRIBUTED:
+                    rows.append((i, DISTRIBUTED, f.q, f.a, f.l))
+                else:
+                    rows.append((i, MOMENT, f.M, f.a, 0.0))
+        if len(rows) == 0:
+            return cls([], [], [], [], [])
+        span, type, value, a, l = zip(*rows)
+        return cls(span, type, value, a, l)
+
+    # Join tables
+    def concat(self, other):
+        return LoadTable(
+            np.concatenate([self.span, other.span]),
+            np.concatenate([self.type, other.type]),
+            np.concatenate([self.value, other.value]),
+            np.concatenate([self.a, other.a]),
+            np.concatenate([self.l, other.l]),
+        )
+
+    # Scaled copy (load factor)
+    def scale(self, factor):
+        return LoadTable(self.span, self.type, factor * self.value, self.a, self.l)
+
+    # ------------------------------------------------------------------
+    ## Fixed-End Force
+    def fixed_end_forces(self, spans):
+        """
+        spans : list of span length
+        return QF : np.array (num_of_spans x 4), local FEF of each span
+        """
+        spans = np.asarray(spans, dtype=float)
+        QF = np.zeros((len(spans), 4))
+        if len(self):
+            Q = fef(self.type, self.value, self.a, self.l, spans[self.span])
+            np.add.at(QF, self.span, Q.T)  # scatter each load to its span
+        return QF
+
+    # Same output as stiffness_matrix.local_FEF()
+    def local_FEF(self, spans):
+        return [q.reshape(4, 1) for q in self.fixed_end_forces(spans)]
+
+    # Global FEF, [Qf] = [Fy1, M1, Fy2, M2, ...]
+    def global_FEF(self, spans):
+        QF = self.fixed_end_forces(spans)
+        Qf = np.zeros((2 * (len(spans) + 1), 1))
+        rows = 2 * np.arange(len(spans))[:, None] + np.arange(4)
+        np.add.at(Qf[:, 0], rows, QF)
+        return Qf
+
+    # ------------------------------------------------------------------
+    ## Diagram contributions as piecewise polynomials c0 + c1 x + c2 x^2
+    ## Each load changes the coefficients at its breakpoints (events).
+    def shear_events(self, spans):
+        """
+        return span, x, strict, dc : np.array of events, dc = (n x 3) coefficients
+        strict = True --> applies for sections x > breakpoint, else x >= breakpoint
+        """
+        P = self.type == POINT
+        q = self.type == DISTRIBUTED
+        v = self.value
+
+        span = np.concatenate([self.span[P], self.span[q], self.span[q]])
+        x = np.concatenate([self.a[P], self.a[q], self.a[q] + self.l[q]])
+        strict = np.concatenate([np.ones(P.sum(), bool), np.zeros(2 * q.sum(), bool)])
+        dc = np.zeros((len(span), 3))
+        n1 = P.sum()
+        n2 = n1 + q.sum()
+        # Point load : -P on the right of the load
+        dc[:n1, 0] = -v[P]
+        # Distributed load : -q (x - a) on the load, -q l beyond
+        dc[n1:n2, 0] = v[q] * self.a[q]
+        dc[n1:n2, 1] = -v[q]
+        dc[n2:, 0] = -v[q] * self.l[q] - v[q] * self.a[q]
+        dc[n2:, 1] = v[q]
+        return span, x, strict, dc
+
+    def moment_events(self, spans):
+        """Same as shear_events() for the simply supported bending moment."""
+        spans = np.asarray(spans, dtype=float)
+        P = self.type == POINT
+        q = self.type == DISTRIBUTED
+        M = self.type == MOMENT
+        v = self.value
+        a = self.a
+        L = spans[self.span]
+
+        # Left reaction of simply supported span from distributed load
+        V1 = v * self.l / L * (L - a - self.l / 2)
+        V2 = v * self.l - V1
+
+        blocks = [
+            # Point load : (1 - a/L) P x --> a P (1 - x/L)
+            (self.span[P], 0 * a[P], [0 * v[P], v[P] * (1 - a[P] / L[P]), 0 * v[P]]),
+            (self.span[P], a[P], [a[P] * v[P], -v[P], 0 * v[P]]),
+            # Distributed load : V1 x --> V1 x - q (x-a)^2 / 2 --> V2 (L - x)
+            (self.span[q], 0 * a[q], [0 * v[q], V1[q], 0 * v[q]]),
+            (self.span[q], a[q], [-v[q] * a[q] ** 2 / 2, v[q] * a[q], -v[q] / 2]),
+            (
+                self.span[q],
+                a[q] + self.l[q],
+                [
+                    V2[q] * L[q] + v[q] * a[q] ** 2 / 2,
+                    -V2[q] - V1[q] - v[q] * a[q],
+                    v[q] / 2,
+                ],
+            ),
+            # Concentrated moment : M x / L --> M (x/L - 1)
+            (self.span[M], 0 * a[M], [0 * v[M], v[M] / L[M], 0 * v[M]]),
+            (self.span[M], a[M], [-v[M], 0 * v[M], 0 * v[M]]),
+        ]
+        span = np.concatenate([b[0] for b in blocks])
+        x = np.concatenate([b[1] for b in blocks])
+        dc = np.concatenate([np.array(b[2]).T.reshape(-1, 3) for b in blocks])
+        return span, x, np.zeros(len(span), bool), dc
+
+    # Sum of the events at the sections (span, x)
+    @staticmethod
+    def evaluate(events, spans, Xt):
+        """
+        events : return of shear_events() / moment_events(), any number of coefficients
+        Xt : list of np.array of sections in each span
+        return list of np.array, value at the sections of each span
+        """
+        span, x, strict, dc = events
+        W = 2 * max(spans) + 1  # key = span * W + x sorts by span, then x
+        s_span = np.repeat(np.arange(len(Xt)), [len(X) for X in Xt])
+        s_x = np.concatenate(Xt)
+        s_key = s_span * W + s_x
+        start = np.arange(len(Xt)) * W  # first key of each span
+
+        C = np.zeros((len(s_x), dc.shape[1]))
+        for side, mask in (("left", strict), ("right", ~strict)):
+            key = span[mask] * W + x[mask]
+            order = np.argsort(key, kind="stable")
+            key = key[order]
+            cum = np.vstack([C[:1] * 0, np.cumsum(dc[mask][order], axis=0)])
+            # events of the same span with breakpoint < x (strict) or <= x
+            n_in = np.searchsorted(key, s_key, side=side)
+            n_0 = np.searchsorted(key, start, side="left")[s_span]
+            C += cum[n_in] - cum[n_0]
+
+        value = np.polynomial.polynomial.polyval(s_x, C.T, tensor=False)
+        return np.split(value, np.cumsum([len(X) for X in Xt])[:-1])
+
+    # Same output as stiffness_matrix.shear_values()
+    def shear_values(self, spans, F, Xt):
+        Q0 = self.evaluate(self.shear_events(spans), spans, Xt)
+        return [Q0[i] + F[i][0] for i in range(len(spans))]
+
+    # Same output as stiffness_matrix.moment_values()
+    def moment_values(self, spans, F, Xt):
+        M0 = self.evaluate(self.moment_events(spans), spans, Xt)
+        return [
+            M0[i] - F[i][1] + (F[i][3] + F[i][1]) / spans[i] * Xt[i]
+            for i in range(len(spans))
+        ]
@@ -0,0 +1,121 @@
+## Subdivision of the spans into elements
+## Every span is split into n_sub equal elements joined by free nodes (type 3),
+## so element properties (cracked inertia, mass, ...) can vary along a span.
+## Loads are moved to the element that carries them, distributed loads are cut
+## at the element boundaries.
+
+import numpy as np
+
+from load_table import LoadTable, DISTRIBUTED
+
+
+class Mesh:
+    """Elements of a subdivided continuous beam.
+    spans : list of span length, m
+    support_type : list of support type of the original nodes
+    n_sub : number of elements per span
+    """
+
+    def __init__(self, spans, support_type, n_sub=10):
+        self.spans = np.asarray(spans, dtype=float)
+        self.n_sub = int(n_sub)
+        n = len(self.spans)
+
+        # Element lengths, original span and position of each element in its span
+        self.span_of = np.repeat(np.arange(n), self.n_sub)
+        self.h = self.spans[self.span_of] / self.n_sub
+        self.x0 = np.tile(np.arange(self.n_sub), n) * self.h
+        self.L = self.h
+
+        # Original node i --> mesh node i * n_sub, internal nodes are free
+        self.support_type = [3] * (n * self.n_sub + 1)
+        self.support_type[:: self.n_sub] = list(support_type)
+        self.node_of = np.arange(n + 1) * self.n_sub
+
+    def __len__(self):
+        return len(self.L)
+
+    def __str__(self):
+        return f"Mesh : {len(self.spans)} spans, {len(self)} elements"
+
+    # Nodal external force of the original nodes --> mesh nodes
+    def nodal_force(self, R0):
+        if R0 is None or len(R0) == 0:
+            return None
+        R = np.zeros(2 * len(self.support_type))
+        R0 = np.asarray(R0, dtype=float)
+        R[2 * self.node_of] = R0[0::2]
+        R[2 * self.node_of + 1] = R0[1::2]
+        return R
+
+    # Loads of the spans --> loads of the elements
+    def loads(self, table):
+        """
+        table : LoadTable on the original spans
+        return LoadTable on the elements
+        """
+        n_sub = self.n_sub
+        first = table.span * n_sub  # first element of the loaded span
+        h = self.spans[table.span] / n_sub
+
+        # Point load / moment : element that contains a, a = L goes to the last one
+        c = table.type != DISTRIBUTED
+        k = np.minimum(np.floor(table.a[c] / h[c]).astype(int), n_sub - 1)
+        concentrated = LoadTable(
+            first[c] + k,
+            table.type[c],
+            table.value[c],
+            table.a[c] - k * h[c],
+        )
+
+        # Distributed load : overlap of [a, a + l] with every element of the span
+        q = ~c
+        k = np.arange(n_sub)
+        start = np.maximum(table.a[q][:, None], k * h[q][:, None])
+        end = np.minimum((table.a + table.l)[q][:, None], (k + 1) * h[q][:, None])
+        ok = end > start
+        row, col = np.nonzero(ok)
+        distributed = LoadTable(
+            first[q][row] + col,
+            np.full(len(row), DISTRIBUTED),
+            table.value[q][row],
+            start[ok] - col * h[q][row],
+            (end - start)[ok],
+        )
+        return concentrated.concat(distributed)
+
+    # Hermite interpolation at sections of the original spans
+    def interpolation(self, span, x):
+        """
+        span : index of the original span of each section, x : position in the span, m
+        return dof : np.array (n_section x 4) of mesh DOF of the element,
+               N, B : np.array (n_section x 4), w = N u and w'' = B u
+        """
+        span = np.asarray(span, dtype=int)
+        x = np.asarray(x, dtype=float)
+        h = self.spans[span] / self.n_sub
+        k = np.minimum(np.floor(x / h).astype(int), self.n_sub - 1)
+        e = span * self.n_sub + k  # element of each section
+        s = (x - k * h) / h
+
+        N = np.column_stack(
+            [
+                1 - 3 * s**2 + 2 * s**3,
+                h * (s - 2 * s**2 + s**3),
+                3 * s**2 - 2 * s**3,
+                h * (-(s**2) + s**3),
+            ]
+        )
+        B = np.column_stack(
+            [
+                (12 * s - 6) / h**2,
+                (6 * s - 4) / h,
+                (6 - 12 * s) / h**2,
+                (6 * s - 2) / h,
+            ]
+        )
+        return 2 * e[:, None] + np.arange(4), N, B
+
+    # Element values (n_elements) grouped by original span
+    def per_span(self, values):
+        return np.asarray(values).reshape(len(self.spans), self.n_sub, -1)
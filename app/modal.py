@@ -0,0 +1,135 @@
+## Modal analysis : natural frequencies and mode shapes
+## [K] φ = ω² [M] φ on the free DOF, [M] = consistent mass of the elements.
+## The spans are subdivided (mesh.Mesh) so the cubic element represents the
+## higher modes, and the lowest modes are found by subspace iteration :
+##   [K] X_k+1 = [M] X_k  (banded LDL^T, factorized once)
+##   Rayleigh-Ritz on the small projected problem, repeat until ω² converge.
+
+import time
+
+import numpy as np
+
+from banded import banded_dot, ldl_factor, ldl_solve, reduce_banded
+from dofs import DofMap
+from element_table import ElementTable
+from mesh import Mesh
+from utils import xi_coordinate
+
+
+# Lowest eigenpairs of K x = λ M x, K and M in band storage
+def subspace_iteration(Kb, Mb, n_modes, tol=1e-8, max_iter=100, seed=0):
+    """
+    Kb, Mb : np.array of lower band storage of the reduced K and M
+    return lam : np.array (n_modes), X : np.array (n x n_modes) M-orthonormal, iterations
+    """
+    n = Kb.shape[1]
+    p = min(n, max(2 * n_modes, n_modes + 8))  # size of the subspace
+    factor = ldl_factor(Kb)
+
+    # Start : diagonal of M plus random vectors
+    X = np.random.default_rng(seed).standard_normal((n, p))
+    X[:, 0] = Mb[0]
+
+    lam = np.zeros(p)
+    for iteration in range(1, max_iter + 1):
+        Xb = ldl_solve(factor, banded_dot(Mb, X))
+
+        # Rayleigh-Ritz : Kr q = λ Mr q with Mr = Lr Lr^T
+        Kr = Xb.T @ banded_dot(Kb, Xb)
+        Mr = Xb.T @ banded_dot(Mb, Xb)
+        Lr = np.linalg.cholesky(Mr)
+        Li = np.linalg.inv(Lr)
+        lam_new, Q = np.linalg.eigh(Li @ Kr @ Li.T)
+        X = Xb @ (Li.T @ Q)
+
+        error = np.abs(lam_new[:n_modes] - lam[:n_modes]) / lam_new[:n_modes]
+        lam = lam_new
+        if np.all(error < tol):
+            break
+
+    return lam[:n_modes], X[:, :n_modes], iteration
+
+
+# Mode shapes at the stations of each original span
+def mode_shapes(mesh, phi, Xt):
+    """
+    phi : np.array (ndof x n_modes) of the mesh
+    Xt : list of np.array of stations of each original span
+    return np.array (n_station x n_modes)
+    """
+    span = np.repeat(np.arange(len(Xt)), [len(x) for x in Xt])
+    dof, N, B = mesh.interpolation(span, np.concatenate(Xt))
+    return np.einsum("sj,sjm->sm", N, phi[dof])
+
+
+def modal_analysis(
+    E, I, spans, support_type, m, n_modes=5, n_sub=8, numS=100, tol=1e-8, scale=1e9
+):
+    """
+    E : GPa, I : m4, m : mass per unit length, kg/m (scalar or one value per span)
+    spans : list of span length, m
+    support_type : list of support type, fixd=0, vert-scroll=1, pin=2, free=3
+    n_modes : number of modes
+    n_sub : elements per span
+    numS : stations per span of the mode shapes
+    scale : E units --> Pa
+    return dict
+        frequency (Hz), omega (rad/s), period (s) : np.array (n_modes)
+        X : stations along the beam, m ; modes : np.array (n_station x n_modes), max |φ| = 1
+        iterations : subspace iterations ; time : dict of timings, s
+    """
+    t0 = time.perf_counter()
+    spans = np.asarray(spans, dtype=float)
+    n = len(spans)
+    mesh = Mesh(spans, support_type, n_sub)
+
+    def per_element(v):
+        return np.broadcast_to(np.asarray(v, dtype=float), (n,))[mesh.span_of]
+
+    elements = ElementTable(per_element(E), per_element(I), mesh.L, per_element(m))
+    dofs = DofMap(mesh.support_type)
+    Kb = reduce_banded(elements.banded(), dofs.J)
+    Mb = reduce_banded(elements.banded_mass(), dofs.J)
+    t1 = time.perf_counter()
+
+    n_modes = min(n_modes, len(dofs.J))
+    lam, X, iterations = subspace_iteration(Kb, Mb, n_modes, tol)
+    t2 = time.perf_counter()
+
+    # ω² = λ with K in Pa
+    omega = np.sqrt(lam * scale)
+    phi = np.zeros((elements.ndof, n_modes))
+    phi[dofs.J] = X
+
+    numS, Xt = xi_coordinate(spans, numS)
+    modes = mode_shapes(mesh, phi, Xt)
+    modes /= np.abs(modes).max(axis=0)
+    offset = np.concatenate([[0], np.cumsum(spans)[:-1]])
+    t3 = time.perf_counter()
+
+    return {
+        "frequency": omega / (2 * np.pi),
+        "omega": omega,
+        "period": 2 * np.pi / omega,
+        "X": np.concatenate([x + o for x, o in zip(Xt, offset)]),
+        "modes": modes,
+        "iterations": iterations,
+        "time": {
+            "assembly": t1 - t0,
+            "eigen": t2 - t1,
+            "modes": t3 - t2,
+            "total": t3 - t0,
+        },
+    }
+
+
+# Print as stiffness_matrix.report()
+def report_modes(result):
+    print(f"\nMODAL ANALYSIS : {result['iterations']} subspace iterations")
+    for i, (f, T) in enumerate(zip(result["frequency"], result["period"])):
+        print(f"Mode {i+1} : f = {f:.3f} Hz, T = {T:.4f} s")
+    t = result["time"]
+    print(
+        f"Time : assembly {t['assembly']*1e3:.1f} ms, eigen {t['eigen']*1e3:.1f} ms, "
+        f"modes {t['modes']*1e3:.1f} ms"
+    )
@@ -0,0 +1,148 @@
+## Moving load envelope of an axle train (crane runway, vehicle)
+## Response of the train with lead axle at s :
+##   r(s) = sum(Pk * IL(s - ok)),  ok = distance of axle k behind the lead axle
+## With the influence lines sampled on a uniform grid this is a discrete
+## convolution of each influence line with the axle train, so every train
+## position is evaluated at once (shifted sums or FFT).
+
+import numpy as np
+
+from influence import influence_lines
+
+
+# Resample influence lines on a uniform grid of load positions
+def resample(IL, X, xg):
+    """
+    IL : np.array (n_response x n_position) at load positions X
+    xg : np.array of uniform load positions
+    return np.array (n_response x len(xg)), linear interpolation between stations
+    """
+    j = np.clip(np.searchsorted(X, xg, side="right"), 1, len(X) - 1)
+    x0 = X[j - 1]
+    x1 = X[j]
+    w = np.where(x1 > x0, (xg - x0) / np.where(x1 > x0, x1 - x0, 1), 0.0)
+    w = np.clip(w, 0, 1)  # no extrapolation beyond the ends
+    return IL[:, j - 1] * (1 - w) + IL[:, j] * w
+
+
+# All train positions at once
+def train_response(ILg, kernel, method="auto"):
+    """
+    ILg : np.array (n_response x n_grid), influence lines on the uniform grid
+    kernel : np.array of axle loads at grid offsets behind the lead axle
+    return np.array (n_response x n_grid + len(kernel) - 1),
+           column j = lead axle at grid point j (axles off the beam give zero)
+    """
+    n = ILg.shape[1]
+    m = len(kernel)
+    nz = np.nonzero(kernel)[0]
+
+    if method == "auto":
+        method = "fft" if len(nz) > 32 else "direct"
+
+    if method == "fft":
+        nfft = n + m - 1
+        return np.fft.irfft(
+            np.fft.rfft(ILg, nfft, axis=1) * np.fft.rfft(kernel, nfft), nfft, axis=1
+        )
+
+    # Shifted sums : one vector operation per axle
+    r = np.zeros((ILg.shape[0], n + m - 1))
+    for k in nz:
+        r[:, k : k + n] += kernel[k] * ILg
+    return r
+
+
+def moving_envelope(
+    E,
+    I,
+    spans,
+    support_type,
+    axles,
+    spacing,
+    dx=0.05,
+    numS=200,
+    stations=None,
+    both_ways=True,
+    method="auto",
+):
+    """
+    E : GPa, I : m4, spans : list of span length, m
+    support_type : list of support type
+    axles : list of axle loads (PointLoad magnitudes), N, Down+
+    spacing : list of distances between consecutive axles, m (len(axles) - 1)
+    dx : grid step of the train position, m (adjusted to divide the beam length,
+         axle offsets are rounded to the step)
+    numS : load positions per span of the influence lines
+    stations : np.array of response stations along the beam, m (None --> load positions)
+    both_ways : also run the train in the opposite direction
+    return dict
+        X : response stations, m
+        Vmax, Vmin, Mmax, Mmin : envelope at X, N, N-m (sagging +)
+        xVmax, xVmin, xMmax, xMmin : position of the front (right-most) axle
+                                     of each extreme, m
+        dVmax, dVmin, dMmax, dMmin : direction of the train, +1 forward, -1 reversed
+        Rmax, Rmin, xRmax, xRmin, dof : envelope of the support reactions
+    """
+    il = influence_lines(E, I, spans, support_type, numS, stations)
+    X = il["X"]
+    Ltotal = X[-1]
+
+    # Uniform grid of load positions, both ends included (step close to dx)
+    xg = np.linspace(0, Ltotal, max(int(round(Ltotal / dx)), 1) + 1)
+    dx = xg[1] - xg[0]
+
+    # Train as impulses on the grid : kernel[offset] = P
+    offsets = (
+        np.concatenate([[0], np.cumsum(spacing)]) if len(axles) > 1 else np.zeros(1)
+    )
+    steps = np.round(offsets / dx).astype(int)
+    kernel = np.zeros(steps.max() + 1)
+    np.add.at(kernel, steps, axles)
+
+    # Front axle position of column j of the train response
+    x_lead = np.arange(len(xg) + len(kernel) - 1) * dx
+
+    trains = [(1, kernel)]
+    if both_ways:
+        # Reversed train : last axle leads
+        trains.append((-1, kernel[::-1]))
+
+    result = {"X": il["Xr"], "dof": il["dof"]}
+    for name, IL in (("V", il["V"]), ("M", il["M"]), ("R", il["R"])):
+        ILg = resample(IL, X, xg)
+        rmax = np.full(IL.shape[0], -np.inf)
+        rmin = np.full(IL.shape[0], np.inf)
+        xmax = np.zeros(IL.shape[0])
+        xmin = np.zeros(IL.shape[0])
+        dmax = np.ones(IL.shape[0], dtype=int)
+        dmin = np.ones(IL.shape[0], dtype=int)
+        for direction, w in trains:
+            r = train_response(ILg, w, method)
+            jmax = r.argmax(axis=1)
+            jmin = r.argmin(axis=1)
+            vmax = r[np.arange(len(r)), jmax]
+            vmin = r[np.arange(len(r)), jmin]
+
+            up = vmax > rmax
+            rmax[up] = vmax[up]
+            xmax[up] = x_lead[jmax[up]]
+            dmax[up] = direction
+
+            down = vmin < rmin
+            rmin[down] = vmin[down]
+            xmin[down] = x_lead[jmin[down]]
+            dmin[down] = direction
+
+        result.update(
+            {
+                name + "max": rmax,
+                name + "min": rmin,
+                "x" + name + "max": xmax,
+                "x" + name + "min": xmin,
+                "d" + name + "max": dmax,
+                "d" + name + "min": dmin,
+            }
+        )
+
+    return result
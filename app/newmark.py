@@ -0,0 +1,134 @@
+## Time-history response by Newmark-β integration
+##   [M] ü + [C] u̇ + [K] u = p(t),  [C] = α [M] + β_K [K] (Rayleigh)
+## With a constant time step the effective stiffness
+##   [K^] = [K] + a0 [M] + a1 [C],  a0 = 1 / (β dt²), a1 = γ / (β dt)
+## never changes, so it is factorized once (banded LDL^T) and every step is one
+## forward/backward substitution. The response at the selected stations is
+## yielded step by step, nothing but the current state is kept in memory.
+
+import numpy as np
+
+from banded import banded_dot, ldl_factor, ldl_solve, reduce_banded
+from dofs import DofMap
+from element_table import ElementTable
+from load_table import LoadTable, POINT
+from mesh import Mesh
+
+
+# Rayleigh coefficients for the damping ratio zeta at frequencies f1, f2 (Hz)
+def rayleigh(zeta, f1, f2):
+    w1, w2 = 2 * np.pi * f1, 2 * np.pi * f2
+    alpha = 2 * zeta * w1 * w2 / (w1 + w2)
+    beta = 2 * zeta / (w1 + w2)
+    return alpha, beta
+
+
+# Point load P moving at constant speed over the whole beam
+def moving_point_load(P, speed, spans, x0=0.0):
+    """
+    P : N (Down+), speed : m/s, x0 : position at t = 0 from the left end, m
+    return load(t) --> LoadTable on the original spans
+    """
+    ends = np.cumsum(spans)
+    starts = ends - np.asarray(spans, dtype=float)
+
+    def load(t):
+        x = x0 + speed * t
+        if x < 0 or x > ends[-1]:
+            return LoadTable([], [], [], [])
+        i = min(np.searchsorted(ends, x), len(ends) - 1)
+        return LoadTable([i], [POINT], [P], [x - starts[i]])
+
+    return load
+
+
+def newmark(
+    E,
+    I,
+    spans,
+    support_type,
+    m,
+    load,
+    dt,
+    n_steps,
+    stations,
+    n_sub=8,
+    alpha=0.0,
+    beta_K=0.0,
+    beta=0.25,
+    gamma=0.5,
+    every=1,
+    scale=1e9,
+):
+    """
+    E : GPa, I : m4, m : mass per unit length, kg/m (scalar or one value per span)
+    spans : list of span length, m ; support_type : list of support type
+    load : function load(t) --> LoadTable or list of loads in each stretch (Down+)
+    dt : time step, s ; n_steps : number of steps
+    stations : np.array of sections along the beam where the response is recorded, m
+    alpha, beta_K : Rayleigh damping coefficients (see rayleigh())
+    beta, gamma : Newmark parameters (1/4, 1/2 = average acceleration)
+    every : yield one step out of every
+    yield t, w, M : time (s), deflection (m, Up+) and moment (N-m, sagging +) at the stations
+    """
+    spans = np.asarray(spans, dtype=float)
+    n = len(spans)
+    mesh = Mesh(spans, support_type, n_sub)
+
+    def per_element(v):
+        return np.broadcast_to(np.asarray(v, dtype=float), (n,))[mesh.span_of]
+
+    elements = ElementTable(per_element(E), per_element(I), mesh.L, per_element(m))
+    dofs = DofMap(mesh.support_type)
+    J = dofs.J
+
+    # Reduced matrices in N, m (E given in GPa)
+    Kb = scale * reduce_banded(elements.banded(), J)
+    Mb = reduce_banded(elements.banded_mass(), J)
+    Cb = alpha * Mb + beta_K * Kb
+
+    # Newmark constants and effective stiffness, factorized once
+    a0 = 1 / (beta * dt**2)
+    a1 = gamma / (beta * dt)
+    a2 = 1 / (beta * dt)
+    a3 = 1 / (2 * beta) - 1
+    a4 = gamma / beta - 1
+    a5 = dt / 2 * (gamma / beta - 2)
+    factor = ldl_factor(Kb + a0 * Mb + a1 * Cb)
+
+    # Recovery at the stations : w = N u, M = EI w''
+    ends = np.cumsum(spans)
+    stations = np.asarray(stations, dtype=float)
+    span = np.minimum(np.searchsorted(ends, stations), n - 1)
+    dof, N, B = mesh.interpolation(span, stations - (ends - spans)[span])
+    EI = scale * per_element(E) * per_element(I)
+    B = B * EI[dof[:, 0] // 2][:, None]
+
+    def force(t):
+        table = load(t)
+        if not isinstance(table, LoadTable):
+            table = LoadTable.from_loads(table)
+        QF = mesh.loads(table).fixed_end_forces(mesh.L)
+        return -elements.scatter(QF)[J]  # equivalent nodal loads
+
+    # Start at rest : M ü0 = p0
+    u = np.zeros(len(J))
+    v = np.zeros(len(J))
+    acc = ldl_solve(ldl_factor(Mb), force(0.0))
+    d = np.zeros(elements.ndof)
+
+    for step in range(1, n_steps + 1):
+        t = step * dt
+        p = (
+            force(t)
+            + banded_dot(Mb, a0 * u + a2 * v + a3 * acc)
+            + banded_dot(Cb, a1 * u + a4 * v + a5 * acc)
+        )
+        u_new = ldl_solve(factor, p)
+        acc_new = a0 * (u_new - u) - a2 * v - a3 * acc
+        v = v + dt * ((1 - gamma) * acc + gamma * acc_new)
+        u, acc = u_new, acc_new
+
+        if step % every == 0:
+            d[J] = u
+            yield t, np.einsum("sj,sj->s", N, d[dof]), np.einsum("sj,sj->s", B, d[dof])
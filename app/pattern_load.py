@@ -0,0 +1,97 @@
+## Pattern live load (checkerboard) envelopes
+## A uniform live load on span j gives the diagram q_j * [V_j], q_j * [M_j] where
+## [V_j], [M_j] come from a unit load (1 N/m) on span j only. Every pattern is a
+## superposition of these n unit cases, solved together by LoadCases:
+##   [V_pattern] = [V_D] + sum(loaded_j * q_j * [V_j])
+## The worst pattern at a station loads exactly the spans with a contribution of
+## the same sign, so the envelope needs no loop over the 2^n patterns.
+
+import numpy as np
+
+from combinations import case_diagrams
+from load_cases import LoadCases
+from load_table import LoadTable, DISTRIBUTED
+
+
+# Unit uniform load on each span
+def unit_span_cases(spans):
+    return {
+        f"L{j + 1}": LoadTable([j], [DISTRIBUTED], [1.0], [0.0], [L])
+        for j, L in enumerate(spans)
+    }
+
+
+# Code patterns : all spans, alternate spans, two adjacent spans + alternate
+def code_patterns(n):
+    """
+    return np.array (n_pattern x n) of 0/1, 1 = live load on the span
+    """
+    j = np.arange(n)
+    patterns = [np.ones(n), j % 2 == 0, j % 2 == 1]
+    # Maximum negative moment at support i : spans i-1 and i, then every other span
+    for i in range(1, n):
+        p = ((j >= i) & ((j - i) % 2 == 0)) | ((j < i) & ((i - 1 - j) % 2 == 0))
+        patterns.append(p)
+    return np.unique(np.array(patterns, dtype=float), axis=0)
+
+
+def pattern_envelope(
+    E, I, spans, support_type, dead, live, gamma_D=1.0, gamma_L=1.0, patterns=None
+):
+    """
+    E : GPa, I : m4, spans : list of span length, m
+    support_type : list of support type
+    dead : list of loads in each stretch or LoadTable, always applied
+    live : uniform live load, N/m, scalar or one value per span
+    gamma_D, gamma_L : load factors
+    patterns : None --> worst pattern at every station (sign-based)
+               np.array (n_pattern x n) of 0/1 --> envelope of these patterns only
+    return dict
+        X : stations, m
+        Vmax, Vmin, Mmax, Mmin : np.array (n_station), N, N-m (sagging +)
+        Rmax, Rmin : np.array (ndof) of nodal reactions
+        pattern_Mmax, pattern_Mmin : np.array (n_station x n) of 0/1, governing pattern
+    """
+    n = len(spans)
+    live = np.broadcast_to(np.asarray(live, dtype=float), (n,))
+
+    cases = {"D": dead, **unit_span_cases(spans)}
+    model = LoadCases(E, I, spans, support_type)
+    results = model.analyse(cases)
+    X, V, M = case_diagrams(model, cases, results)
+    R = np.array([results[name]["R"][:, 0] for name in cases])
+
+    # Dead load and factored live contribution of each span
+    q = (gamma_L * live)[:, None]
+    V_D, V_L = gamma_D * V[0], q * V[1:]
+    M_D, M_L = gamma_D * M[0], q * M[1:]
+    R_D, R_L = gamma_D * R[0], q * R[1:]
+
+    if patterns is None:
+        out = {
+            "Vmax": V_D + np.clip(V_L, 0, None).sum(axis=0),
+            "Vmin": V_D + np.clip(V_L, None, 0).sum(axis=0),
+            "Mmax": M_D + np.clip(M_L, 0, None).sum(axis=0),
+            "Mmin": M_D + np.clip(M_L, None, 0).sum(axis=0),
+            "Rmax": R_D + np.clip(R_L, 0, None).sum(axis=0),
+            "Rmin": R_D + np.clip(R_L, None, 0).sum(axis=0),
+            "pattern_Mmax": (M_L > 0).T.astype(float),
+            "pattern_Mmin": (M_L < 0).T.astype(float),
+        }
+    else:
+        P = np.asarray(patterns, dtype=float)
+        Vp = V_D + P @ V_L
+        Mp = M_D + P @ M_L
+        Rp = R_D + P @ R_L
+        out = {
+            "Vmax": Vp.max(axis=0),
+            "Vmin": Vp.min(axis=0),
+            "Mmax": Mp.max(axis=0),
+            "Mmin": Mp.min(axis=0),
+            "Rmax": Rp.max(axis=0),
+            "Rmin": Rp.min(axis=0),
+            "pattern_Mmax": P[Mp.argmax(axis=0)],
+            "pattern_Mmin": P[Mp.argmin(axis=0)],
+        }
+
+    return {"X": X, **out}
@@ -5,10 +5,20 @@ from utils import xi_coordinate, X_coordinate
 
 
 def plot_diagram(
-    label, spans, Ltotal, stretch, DFQ, max_values, min_values, Xmax_values, Xmin_values
+    label,
+    spans,
+    Ltotal,
+    stretch,
+    DFQ,
+    max_values,
+    min_values,
+    Xmax_values,
+    Xmin_values,
+    Xt=None,
 ):
 
-    numS, Xt = xi_coordinate(spans)
+    if Xt is None:
+        numS, Xt = xi_coordinate(spans)
 
     X = X_coordinate(spans, stretch, Xt)
 
@@ -112,12 +122,23 @@ def plot_combined(
     XmaxM,
     XminM,
     deflectionDFQ,
+    Xt=None,
+    show=True,
 ):
     shear_fig = plot_diagram(
-        "Shear", spans, Ltotal, stretch, shearDFQ, maxShear, minShear, XmaxQ, XminQ
+        "Shear", spans, Ltotal, stretch, shearDFQ, maxShear, minShear, XmaxQ, XminQ, Xt
     )
     moment_fig = plot_diagram(
-        "Moment", spans, Ltotal, stretch, momentDFQ, maxMoment, minMoment, XmaxM, XminM
+        "Moment",
+        spans,
+        Ltotal,
+        stretch,
+        momentDFQ,
+        maxMoment,
+        minMoment,
+        XmaxM,
+        XminM,
+        Xt,
     )
 
     deflection_fig = plot_diagram(
@@ -130,6 +151,7 @@ def plot_combined(
         None,
         None,
         None,
+        Xt,
     )
 
     # Create subplots
@@ -142,7 +164,7 @@ def plot_combined(
         subplot_titles=(
             "Shear Force Diagram(kN)",
             "Bending Moment Diagram(kN-m)",
-            "Delta by Cubic Interpolation",
+            "Deflection(mm)",
         ),
     )
 
@@ -161,6 +183,29 @@ def plot_combined(
 
     fig.update_layout(height=800, showlegend=False)
 
-    fig.show()
+    if show:
+        fig.show()
 
     return fig
+
+
+# Plot of stiffness_matrix.AnalysisResult
+def plot_result(result, show=True):
+    return plot_combined(
+        result.spans,
+        result.Ltotal,
+        result.stretch,
+        (result.V / 1000).tolist(),  # kN
+        (-result.M / 1000).tolist(),  # kN-m, plotted on reversed axis
+        result.maxShear.tolist(),
+        result.minShear.tolist(),
+        result.XmaxQ.tolist(),
+        result.XminQ.tolist(),
+        (-result.maxMoment).tolist(),
+        (-result.minMoment).tolist(),
+        result.XmaxM.tolist(),
+        result.XminM.tolist(),
+        (result.deflection * 1000).tolist(),  # mm
+        result.Xt,
+        show,
+    )
@@ -0,0 +1,141 @@
+## Automatic selection of the main bars from the Deform_Bar catalogue
+## All (count, diameter, layers) combinations are built at once by broadcasting
+##   count : 1 ... 30 (rows "Q,ty"), diameter : columns of the csv, layers : 1 ... max_layers
+## and checked with the geometry of plot_section.calculate_rebar_positions :
+##   centre spacing = (b - 2c - 2 ø_trav - ø) / (n_layer - 1), clear = centre spacing - ø
+##   clear >= max(2.5 cm, ø, 4/3 aggregate) (ACI 25.2.1)
+## Layers are 2 ø apart as plot_section.get_rebar_coordinates. The feasible layouts
+## of a width do not depend on As, so they are built once and ranked, then every
+## As required (one station or a whole envelope) is one comparison with the table.
+
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+CATALOGUE = os.path.join(os.path.dirname(__file__), "..", "data", "Deform_Bar.csv")
+
+
+# Bar diameters (mm) and areas (cm2) of the catalogue
+def read_catalogue(path=CATALOGUE, deformed=True):
+    """
+    return Q : np.array (n_count) number of bars
+           dia : np.array (n_dia) diameter, mm
+           A : np.array (n_count x n_dia) area of Q bars, cm2
+    """
+    df = pd.read_csv(path, index_col=0)
+    columns = [c for c in df.columns if not (deformed and c.startswith("RB"))]
+    dia = np.array([int(re.findall(r"\d+", c)[0]) for c in columns])
+    return df.index.to_numpy(), dia, df[columns].to_numpy(dtype=float)
+
+
+# All feasible layouts of the main bars in a section of width b
+def rebar_layouts(
+    b,
+    c=3,
+    trav=9,
+    max_layers=3,
+    n_min=2,
+    aggregate=0,
+    diameters=None,
+    catalogue=None,
+):
+    """
+    b, c : width and covering, cm ; trav : traverse diameter, mm
+    n_min : least number of bars (and of bars in every layer)
+    aggregate : maximum aggregate size, mm (0 = not checked)
+    diameters : list of allowed diameters, mm (None = all deformed bars)
+    catalogue : (Q, dia, A) from read_catalogue()
+    return dict of np.array, one value per layout
+        N, dia (mm), layers, per_layer (bars in the full layers), As (cm2)
+        clear : clear spacing of the full layers, cm
+        y : centroid of the bars from the tension face, cm
+    """
+    Q, dia, A = read_catalogue() if catalogue is None else catalogue
+    if diameters is not None:
+        keep = np.isin(dia, diameters)
+        dia, A = dia[keep], A[:, keep]
+
+    # Grid (count x diameter x layers)
+    N = Q[:, None, None]
+    db = dia[None, :, None] / 10  # cm
+    L = np.arange(1, max_layers + 1)[None, None, :]
+    As = np.broadcast_to(A[:, :, None], (len(Q), len(dia), max_layers))
+
+    # Bars per layer, the last layer takes the rest
+    k = -(-N // L)  # ceil
+    last = N - (L - 1) * k
+
+    # Horizontal clear spacing, calculate_rebar_positions geometry
+    width = b - 2 * c - 2 * trav / 10 - db  # between the centres of the outer bars
+    with np.errstate(divide="ignore"):
+        clear = np.where(k > 1, width / np.maximum(k - 1, 1) - db, width)
+    s_min = np.maximum(np.maximum(2.5, db), 4 / 3 * aggregate / 10)
+
+    ok = (N >= n_min) & (last >= min(n_min, 2)) & (clear >= s_min) & (width >= 0)
+
+    # Centroid : layer i at c + (i + 0.5) 2ø
+    y = c + 2 * db * (k * (L - 1) ** 2 / 2 + last * (L - 0.5)) / N
+
+    grid = np.broadcast_arrays(N, db * 10, L, k, As, clear, y)
+    return {
+        name: v[ok]
+        for name, v in zip(
+            ("N", "dia", "layers", "per_layer", "As", "clear", "y"), grid
+        )
+    }
+
+
+# Order of the layouts for an objective
+def ranking(layouts, objective="steel"):
+    """
+    objective : "steel" = least area, then least bars, then least layers
+                "count" = least bars, then least area, then least layers
+    """
+    keys = {
+        "steel": (layouts["layers"], layouts["N"], layouts["As"]),
+        "count": (layouts["layers"], layouts["As"], layouts["N"]),
+    }
+    if objective not in keys:
+        raise ValueError(f"objective must be 'steel' or 'count', not {objective!r}")
+    return np.lexsort(keys[objective])
+
+
+# Best layout for every As required, vectorized over the stations
+def select_rebar(As_req, layouts, objective="steel"):
+    """
+    As_req : np.array of area required, cm2, (n) or (n x n_layout) when the
+             requirement depends on the layout (depth d = h - y)
+    layouts : dict from rebar_layouts()
+    return np.array of index in layouts (-1 = no feasible layout)
+    """
+    order = ranking(layouts, objective)
+    As_req = np.asarray(As_req, dtype=float)
+    As_req = As_req[:, order] if As_req.ndim == 2 else np.atleast_1d(As_req)[:, None]
+    enough = layouts["As"][order][None, :] >= As_req
+    first = enough.argmax(axis=1)
+    return np.where(enough.any(axis=1), order[first], -1)
+
+
+def optimize_rebar(
+    As_req, b, c=3, trav=9, objective="steel", alternatives=5, layouts=None, **kwargs
+):
+    """
+    As_req : area required, cm2 ; b, c : cm ; trav : mm
+    objective : "steel" or "count"
+    alternatives : number of ranked solutions returned
+    layouts : dict from rebar_layouts() of the same section, built if None
+    kwargs : other arguments of rebar_layouts()
+    return best : dict (None if no layout fits), ranked : pd.DataFrame of the best solutions
+    """
+    if layouts is None:
+        layouts = rebar_layouts(b, c, trav, **kwargs)
+    order = ranking(layouts, objective)
+    order = order[layouts["As"][order] >= As_req]
+
+    ranked = pd.DataFrame({k: v[order[:alternatives]] for k, v in layouts.items()})
+    ranked["excess"] = ranked["As"] / As_req - 1 if As_req > 0 else np.inf
+    ranked = ranked.astype({"N": int, "dia": int, "layers": int, "per_layer": int})
+    best = {k: v[0] for k, v in ranked.to_dict("list").items()} if len(ranked) else None
+    return best, ranked
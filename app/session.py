@@ -0,0 +1,178 @@
+## Incremental analysis session for what-if edits
+## The reduced stiffness [K0] of the initial supports is factorized once.
+##   Load change    : only the 4 terms of [Qf] of the loaded span change --> re-solve
+##   Support change : DOF released (a) or constrained (c) border the factorized system
+##       | K0    W | |x|   |f0|     W = [K0a, Ec], D = | Kaa  0 |
+##       | W^T   D | |y| = |g |                        | 0    0 |
+##   solved with the Schur complement S = D - W^T K0^-1 W (size = number of changes).
+## The session refactorizes only when too many supports have changed.
+
+import numpy as np
+
+from banded import (
+    band_column,
+    banded_dot,
+    ldl_factor,
+    ldl_solve,
+    reduce_banded,
+    to_dense,
+)
+from element_table import ElementTable
+from load_table import LoadTable
+from stiffness_matrix import analysis_result, free_dofs, table_to_loads
+
+
+class AnalysisSession:
+    """Beam kept in memory between edits.
+    E : GPa, I : m4, spans : list of span length, m
+    support_type : list of support type, fixd=0, vert-scroll=1, pin=2, free=3
+    loads : list of loads in each stretch or LoadTable
+    R0 : list of nodal external loads, N, N-m
+    max_rank : number of changed DOF before refactorization
+    """
+
+    def __init__(self, E, I, spans, support_type, loads, R0=None, max_rank=8):
+        self.E = E
+        self.I = I
+        self.spans = list(spans)
+        self.support_type = list(support_type)
+        self.max_rank = max_rank
+        n = len(self.spans)
+
+        self.elements = ElementTable(E, I, self.spans)
+        self.Kb = self.elements.banded()
+        self.ndof = self.elements.ndof
+
+        # Loads and FEF kept per span
+        if isinstance(loads, LoadTable):
+            loads = table_to_loads(loads, n)
+        self.loads = [list(f) for f in loads]
+        self.QF = LoadTable.from_loads(self.loads).fixed_end_forces(self.spans)
+        self.Qf = self.elements.scatter(self.QF)
+
+        self.R0 = np.zeros(self.ndof)
+        if R0 is not None and len(R0) != 0:
+            self.R0[:] = R0
+
+        self.refactors = 0
+        self.refactor()
+
+    def __str__(self):
+        return (
+            f"Analysis session : {len(self.spans)} spans, {len(self.J0)} factorized DOF, "
+            f"{len(self.A) + len(self.C)} bordered DOF, {self.refactors} factorizations"
+        )
+
+    # ------------------------------------------------------------------
+    ## Factorization
+    def refactor(self):
+        self.J0 = free_dofs(self.support_type)
+        self.factor = (
+            ldl_factor(reduce_banded(self.Kb, self.J0)) if len(self.J0) else None
+        )
+        self.pos = np.full(self.ndof, -1)
+        self.pos[self.J0] = np.arange(len(self.J0))
+        self.refactors += 1
+        self.border()
+
+    # Released / constrained DOF with respect to the factorized supports
+    def border(self):
+        J = free_dofs(self.support_type)
+        self.A = np.setdiff1d(J, self.J0)
+        self.C = np.setdiff1d(self.J0, J)
+        nA = len(self.A)
+        r = nA + len(self.C)
+
+        if r == 0:
+            self.W = self.Z = self.S = None
+            return
+        if r > self.max_rank:
+            self.refactor()
+            return
+
+        W = np.zeros((len(self.J0), r))
+        for k, a in enumerate(self.A):
+            W[:, k] = band_column(self.Kb, a)[self.J0]  # coupling K0a
+        W[self.pos[self.C], nA + np.arange(len(self.C))] = 1  # d_c = 0
+
+        D = np.zeros((r, r))
+        if nA:
+            D[:nA, :nA] = to_dense(reduce_banded(self.Kb, self.A))
+
+        self.W = W
+        self.Z = ldl_solve(self.factor, W) if self.factor is not None else W  # K0^-1 W
+        self.S = D - W.T @ self.Z
+        if np.linalg.matrix_rank(self.S) < r:
+            raise np.linalg.LinAlgError(
+                "Singular stiffness matrix : unstable structure"
+            )
+
+    # ------------------------------------------------------------------
+    ## Edits
+    def set_loads(self, span, loads):
+        """
+        span : index of the span (0 = first span)
+        loads : list of loads of this span
+        """
+        self.loads[span] = list(loads)
+        q = LoadTable.from_loads([self.loads[span]]).fixed_end_forces(
+            [self.spans[span]]
+        )[0]
+        self.Qf[2 * span : 2 * span + 4] += q - self.QF[span]
+        self.QF[span] = q
+
+    def set_support(self, node, support):
+        """
+        node : index of the node (0 = first node)
+        support : fixd=0, vert-scroll=1, pin=2, free=3
+        """
+        self.support_type[node] = support
+        self.border()
+
+    def set_nodal_force(self, R0):
+        self.R0[:] = R0
+
+    # ------------------------------------------------------------------
+    ## Solve
+    def solve(self):
+        """
+        return dy, R : np.array (ndof x 1) of nodal displacement and nodal force
+        """
+        f = self.R0 - self.Qf
+        x = (
+            ldl_solve(self.factor, f[self.J0])
+            if self.factor is not None
+            else np.zeros(0)
+        )
+
+        dy = np.zeros(self.ndof)
+        if self.W is not None:
+            g = np.concatenate([f[self.A], np.zeros(len(self.C))])
+            y = np.linalg.solve(self.S, g - self.W.T @ x)
+            x = x - self.Z @ y
+            dy[self.A] = y[: len(self.A)]
+        dy[self.J0] = x
+        dy[self.C] = 0
+
+        R = banded_dot(self.Kb, dy) + self.Qf
+        return dy.reshape(-1, 1), R.reshape(-1, 1)
+
+    # Same result as stiffness_matrix.analyze()
+    def result(self, tol=None):
+        dy, R = self.solve()
+        return analysis_result(
+            self.E,
+            self.I,
+            self.spans,
+            self.support_type,
+            self.R0,
+            self.elements,
+            LoadTable.from_loads(self.loads),
+            "banded",
+            self.Kb,
+            self.Qf.reshape(-1, 1),
+            self.QF,
+            dy,
+            R,
+            tol,
+        )
@@ -4,6 +4,45 @@ import numpy as np
 from rebar import Rebar
 
 
+# ShearReinforcement.beamTraverse() vectorized over Vu (and b, d, Av), no print
+def beam_traverse(b, d, Av, Vu, fc, fv, 𝜙v=0.85):
+    """
+    b, d : cm ; Av : cm2 ; Vu : kN (sign ignored) ; fc, fv : MPa
+    return dict of np.array
+        case : 1 Vu <= 𝜙Vc, 2 light shear, 3 moderate shear, 4 heavy shear (revise section)
+        𝜙Vc, 𝜙Vs : kN ; s_req, s_max : cm (s_max = 0 in case 4)
+        s : largest spacing allowed, cm (s_max in case 1, min(s_req, s_max) else, 0 in case 4)
+    """
+    Vu = np.abs(np.asarray(Vu, dtype=float))
+    𝜙Vc = 𝜙v * (np.sqrt(fc) / 6) * b * d * 1e-1  # kN
+    𝜙Vs = np.abs(Vu - 𝜙Vc)  # kN
+    with np.errstate(divide="ignore"):
+        s_req = (𝜙v * Av * fv * d / 𝜙Vs) * 1e-1  # cm
+
+    lg = (1 / 3) * 𝜙v * np.sqrt(fc) * b * d * 1e-1  # light shear, kN
+    hv = (2 / 3) * 𝜙v * np.sqrt(fc) * b * d * 1e-1  # heavy shear, kN
+    case = np.select([Vu <= 𝜙Vc, Vu <= 𝜙Vc + lg, Vu <= 𝜙Vc + hv], [1, 2, 3], 4)
+
+    s_max = np.select(
+        [case == 1, case == 2, case == 3],
+        [
+            np.minimum(np.minimum(3 * Av * fv / b, d / 2), 60),  # ACI 11.5.5.3;11-13
+            np.minimum(np.minimum(s_req, d / 2), 60),  # ACI 11.5.6.4;11-16
+            np.minimum(np.minimum(s_req, d / 4), 30),
+        ],
+        0.0,
+    )
+    s = np.where(case == 1, s_max, np.minimum(s_req, s_max))
+    return {
+        "case": case,
+        "𝜙Vc": 𝜙Vc,
+        "𝜙Vs": 𝜙Vs,
+        "s_req": s_req,
+        "s_max": s_max,
+        "s": s,
+    }
+
+
 class ShearCapacity:
     def __init__(self, fc, fv):
         self.fc = fc  # MPa
@@ -0,0 +1,71 @@
+## Stirrups and torsion reinforcement of a section, no prompt
+## The choices asked by input() in beam_design / Torsion.design() are replaced by rules :
+##   main bars : N = max(2, ceil(As / A)) of the given diameter
+##   stirrups  : single stirrup, double stirrup if s < s_min, s rounded down to 1 cm
+##   torsion   : only if Torsion.condition() finds a torsion effect
+## Used by batch_design and design_pipeline.
+
+import math
+
+import numpy as np
+
+from rebar import Rebar
+from shear import beam_traverse
+from torsion import Torsion
+
+rebar = Rebar()
+
+
+# Number of bars of diameter dia for As
+def bars(As, dia, n_min=2):
+    return max(n_min, math.ceil(As / rebar.A[str(dia)]))
+
+
+# Stirrup spacing : single stirrup, double stirrup below s_min
+def stirrup(spacing, dia, s_min):
+    """
+    spacing : function Av (cm2) --> s (cm)
+    return label, Av (cm2), s (cm)
+    """
+    for label, legs in (("Single stirrup", 2), ("Double stirrup", 4)):
+        Av = legs * rebar.A[str(dia)]
+        s = float(np.floor(spacing(Av)))
+        if s >= s_min:
+            break
+    return label, Av, s
+
+
+# Stirrups and torsion reinforcement of a section
+def shear_torsion(b, h, c, d, fc, fy, fv, Vu, Tu, trav, s_min=7.5):
+    """
+    b, h, c, d : cm ; Vu : kN ; Tu : kN-m ; trav : mm
+    return dict stirrup, Av (cm2), s (cm), torsion (bool), Al (cm2)
+    """
+
+    def spacing(Av):
+        return beam_traverse(b, d, Av, Vu, fc, fv)["s"].item()
+
+    if beam_traverse(b, d, 2 * rebar.A[str(trav)], Vu, fc, fv)["case"] == 4:
+        raise ValueError("Heavy shear --> Revised cross section")
+    label, Av, s = stirrup(spacing, trav, s_min)
+
+    Al = 0.0
+    torsion = Torsion(fc, fv, fy, fv, fy, Vu, Tu)
+    effect = Tu != 0
+    if effect:
+        Acp, Pcp = b * h, 2 * (b + h)
+        torsion.section_properties(b, h, c, d, trav)
+        effect = torsion.condition(Acp, Pcp)
+    if effect:
+        Avt_ratio = torsion.traverse_ratio(b)
+        label, Av, s = stirrup(
+            lambda Av: min(
+                torsion.traverse_spacing(b, Av * 1e2, Avt_ratio),
+                spacing(Av),
+            ),
+            trav,
+            s_min,
+        )
+        Al = torsion.longitudinal_reinf(b, Acp)
+
+    return {"stirrup": label, "Av": Av, "s": s, "torsion": bool(effect), "Al": Al}
@@ -6,9 +6,14 @@
 
 import numpy as np
 
-from utils import xi_coordinate
-from plot_curve import plot_combined
-from deflection import deflection
+from utils import xi_coordinate, adaptive_coordinate
+from banded import BAND, to_dense
+from plot_curve import plot_result
+from diagram import span_diagrams, extrema
+from element_table import ElementTable
+from dofs import DofMap
+from load_table import LoadTable
+from deflection import exact_deflection, max_deflection
 
 np.set_printoptions(precision=3)
 
@@ -20,17 +25,20 @@ class BeamB:
     """We define a beam section.
     E: Modulus of elasticity
     I: Inertia of the cross section
-    L: Span length"""
+    L: Span length
+    m: Mass per unit length, kg/m (modal analysis)"""
 
-    def __init__(self, E, I, L):
+    def __init__(self, E, I, L, m=0):
         """ATTRIBUTES:
         self.E: Modulus of elasticity
         self.I: Inertia of the cross section
         self.L: Span length
-        self.k: stiffness matrix of the span"""
+        self.k: stiffness matrix of the span
+        self.mass: consistent mass matrix of the span"""
         self.E = E
         self.I = I
         self.L = L
+        self.m = m
 
         # Element stiffness matrix
         self.k = (
@@ -47,6 +55,21 @@ class BeamB:
             )
         )
 
+        # Consistent mass matrix (cubic Hermite shape functions)
+        self.mass = (
+            m
+            * L
+            / 420
+            * np.array(
+                [
+                    [156, 22 * L, 54, -13 * L],
+                    [22 * L, 4 * L**2, 13 * L, -3 * L**2],
+                    [54, 13 * L, 156, -22 * L],
+                    [-13 * L, -3 * L**2, -22 * L, 4 * L**2],
+                ]
+            )
+        )
+
 
 ## Loads Name
 class Load:
@@ -115,24 +138,24 @@ class PointLoad(Load):
     # Shear force in a section (beam without supports)
     def FQ(self, x, L):
         """Contribution to the shear force in a section due to a point Load,
-        x: position of the section considered with respect to the extreme left
+        x: position of the section considered with respect to the extreme left,
+           scalar or np.array of sections
         L: span length"""
-        if self.a < x <= L:
-            return -self.P
-        else:
-            return 0
+        x = np.asarray(x, dtype=float)
+        return np.where((self.a < x) & (x <= L), -self.P, 0.0)
 
     # Bending moment in a section (simply supported beam)
     def MF(self, x, L):
         """Contribution to the bending moment in a section due to a punctual Load,
-        x: position of the section considered with respect to the extreme left
+        x: position of the section considered with respect to the extreme left,
+           scalar or np.array of sections
         L: span length"""
-        if 0 <= x < self.a:
-            return (1 - self.a / L) * self.P * x
-        elif x <= L:
-            return self.a * self.P * (1 - x / L)
-        else:
-            return 0
+        x = np.asarray(x, dtype=float)
+        return np.select(
+            [(0 <= x) & (x < self.a), x <= L],
+            [(1 - self.a / L) * self.P * x, self.a * self.P * (1 - x / L)],
+            0.0,
+        )
 
 
 # Distributed load
@@ -183,7 +206,7 @@ class DistributedLoad(Load):
                     [
                         1
                         - a**3 / L**4 * (2 * L - a)
-                        - b / L**4 * (2 * L**3 - 2 * b**2 * L + a**3)
+                        - b / L**4 * (2 * L**3 - 2 * b**2 * L + b**3)
                     ],
                     [
                         -L
@@ -201,35 +224,51 @@ class DistributedLoad(Load):
     # Shear force in a section (unsupported beam)
     def FQ(self, x, L):
         """Contribution to the shear force in a section due to the distributed load.
-        x: position of the section considered with respect to the extreme left
+        x: position of the section considered with respect to the extreme left,
+           scalar or np.array of sections
         L: Span length"""
-        if self.a <= x < self.a + self.l:
-            return -self.q * (x - self.a)
-        # elif x <= L:
-        #     return -self.q * self.l
-        elif x > self.a + self.l:
-            return -self.q * self.l
-        else:
-            return 0
+        x = np.asarray(x, dtype=float)
+        return np.select(
+            [x < self.a, x < self.a + self.l],
+            [0.0, -self.q * (x - self.a)],
+            -self.q * self.l,  # section at or beyond the end of the load
+        )
 
     # Bending moment in a section (simply supported beam)
     def MF(self, x, L):
         """Contribution to the shear force in a section due to the distributed load.
         x: position of the section considered with respect to the extreme left
         L: Span length"""
+        x = np.asarray(x, dtype=float)
         V1 = self.q * self.l / L * (L - self.a - self.l / 2)
         V2 = self.q * self.l - V1
-        if 0 <= x < self.a:
-            return V1 * x
-        elif x <= self.a + self.l:
-            return V1 * x - 0.5 * self.q * (x - self.a) ** 2
-        elif x <= L:
-            return V2 * (L - x)
-        else:
-            return 0
+        return np.select(
+            [(0 <= x) & (x < self.a), x <= self.a + self.l, x <= L],
+            [V1 * x, V1 * x - 0.5 * self.q * (x - self.a) ** 2, V2 * (L - x)],
+            0.0,
+        )
 
-    def Δx(self, x, L):
-        pass
+    # Deflection in a section (simply supported beam)
+    def Δx(self, x, L, EI=1):
+        """Deflection in a section due to the distributed load, Up+.
+        EI y'' = M  -->  EI y = V1 x^3/6 - q<x-a>^4/24 + q<x-a-l>^4/24 + C1 x
+        x: position of the section considered with respect to the extreme left,
+           scalar or np.array of sections
+        L: Span length
+        EI: flexural rigidity, EI=1 returns EI*Δ"""
+        x = np.asarray(x, dtype=float)
+        q = self.q
+        V1 = q * self.l / L * (L - self.a - self.l / 2)
+
+        def EIy(x):
+            return (
+                V1 * x**3 / 6
+                - q / 24 * np.maximum(x - self.a, 0) ** 4
+                + q / 24 * np.maximum(x - self.a - self.l, 0) ** 4
+            )
+
+        C1 = -EIy(L) / L  # y(0) = y(L) = 0
+        return (EIy(x) + C1 * x) / EI
 
 
 # Concentrated moment
@@ -277,7 +316,7 @@ class MomentConcentrated(Load):
     def FQ(self, x, L):
         """Contribution to the shear force in a section due to the distributed load.
         x: position of the section considered with respect to the extreme left"""
-        return 0
+        return np.zeros_like(np.asarray(x, dtype=float))
 
     # Bending moment in a section (simply supported beam)
     def MF(self, x, L):
@@ -285,81 +324,32 @@ class MomentConcentrated(Load):
         These values correspond to that of a simply supported beam.
         x: position of the section considered with respect to the extreme left
         L: Span length"""
-        if 0 <= x < self.a:
-            return self.M / L * x
-        elif self.a < x <= L:
-            return self.M * (x / L - 1)
-        else:
-            return 0
+        x = np.asarray(x, dtype=float)
+        return np.select(
+            [(0 <= x) & (x < self.a), x <= L],
+            [self.M / L * x, self.M * (x / L - 1)],
+            0.0,
+        )
 
 
-# =========================================================================================
-# Method
-## Assembly displacement matrix : di = ['d1y', 'θ1', 'd2y', 'θ2', 'd3y', 'θ3',...]
-def nodal_displacement(list_of_suport):
-    # "0" : "Embedement",
-    # "1" : "Allows vertical scroll",
-    # "2" : "Allow rotation but no scroll",
-    # "3" : "Cantilever"
-    d = []
-    for i in range(0, len(list_of_suport)):
-        if list_of_suport[i] == 0:  # fixed
-            d.append(0)
-            d.append(0)
-        elif list_of_suport[i] == 1:  # vert-scroll
-            d.append("d" + str(i + 1))
-            d.append(0)
-        elif list_of_suport[i] == 2:  # pin
-            d.append(0)
-            d.append("θ" + str(i + 1))
-        elif list_of_suport[i] == 3:  # free
-            d.append("d" + str(i + 1))
-            d.append("θ" + str(i + 1))
-        else:
-            pass
-
-    print(f"\nAssembly Nodal Displacement \nd = {d}")
-    return d
-
-
-## Assembly reaction matrix : R = ['F1y', 'M1', 'F2y', 'M2', 'F3y', 'M3',...]
-def nodal_external_force(list_of_suport, R0):
-    R = []
-    for i in range(0, len(list_of_suport)):
-        if list_of_suport[i] == 0:  # fixed
-            R.append("F" + str(i + 1))
-            R.append("M" + str(i + 1))
-        elif list_of_suport[i] == 1:  # vert-roller
-            R.append(0)
-            R.append("M" + str(i + 1))
-        elif list_of_suport[i] == 2:  # pinned
-            R.append("F" + str(i + 1))
-            R.append(0)
-        elif list_of_suport[i] == 3:  # free
-            R.append(0)
-            R.append(0)
+## Load objects from a LoadTable (inverse of LoadTable.from_loads)
+def table_to_loads(table, num_of_spans):
+    loads = [[] for i in range(num_of_spans)]
+    for i, t, v, a, l in zip(table.span, table.type, table.value, table.a, table.l):
+        if t == 0:
+            loads[i].append(PointLoad(v, a))
+        elif t == 1:
+            loads[i].append(DistributedLoad(v, a, l))
         else:
-            pass
+            loads[i].append(MomentConcentrated(v, a))
+    return loads
 
-    if len(R0) != 0:
-        for i in range(0, len(R)):
-            if R0[i] != 0:
-                R[i] = R0[i]
 
-    print(f"\nAssembly Nodal Reaction \nR = {R}")
-    return R
-
-
-## Stiffness matrix
-## Assembly of the global stiffness matrix
-def global_stiffness(nodes, spans, stretch):
-    K = np.zeros((2 * nodes, 2 * nodes))
-    for i in range(len(spans)):
-        K[2 * i : 2 * i + 4, 2 * i : 2 * i + 4] += stretch[i].k
-    print(f"[CALCULATE] Stiffness matrix : K")
-    print(f"{K}")
-
-    return K
+# =========================================================================================
+# Method
+## Index of unknown displacement in ['d1y', 'θ1', 'd2y', 'θ2', ...] (same order as DofMap.displacement_labels)
+def free_dofs(list_of_suport):
+    return DofMap(list_of_suport).J
 
 
 ## Fixed-End Force
@@ -376,241 +366,286 @@ def local_FEF(b, loads, stretch):  # b = Number of stretchs or bars
     return QF
 
 
-## Assembly the global fixed-end force
-def global_FEF(nodes, spans, QF):
-    Qf = np.zeros((2 * nodes, 1))
-    for i in range(len(spans)):
-        Qf[2 * i : 2 * i + 4, :] += QF[i]
-    print(f"\n[CALCULATE] Global Fixend Force(Qf), N")
-    print(f"{Qf}")
-    return Qf
-
-
-# Calculated unknown nodal displacement
-"""
-If we know R, we don't know d.
-If we know d, we don't know R.
-[Ri] = [Ki][di]+[Qfi]
-R = ['0', '0', 'F2y', '0', 'F3y', 'M3', ...] --example
-d = ['d1', 'θ1', '0', 'θ2', '0', '0', ...] --example
-calculate d1, θ1, θ2,... exclude known == 0, 0, ...
-"""
-
-
-# Calculate nodal displacement
-def displacement(d, K, Qf, R):
-    """
-    d : list of displacement vector
-    K : np.array of global stiffness
-    Qf : np.array of global FEF
-    R = list of nodal external force/reaction
-    """
-    # If all fixed support
-    if all(value == 0 for value in d):
-        di = np.array(d)
-    else:
-
-        # index of unknowm displacement
-        J = np.where(np.array(d) != "0")[0].tolist()
-
-        # index of reaction matched unknowm displacement
-        I = J
-
-        R1 = np.zeros((len(J), 1), dtype=float)  # --->Matrix [Ri]
-
-        # Assembly Ki matched index
-        K1 = np.zeros((len(I), len(J)))
-        for i in range(0, len(I)):
-            for j in range(0, len(J)):
-                K1[i][j] = K[I[i]][J[j]]  # --->Matrix [Ki]
+# Shear force at the sections of each stretch, N
+def shear_values(spans, stretch, loads, F, Xt=None):
+    if Xt is None:
+        numS, Xt = xi_coordinate(spans)
+    Shears = []
+    for i in range(len(spans)):  # for each stretch
+        # Shear like unsupported beams(Internal Shear)
+        Q0 = np.zeros(len(Xt[i]))
+        for j in range(len(loads[i])):  # consider all the loads of each stretch
+            Q0 += loads[i][j].FQ(Xt[i], stretch[i].L)  # all sections at once
 
-        # Assembly Qfi index
-        Q01 = []
-        for item in I:
-            q01 = [Qf[item][0]]
-            Q01.append(q01)
-        Q01 = np.array(Q01)  # --->Matrix [Qfi]
+        # Shear at the extreme left, obtained from the calculation
+        Q1 = F[i][0]
 
-        # Assembly R index
-        for i in range(0, len(I)):
-            R1[i][0] = R[I[i]]
+        # Total shear
+        Shears.append(Q0 + Q1)
 
-        # Calculate displacement
-        # [di] = inv[Ki][Ri]+(-1*[Qfi])
-        K1 = np.linalg.inv(K1)  # inverse[K1]
+    return Shears
 
-        # unknown displacement
-        di = np.dot(K1, R1 + (-1 * Q01))  # dot matrix
 
-    return di  # disp = m, θ = radian
+# Bending moment at the sections of each stretch (sagging +), N-m
+def moment_values(spans, stretch, loads, F, Xt=None):
+    if Xt is None:
+        numS, Xt = xi_coordinate(spans)
+    Moments = []
+    for i in range(len(spans)):  # for each stretch
+        # Moments like stretchs simply supported
+        M0 = np.zeros(len(Xt[i]))
+        for j in range(len(loads[i])):  # consider all the loads of each stretch
+            M0 += loads[i][j].MF(Xt[i], stretch[i].L)  # all sections at once
 
+        # Moments due to embedment or continuity of the beam
+        M1 = -F[i][1] + (F[i][3] + F[i][1]) / stretch[i].L * Xt[i]
 
-# Calculated Nodal Force
-# [R] = [K][d] + [Qf]
-def reaction(d, di, K, Qf):
-    # If all fixed support
-    if all(value == 0 for value in d):
-        dy = np.array(d).reshape(-1, 1)
+        # Total moment
+        Moments.append(M0 + M1)
 
-        # Calculated nodal reaction
-        R = Qf  # dot matrix
-    else:
-        # index of d where di will be added
-        ii = np.where(np.array(d) != "0")[0].tolist()
+    return Moments
 
-        # added di to displacement d-matrix
-        for i in range(len(ii)):
-            d[ii[i]] = di[i][0]
 
-        # Convert to array(ix1)
-        dy = np.array(d).reshape(-1, 1)
+# =========================================================================================
+## Headless analysis : no print, no plot
+class AnalysisResult:
+    """Result of analyze(), units N, m, rad (E in GPa as given).
+    spans, support_type, R0, Ltotal : input
+    elements : element_table.ElementTable, stretch : BeamB of each span (on demand)
+    K : global stiffness (band storage if solver == "banded"), Qf : global FEF
+    dy, R : np.array (ndof x 1) of nodal displacement and nodal force
+    QF : np.array (num_of_spans x 4) of local FEF, F : np.array (num_of_spans x 4) of end forces
+    Xt : list of stations of each span, X : np.array of stations along the beam
+    V, M : np.array at X (M sagging +), deflection : np.array at X, m (Up+, exact)
+    shear, moment : list of diagram.PiecewisePolynomial per span
+    maxShear, XmaxQ, minShear, XminQ : np.array per span (exact extrema)
+    maxMoment, XmaxM, minMoment, XminM : np.array per span (sagging +)
+    maxDeflection, XmaxD : np.array per span, largest deflection (signed) and location
+    """
 
-        # Calculated nodal reaction
-        R = np.dot(K, dy) + Qf  # dot matrix
+    def __init__(
+        self,
+        E,
+        I,
+        spans,
+        support_type,
+        R0,
+        elements,
+        solver,
+        K,
+        Qf,
+        QF,
+        dy,
+        R,
+        F,
+        Xt,
+        V,
+        M,
+        deflection,
+        shear,
+        moment,
+    ):
+        self.E = E
+        self.I = I
+        self.spans = list(spans)
+        self.support_type = list(support_type)
+        self.R0 = R0
+        self.elements = elements
+        self.Ltotal = float(sum(self.spans))
+        self.solver = solver
+
+        self.K = K
+        self.Qf = Qf
+        self.QF = QF
+        self.dy = dy
+        self.R = R
+        self.F = F
+
+        self.Xt = Xt
+        offset = np.concatenate([[0], np.cumsum(self.spans)[:-1]])
+        self.X = np.concatenate(Xt) + np.repeat(offset, [len(x) for x in Xt])
+        self.V = V
+        self.M = M
+        self.deflection = deflection
 
-    print(f"[CALCULATE] Nodal Displacement, [d] : d1, θ1, d2, θ2, ...:")
-    print(f"{dy} m, radian, m, radian,...")
+        self.shear = shear
+        self.moment = moment
+        self.maxShear, self.XmaxQ, self.minShear, self.XminQ = (
+            np.array(v) for v in extrema(shear)
+        )
+        self.maxMoment, self.XmaxM, self.minMoment, self.XminM = (
+            np.array(v) for v in extrema(moment)
+        )
+        self.maxDeflection, self.XmaxD = max_deflection(
+            np.split(self.deflection, np.cumsum([len(x) for x in Xt])[:-1]), Xt
+        )
 
-    print(f"\n[CALCULATE] Nodal Force, [R] : F1, M1, F2, M2, ... :")
-    print("[R] = [K][d] + [Qf]")
-    print(f"{R/1000} kN, kN-m, kN, kN-m,...")
+    # BeamB of each span, for the consumers written for main()
+    @property
+    def stretch(self):
+        e = self.elements
+        return [BeamB(E, I, L, m) for E, I, L, m in zip(e.E, e.I, e.L, e.m)]
 
-    return dy, R
+    def __str__(self):
+        return (
+            f"Analysis result : {len(self.spans)} spans, {len(self.X)} stations, "
+            f"Vmax = {self.maxShear.max()/1000:.2f} kN, Mmax = {self.maxMoment.max()/1000:.2f} kN-m, "
+            f"Mmin = {self.minMoment.min()/1000:.2f} kN-m"
+        )
 
 
-# Calculated internal force
-def internal_force(dy, b, QF, stretch):
+def analyze(E, I, spans, support_type, loads, R0=None, solver="banded", tol=None):
     """
-    dy : np.array of displacement
-    b : spans q'ty
-    QF : local FEF
+    Same input as main(), no print and no figure.
+    loads : list of loads in each stretch or LoadTable
+    solver : "banded" (band storage + LDL^T) or "dense" (np.linalg.solve)
+    tol : None --> 1000 stations per span, else adaptive stations (N-m)
+    return AnalysisResult
     """
-    # Nodal displacements by stretch
-    u = []
-    for i in range(b):
-        u.append(dy[2 * i : 2 * i + 4, :])
-        # print(f"Local displacement: span {i+1} = {u[-1]} m, radian, m, radian,...")
-
-    # Forces in each stretch
-    # [Fi] = [ki][ui]+[QFi]
-    F = []
-    for i in range(b):
-        F.append(stretch[i].k @ u[i] + QF[i])
-        # print(f"Loacal force span {i+1} = {F[-1]} N, N-m, N, N-m,...")
+    # Spans and loads as arrays
+    elements = ElementTable(E, I, spans)
+    table = loads if isinstance(loads, LoadTable) else LoadTable.from_loads(loads)
+    ndof = elements.ndof
+
+    # Stiffness, FEF and known nodal force
+    Kb = elements.banded()
+    QF = table.fixed_end_forces(spans)
+    Qf = elements.scatter(QF).reshape(-1, 1)
+
+    Ro = np.zeros((ndof, 1))
+    if R0 is not None and len(R0) != 0:
+        Ro[:, 0] = R0
+
+    # [di] = [Ki]^-1 ([Ri] - [Qfi]), reactions on the constrained rows only
+    dofs = DofMap(support_type)
+    banded = solver == "banded"
+    K = Kb if banded else to_dense(Kb)
+    dy = dofs.displacement(K, Qf, Ro, banded)
+    R = dofs.reaction(K, dy, Qf, Ro, banded)
+
+    return analysis_result(
+        E, I, spans, support_type, R0, elements, table, solver, K, Qf, QF, dy, R, tol
+    )
 
-    return u, F
 
+# End forces and diagrams of a solved beam
+def analysis_result(
+    E, I, spans, support_type, R0, elements, table, solver, K, Qf, QF, dy, R, tol=None
+):
+    """
+    elements : ElementTable, table : LoadTable
+    Qf, dy, R : np.array (ndof x 1), QF : np.array (num_of_spans x 4)
+    return AnalysisResult
+    """
+    # [Fi] = [ki][ui] + [QFi] of all spans at once
+    u, F = elements.end_forces(dy, QF)
 
-# Calculate shear force values
-def shears(spans, stretch, loads, F):
-    numS, Xt = xi_coordinate(spans)
-    Shears = []
-    for i in range(len(spans)):  # for each stretch
-        # Shear like unsupported beams(Internal Shear)
-        Q0 = np.zeros(numS)
-        for j in range(len(loads[i])):  # consider all the loads of each stretch
-            m = 0  # para enumerar las secciones
-            for x in Xt[i]:  # to list the sections
-                Q0[m] += loads[i][j].FQ(x, stretch[i].L)  # Calculate Qi given xi
-                m += 1
+    # Diagrams at the stations
+    if tol is None:
+        numS, Xt = xi_coordinate(spans)
+    else:
+        numS, Xt = adaptive_coordinate(spans, table, tol)
 
-        # Shear at the extreme left, obtained from the calculation
-        Q1 = F[i][0]
+    V = np.concatenate(table.shear_values(spans, F, Xt))
+    M = np.concatenate(table.moment_values(spans, F, Xt))
+    delta = np.concatenate(
+        exact_deflection(spans, table, F, dy, elements.E * elements.I, Xt)
+    )
+    shear, moment = span_diagrams(spans, table, F)
 
-        # Total shear
-        Shears.append(Q0 + Q1)
+    return AnalysisResult(
+        E,
+        I,
+        spans,
+        support_type,
+        R0,
+        elements,
+        solver,
+        K,
+        Qf,
+        QF,
+        dy,
+        R,
+        F,
+        Xt,
+        V,
+        M,
+        delta,
+        shear,
+        moment,
+    )
 
-    # Maximum and minimum shear force values (in each stretch)
-    maxShear = []  # Maximum shear for each stretch
-    minShear = []  # Minimal shear for each stretch
-    XmaxQ = []  # locations of the maxima in each stretch
-    XminQ = []  # locations of the minimum in each stretch
 
-    print(f"\nSHEAR")
-    for i in range(len(spans)):
-        maxQ = max(Shears[i])  # Máximo Shearnte
-        minQ = min(Shears[i])  # Mínimo Shearnte
-        print(f"Span {i+1} : maxQ = {maxQ/1000:.2f}, minQ = {minQ/1000:.2f} ,kN")
-
-        maxShear.append(maxQ)
-        minShear.append(minQ)
-        indMaxQ = np.where(Shears[i] == maxQ)[0][0]  # index of maximum shear
-        indMinQ = np.where(Shears[i] == minQ)[0][0]  # index of minimum shear
-        XmaxQ.append(Xt[i][indMaxQ])  # location of maximum shear
-        XminQ.append(Xt[i][indMinQ])  # location of minimum shear
-        print(f"At location x = {Xt[i][indMaxQ]:.2f}, {Xt[i][indMinQ]:.2f} ,m")
-
-    # Shear Force Values for Charts
-    DFQ = []
-    for i in range(len(spans)):
-        # Values for list type DFQ
-        # Shear = (Shears[i]).tolist() # We go to kN and we convert to list, N
-        Shear = (Shears[i] / 1000).tolist()  # We go to kN and we convert to list, kN
-        DFQ += Shear
+# Print the result as main() does
+def report(result):
+    if result.solver == "banded":
+        print(f"[CALCULATE] Stiffness matrix (band storage, bandwidth {BAND + 1}) : Kb")
+    else:
+        print(f"[CALCULATE] Stiffness matrix : K")
+    print(f"{result.K}")
 
-    return DFQ, maxShear, minShear, XmaxQ, XminQ
+    print(f"\n[CALCULATE] Global Fixend Force(Qf), N")
+    print(f"{result.Qf}")
 
+    # Known/unknown nodal force and displacement
+    # "0" : "Embedement", "1" : "Allows vertical scroll",
+    # "2" : "Allow rotation but no scroll", "3" : "Cantilever"
+    dofs = DofMap(result.support_type)
+    R0 = [] if result.R0 is None else result.R0
+    print(f"\nAssembly Nodal Reaction \nR = {dofs.force_labels(R0)}")
+    print(f"\nAssembly Nodal Displacement \nd = {dofs.displacement_labels()}")
 
-# Calculate bending moment values
-def moments(spans, stretch, loads, F):
-    numS, Xt = xi_coordinate(spans)
-    Moments = []
-    for i in range(len(spans)):  # for each stretch
-        # Moments like stretchs simply supported
-        M0 = np.zeros(numS)
-        for j in range(len(loads[i])):  # consider all the loads of each stretch
-            m = 0  # to list the sections
-            for x in Xt[i]:  # go through the sections
-                M0[m] += loads[i][j].MF(x, stretch[i].L)
-                m += 1
+    print(f"\nCalculated Nodal Force and Displacement")
+    print(f"[CALCULATE] Nodal Displacement, [d] : d1, θ1, d2, θ2, ...:")
+    print(f"{result.dy} m, radian, m, radian,...")
 
-        # Moments due to embedment or continuity of the beam
-        M1 = -F[i][1] + (F[i][3] + F[i][1]) / stretch[i].L * Xt[i]
+    print(f"\n[CALCULATE] Nodal Force, [R] : F1, M1, F2, M2, ... :")
+    print("[R] = [K][d] + [Qf]")
+    print(f"{result.R/1000} kN, kN-m, kN, kN-m,...")
 
-        # Total moment
-        Moments.append(M0 + M1)
+    print(f"\nSHEAR")
+    for i in range(len(result.spans)):
+        print(
+            f"Span {i+1} : maxQ = {result.maxShear[i]/1000:.2f}, minQ = {result.minShear[i]/1000:.2f} ,kN"
+        )
+        print(f"At location x = {result.XmaxQ[i]:.2f}, {result.XminQ[i]:.2f} ,m")
 
-    # Maximum and minimum bending moment values (in each stretch)
-    maxMoment = []  # Maximum moment in each stretch
-    minMoment = []  # Minimum moment in each stretch
-    XmaxF = []  # locations of maximum moments by stretch
-    XminF = []  # locations of the minimum moments by stretch
     print(f"\nMOMENT")
-    for i in range(len(spans)):
-        maxF = max(Moments[i])  # Máximo flector
-        minF = min(Moments[i])  # Mínimo flector
-        print(f"Span {i+1} : maxF = {maxF/1000:.2f}, minF = {minF/1000:.2f} ,kN-m")
-
-        maxMoment.append(-maxF)
-        minMoment.append(-minF)
-        indMaxF = np.where(Moments[i] == maxF)[0][0]  # index of maximum bending
-        indMinF = np.where(Moments[i] == minF)[0][0]  # index of minimum bending
-        XmaxF.append(Xt[i][indMaxF])  # location of maximum bending
-        XminF.append(Xt[i][indMinF])  # location of minimum bending
-        print(f"At location x = {Xt[i][indMaxF]:.2f}, {Xt[i][indMinF]:.2f} ,m")
-
-    # Bending moment values for graphs
-    DMF = []
-    for i in range(len(spans)):
-        Flex = (-1 * Moments[i] / 1000).tolist()  # ***
-        DMF += Flex
+    for i in range(len(result.spans)):
+        print(
+            f"Span {i+1} : maxF = {result.maxMoment[i]/1000:.2f}, minF = {result.minMoment[i]/1000:.2f} ,kN-m"
+        )
+        print(f"At location x = {result.XmaxM[i]:.2f}, {result.XminM[i]:.2f} ,m")
 
-    return DMF, maxMoment, minMoment, XmaxF, XminF
+    print(f"\nDEFLECTION")
+    for i in range(len(result.spans)):
+        print(
+            f"Span {i+1} : Δmax = {result.maxDeflection[i]*1000:.2f} mm at x = {result.XmaxD[i]:.2f} m"
+        )
 
 
 # =========================================================================================
 #### E, I, spans, support, loads, R
-def main(E, I, spans, support_type, loads, R0):
+def main(E, I, spans, support_type, loads, R0, solver="banded", tol=None):
     """
-    E in GPa
-    I in m4
+    E in GPa, scalar or one value per span
+    I in m4, scalar or one value per span (cracked section, haunch, ...)
     spans :  list of length of each span in meters
     support_type : list of support type
     loads : list of loads
     R0 : list of nodal external loads
+    solver : "banded" (band storage + LDL^T) or "dense" (np.linalg.solve),
+             same default as analyze()
+    tol : None --> 1000 stations per span, else adaptive stations with
+          moment interpolation error tol (N-m)
     """
     print("[INFO]  PROPERTIES :")
-    print(f"Es = {E*1e3:.2f} MPa, I = {I*1e8:.2f} cm4")
+    Ei = np.broadcast_to(np.asarray(E, dtype=float), (len(spans),))
+    Ii = np.broadcast_to(np.asarray(I, dtype=float), (len(spans),))
+    if np.ndim(E) == 0 and np.ndim(I) == 0:
+        print(f"Es = {E*1e3:.2f} MPa, I = {I*1e8:.2f} cm4")
+    else:
+        print(f"Es = {Ei*1e3} MPa, I = {Ii*1e8} cm4")
 
     # ----------------------------------------------------
     print(f"\n[INFO] GEOMETRY :")
@@ -646,7 +681,7 @@ def main(E, I, spans, support_type, loads, R0):
     # BeamB(Elasticity, Inertia, Length) for each stretch
     stretch = []
     for i in range(len(spans)):
-        st = BeamB(E, I, spans[i])
+        st = BeamB(Ei[i], Ii[i], spans[i])
         print(f"K{i+1}")
         print(f"{st.k}")
         stretch.append(st)
@@ -665,66 +700,13 @@ def main(E, I, spans, support_type, loads, R0):
         print(f"Load in stretch {i+1} : ")
         print(*loads[i], sep="\n")
 
-    # Number of stretchs or bars
-    num_of_spans = len(stretch)
-
-    # Number of nodes
-    nodes = num_of_spans + 1
-
-    # Total length of the beam
-    Ltotal = 0
-    for i in range(num_of_spans):
-        Ltotal += stretch[i].L
-
-    # ----------------------------------------------------
-    ## Calculationa
-    # Assembly Global Stiffness, K
-    K = global_stiffness(nodes, spans, stretch)
-
-    # Calculate and assembly Fixed End Force (FEF)
-    QF = local_FEF(num_of_spans, loads, stretch)
-    Qf = global_FEF(nodes, spans, QF)
-
-    # Create displacement matrix & reaction matrix
-    Ro = nodal_external_force(support_type, R0)  # list
-    d = nodal_displacement(support_type)  # list
-
-    # Calculate unknown displacement
-    di = displacement(d, K, Qf, Ro)
-
-    print(f"\nCalculated Nodal Force and Displacement")
-    dy, R = reaction(d, di, K, Qf)
-
-    # Calculate local displacement and local force
-    u, F = internal_force(dy, num_of_spans, QF, stretch)
-
     # ----------------------------------------------------
-    # Calculate shears coordinate for plotting
-    shearDFQ, maxShear, minShear, XmaxQ, XminQ = shears(spans, stretch, loads, F)
+    ## Calculation : pure compute, report and plot are consumers of the result
+    result = analyze(E, I, spans, support_type, loads, R0, solver, tol)
 
-    ###### Calculate moments coordinate for plotting
-    momentDMF, maxMoment, minMoment, XmaxF, XminF = moments(spans, stretch, loads, F)
+    report(result)
 
-    deflectionDFQ = deflection(
-        spans, dy.flatten().tolist(), Qf.flatten().tolist(), E, I
-    )
-
-    fig = plot_combined(
-        spans,
-        Ltotal,
-        stretch,
-        shearDFQ,
-        momentDMF,
-        maxShear,
-        minShear,
-        XmaxQ,
-        XminQ,
-        maxMoment,
-        minMoment,
-        XmaxF,
-        XminF,
-        deflectionDFQ,
-    )
+    fig = plot_result(result)
 
     print(
         "========================================================================================="
@@ -0,0 +1,138 @@
+## Stirrup zones from the whole shear diagram
+## Every span is cut in cells of length step; the spacing allowed in a cell is
+## shear.beam_traverse() (the four ACI cases of beamTraverse) at the largest |Vu|
+## of the cell. A zone [i, j) uses the smallest allowed spacing of its cells,
+## rounded down to the construction increment, and needs ceil(length / s) stirrups.
+## Dynamic programming over the cell boundaries gives the least stirrups for
+## 1 ... max_zones zones; the fewest zones within tol of that least steel is kept.
+##   best[k][j] = min_i best[k-1][i] + n(i, j)
+
+import numpy as np
+import pandas as pd
+
+from design_pipeline import envelope_of, station_span
+from rebar import Rebar
+from shear import beam_traverse
+
+rebar = Rebar()
+
+
+# Largest |Vu| of every cell [g_i, g_i+1] of one span
+def cell_shear(x, V, grid):
+    """
+    x, V : stations of the span (m) and |Vu|, grid : cell boundaries, m
+    return np.array (len(grid) - 1)
+    """
+    ends = np.interp(grid, x, V)
+    Vc = np.maximum(ends[:-1], ends[1:])
+    cell = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(Vc) - 1)
+    np.maximum.at(Vc, cell, V)
+    return Vc
+
+
+# Least number of stirrups of a span for 1 ... max_zones zones
+def zoning(grid, s_cell, increment=2.5, s_min=5.0, max_zones=5):
+    """
+    grid : cell boundaries, m ; s_cell : spacing allowed in every cell, cm
+    return count : np.array (max_zones) of least stirrups (inf = not feasible)
+           zones : list, for every number of zones, list of (i, j, s, n) of the zones
+                   (empty if not feasible)
+    """
+    n = len(s_cell)
+
+    # Spacing and stirrups of every zone [i, j), j > i
+    s = np.full((n + 1, n + 1), np.nan)
+    for i in range(n):
+        s[i, i + 1 :] = np.minimum.accumulate(s_cell[i:])
+    s = np.floor(s / increment) * increment  # cm
+    length = (grid[None, :] - grid[:, None]) * 100  # cm
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost = np.where(s >= s_min, np.ceil(length / s - 1e-9), np.inf)
+    cost[np.tril_indices(n + 1)] = np.inf
+
+    # best[k, j] : least stirrups on [0, j) with k + 1 zones
+    best = np.full((max_zones, n + 1), np.inf)
+    back = np.zeros((max_zones, n + 1), dtype=int)
+    best[0] = cost[0]
+    for k in range(1, max_zones):
+        total = best[k - 1][:, None] + cost
+        back[k] = total.argmin(axis=0)
+        best[k] = total.min(axis=0)
+
+    zones = []
+    for k in range(max_zones):
+        if not np.isfinite(best[k, n]):
+            zones.append([])
+            continue
+        j, path = n, []
+        for kk in range(k, -1, -1):
+            i = back[kk, j] if kk > 0 else 0
+            path.append((i, j, s[i, j], int(cost[i, j])))
+            j = i
+        zones.append(path[::-1])
+    return best[:, n], zones
+
+
+def stirrup_zoning(
+    source,
+    spans,
+    b,
+    h,
+    fc=24,
+    fv=235,
+    c=3,
+    main=16,
+    trav=9,
+    legs=2,
+    increment=2.5,
+    s_min=5.0,
+    max_zones=5,
+    tol=0.05,
+    step=0.05,
+):
+    """
+    source : AnalysisResult, pattern_envelope() dict or dict X, V, M (N, N-m)
+    spans : m ; b, h, c : cm ; fc, fv : MPa ; main, trav : mm
+    legs : legs of a stirrup (2 single, 4 double)
+    increment : construction increment of the spacing, cm ; s_min : smallest spacing, cm
+    max_zones : most zones per span ; tol : extra steel accepted for fewer zones
+    step : length of the cells, m
+    return pd.DataFrame, one row per zone
+        span, zone, x0, x1 (in the span, m), s (cm), n (stirrups), case (governing ACI case)
+    """
+    env = envelope_of(source)
+    spans = np.asarray(spans, dtype=float)
+    d = h - (c + trav / 10 + main / 10 / 2)  # cm, as Beam.eff_depth()
+    Av = legs * rebar.A[str(trav)]  # cm2
+    V = np.maximum(np.abs(env["Vmax"]), np.abs(env["Vmin"])) / 1000  # kN
+    span = station_span(env["X"], spans)
+    start = np.cumsum(spans) - spans
+
+    # Cells of all spans, one pass through the ACI cases
+    grids, cells = [], []
+    for j, L in enumerate(spans):
+        on = span == j
+        grid = np.linspace(0, L, max(1, int(np.ceil(L / step))) + 1)
+        grids.append(grid)
+        cells.append(cell_shear(env["X"][on] - start[j], V[on], grid))
+    traverse = beam_traverse(b, d, Av, np.concatenate(cells), fc, fv)
+    s_cell = np.where(traverse["case"] < 4, traverse["s"], 0.0)
+    case = traverse["case"]
+    split = np.cumsum([len(v) for v in cells])[:-1]
+
+    rows = []
+    for j, (grid, s_j, case_j) in enumerate(
+        zip(grids, np.split(s_cell, split), np.split(case, split))
+    ):
+        count, zones = zoning(grid, s_j, increment, s_min, max_zones)
+        if not np.isfinite(count.min()):
+            raise ValueError(
+                f"Span {j + 1} : spacing < {s_min} cm --> Revised cross section or stirrups"
+            )
+        k = np.flatnonzero(count <= (1 + tol) * count.min())[0]
+        for z, (i0, i1, s, n) in enumerate(zones[k]):
+            rows.append((j, z, grid[i0], grid[i1], s, n, case_j[i0:i1].max()))
+
+    df = pd.DataFrame(rows, columns=["span", "zone", "x0", "x1", "s", "n", "case"])
+    df["Av"] = Av
+    return df
@@ -94,23 +94,39 @@ class Torsion:
             else:
                 print("Please revise section")
 
-    def traverse(self, bw, a=45):
+    # Traverse ratio for shear and torsion, mm2/mm
+    def traverse_ratio(self, bw, a=45):
         """
         Av : shear reinf.
         At : torsion reinf.
-        Al : longitudinal tensile reinf.
         Avt : torsion-shear reinf.
         """
         𝜙Tn = self.Tu
         bw = bw * 10  # mm
         Ao = self.Ao * 1e2  # mm2
 
-        # Traverse for shear and torsion
         Av_ratio = bw / (3 * self.fy)  # mm2/mm
         self.At_ratio = (𝜙Tn * np.tan(a) * 1e6) / (
             self.𝜙v * 2 * Ao * self.fyv
         )  # mm2/mm
-        Avt_ratio = 2 * self.At_ratio + Av_ratio  # mm2/mm
+        return 2 * self.At_ratio + Av_ratio  # mm2/mm
+
+    # Spacing of the torsion-shear traverse, cm
+    def traverse_spacing(self, bw, Avt, Avt_ratio):
+        """
+        Avt : area of the stirrup legs, mm2
+        """
+        s_avt = (Avt / Avt_ratio) / 10  # cm
+        return min(s_avt, (3 * Avt * self.fyv / (bw * 10)) / 10, self.Ph / 8, 30)  # cm
+
+    def traverse(self, bw, a=45):
+        """
+        Av : shear reinf.
+        At : torsion reinf.
+        Al : longitudinal tensile reinf.
+        Avt : torsion-shear reinf.
+        """
+        Avt_ratio = self.traverse_ratio(bw, a)  # mm2/mm
 
         while True:
             print(f"\nRe-Design Traverse : ")
@@ -124,8 +140,7 @@ class Torsion:
                 Avt = 4 * As * 1e2  # mm2
                 label = "Double stirrup"
 
-            s_avt = (Avt / Avt_ratio) / 10  # cm
-            smax = min(s_avt, (3 * Avt * self.fyv / bw) / 10, self.Ph / 8, 30)  # cm
+            smax = self.traverse_spacing(bw, Avt, Avt_ratio)  # cm
 
             print(f"smax = min(s_avt, 3*Avt*fyv/bw, Ph / 8, 30) = {smax:.2f} cm")
 
@@ -2,6 +2,8 @@ import re
 import numpy as np
 from tabulate import tabulate
 
+from load_table import LoadTable, POINT, DISTRIBUTED, MOMENT
+
 
 def toNumpy(x):
     x = re.findall(r"[-+]?(?:\d*\.\d+|\d+)", x)
@@ -59,12 +61,63 @@ def convert_input_to_list(input_string):
 
 
 # Assembly X-coordinate
-def xi_coordinate(spans):
-    numS = 1000  # Number of points per span
+def xi_coordinate(spans, numS=1000):
+    # numS : Number of points per span
     Xt = [np.linspace(0, span, numS) for span in spans]
     return numS, Xt
 
 
+# Adaptive X-coordinate
+def adaptive_coordinate(spans, loads, tol=10, support_width=0, min_points=11):
+    """
+    Stations at load boundaries, point load/moment positions and support faces,
+    refined where the moment is curved so that linear interpolation between
+    stations is within tol.
+    spans : list of span length, m
+    loads : list of loads in each stretch or LoadTable
+    tol : allowed interpolation error of the bending moment, N-m
+          M'' = -q on a distributed load --> error = q h^2 / 8
+    support_width : width of the supports, m (faces at +-width/2 of each node)
+    min_points : minimum number of stations per span
+    return numS : np.array of number of points in each span, Xt : list of np.array
+    """
+    if tol <= 0:
+        raise ValueError(f"tol must be positive, not {tol}")
+    table = loads if isinstance(loads, LoadTable) else LoadTable.from_loads(loads)
+    jump = (table.type == POINT) | (table.type == MOMENT)
+
+    Xt = []
+    for i, L in enumerate(spans):
+        on = table.span == i
+        a = table.a[on]
+        e = a + table.l[on]
+        eps = 1e-6 * L
+
+        # Exact kinks and jumps : both sides of point loads and moments
+        points = [[0, L], a, e, a[jump[on]] - eps, a[jump[on]] + eps]
+        if support_width > 0:
+            points.append([support_width / 2, L - support_width / 2])
+        p = np.unique(np.clip(np.concatenate(points), 0, L))
+
+        # Curvature of the moment in each interval
+        mid = (p[:-1] + p[1:]) / 2
+        dist = table.type[on] == DISTRIBUTED
+        cover = (a[dist, None] <= mid) & (mid < e[dist, None])
+        w = np.abs(table.value[on][dist] @ cover) if dist.any() else 0 * mid
+
+        # Number of sub-intervals : q h^2 / 8 <= tol, h <= L / (min_points - 1)
+        h = np.diff(p)
+        n = np.ceil(h * np.sqrt(w / (8 * tol)))
+        n = np.maximum(n, np.ceil(h * (min_points - 1) / L)).astype(int)
+        n = np.maximum(n, 1)
+
+        x = [np.linspace(p[k], p[k + 1], n[k] + 1)[:-1] for k in range(len(h))]
+        Xt.append(np.concatenate(x + [[L]]))
+
+    numS = np.array([len(x) for x in Xt])
+    return numS, Xt
+
+
 # X-coordinate
 def X_coordinate(spans, stretch, Xt):
     X = []
@@ -90,3 +143,14 @@ def display_df(df):
             tablefmt="psql",
         )
     )
+
+
+# Summary of a design table (status / error columns) and csv output
+def summary(df, dt, out):
+    failed = df[df["status"] == "failed"]
+    print(f"Done in {dt:.2f} s : {len(df) - len(failed)} ok, {len(failed)} failed")
+    for name, error in zip(failed["name"], failed["error"]):
+        print(f"[FAILED] {name} : {error}")
+
+    df.drop(columns=["traceback"], errors="ignore").to_csv(out)
+    print(f"Result : {out}")
@@ -0,0 +1,5 @@
+## The modules of app/ import each other by name (python app/<module>.py)
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "app"))
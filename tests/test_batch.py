@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from batch import analyze_batch
+from load_table import DISTRIBUTED, MOMENT, POINT, LoadTable
+from stiffness_matrix import analyze
+
+SUPPORTS = [2, 2, 0, 3]
+TABLE = LoadTable(
+    [0, 1, 1, 2],
+    [DISTRIBUTED, POINT, MOMENT, POINT],
+    [15000, 20000, -3000, 5000],
+    [0.5, 1.5, 2.5, 1.0],
+    [2.0, 0, 0, 0],
+)
+
+
+def test_batch_matches_looped_analyze():
+    rng = np.random.default_rng(0)
+    B = 6
+    spans = rng.uniform(3, 6, size=(B, 3))
+    E = rng.uniform(20, 30, size=B)
+    I = rng.uniform(1e-3, 5e-3, size=(B, 3))
+    value = TABLE.value * rng.uniform(0.5, 1.5, size=(B, len(TABLE)))
+
+    out = analyze_batch(E, I, spans, SUPPORTS, TABLE, value=value)
+    for b in range(B):
+        table = LoadTable(TABLE.span, TABLE.type, value[b], TABLE.a, TABLE.l)
+        r = analyze(E[b], I[b], spans[b], SUPPORTS, table)
+        assert np.allclose(out["dy"][b], r.dy[:, 0], rtol=1e-9, atol=1e-15)
+        assert np.allclose(out["F"][b], r.F, rtol=1e-9, atol=1e-6)
+        J = np.abs(r.dy[:, 0]) == 0
+        assert np.allclose(out["R"][b][J], r.R[J, 0], rtol=1e-9, atol=1e-6)
+
+
+def test_support_layout_is_checked():
+    with pytest.raises(ValueError):
+        analyze_batch(25, 1e-3, [[4, 5, 6]], [2, 2, 2], TABLE)
@@ -0,0 +1,35 @@
+import pytest
+
+import campaign  # noqa: F401, both CLIs imported in one process
+import design_pipeline  # noqa: F401
+from batch_design import DEFAULTS, design_schedule
+
+
+def row(i, **kw):
+    return {**DEFAULTS, "row": i, "name": f"S{i + 1}", "b": 25, "h": 50, "c": 3, **kw}
+
+
+def test_failed_rows_are_reported():
+    df = design_schedule([row(0, Mu=120, Vu=80), row(1, b=10, h=20, Mu=50, Vu=900)])
+    assert list(df["status"]) == ["ok", "failed"]
+    assert "Heavy shear" in df.loc[1, "error"]
+    assert df.loc[0, "class"] == "singly_reinforcement"
+    assert df.loc[0, "As"] >= df.loc[0, "As_req"]
+
+
+def test_torsion_adds_longitudinal_steel():
+    df = design_schedule([row(0, Mu=120, Vu=80, Tu=0), row(1, Mu=120, Vu=80, Tu=15)])
+    assert not df.loc[0, "torsion"]
+    assert df.loc[1, "torsion"]
+    assert df.loc[1, "Al"] > 0
+    assert df.loc[1, "s"] <= df.loc[0, "s"]
+    assert df.loc[1, "As_req"] == pytest.approx(df.loc[0, "As_req"])
+
+
+def test_hogging_moment_is_designed_on_its_magnitude():
+    df = design_schedule([row(0, Mu=400), row(1, Mu=-400)])
+    assert list(df["face"]) == ["bottom", "top"]
+    assert df.loc[0, "class"] == "double_reinforcement"
+    for key in ("class", "As_req", "As1_req", "N", "N1"):
+        assert df.loc[1, key] == df.loc[0, key]
+    assert df.loc[1, "As1_req"] > 0
@@ -0,0 +1,79 @@
+import contextlib
+import io
+
+import pytest
+
+from batch_design import DEFAULTS as SECTION, design_section
+from beam_class import Beam
+from campaign import DEFAULTS, design
+
+
+def job(q):
+    # Fixed-fixed span 6 m : Mu- = qL2/12 at the supports, Mu+ = qL2/24 at midspan
+    return {
+        **DEFAULTS,
+        "job": 0,
+        "b": 25,
+        "h": 50,
+        "spans": [6],
+        "supports": [0, 0],
+        "loads": [{"span": 0, "type": 1, "value": q, "a": 0, "l": 6}],
+    }
+
+
+def beam_design(Mu):
+    with contextlib.redirect_stdout(io.StringIO()):
+        beam = Beam(fc=24, fy=390, fv=235, c=3)
+        beam.section_properties(16, 9, 25, 50)
+        beam.eff_depth()
+        beam.capacity()
+        beam.classification(Mu)
+        beam.mainbar_req(Mu)
+    return beam
+
+
+def test_hogging_moment_is_designed_on_its_magnitude():
+    row = design(job(320e3 * 12 / 36))  # Mu- = -320 kN-m
+    assert row["Mu-"] == pytest.approx(-320)
+
+    beam = beam_design(320)
+    assert beam.section_classification == "double_reinforcement"
+    assert row["class_top"] == "double_reinforcement"
+    assert row["As_req_top"] == pytest.approx(beam.data[1])
+    assert row["As1_req_top"] == pytest.approx(beam.data[2])
+    assert row["As1_req_top"] > 0
+
+
+def test_singly_reinforced_faces():
+    row = design(job(40e3))  # Mu- = -120 kN-m, Mu+ = 60 kN-m
+    for side, Mu in (("top", 120), ("bottom", 60)):
+        assert row[f"class_{side}"] == "singly_reinforcement"
+        assert row[f"As_req_{side}"] == pytest.approx(beam_design(Mu).data[0])
+        assert row[f"As1_req_{side}"] == 0
+
+
+def test_same_rules_as_batch_design():
+    row = design({**job(40e3), "Tu": 5})
+    section = design_section(
+        {**SECTION, "b": 25, "h": 50, "Mu": row["Mu-"], "Vu": row["Vu"], "Tu": 5}
+    )
+    for k in ("stirrup", "Av", "s", "torsion", "Al"):
+        assert row[k] == section[k]
+    for k in ("class", "As_req", "As1_req", "N", "As", "N1", "As1"):
+        assert row[f"{k}_top"] == section[k]
+
+
+def test_face_without_moment_is_not_designed():
+    # Cantilever 3 m, hogging only : Mu+ = 0 on the bottom face
+    row = design(
+        {
+            **job(20e3),
+            "spans": [3],
+            "supports": [0, 3],
+            "loads": [{"span": 0, "type": 1, "value": 20e3, "a": 0, "l": 3}],
+        }
+    )
+    assert row["Mu+"] == 0
+    assert row["class_bottom"] == "no_moment"
+    assert row["As_req_bottom"] == 0
+    assert row["class_top"] == "singly_reinforcement"
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from deflection import exact_deflection
+from load_table import LoadTable
+from stiffness_matrix import DistributedLoad, PointLoad, analyze
+
+E = 200  # GPa
+I = 1e-4  # m4
+EI = E * 1e9 * I  # N-m2
+
+
+def deflection_at(r, x):
+    return np.interp(x, r.X, r.deflection)
+
+
+def test_simply_supported_udl():
+    q, L = 10000, 6
+    loads = [[DistributedLoad(q, 0, L)]]
+    r = analyze(E, I, [L], [2, 2], loads)
+    table = LoadTable.from_loads(loads)
+    y = exact_deflection([L], table, r.F, r.dy, E * I, [np.array([L / 2])])
+    expected = -5 * q * L**4 / (384 * EI)  # Up+
+    assert y[0][0] == pytest.approx(expected, rel=1e-9)
+    assert r.maxDeflection[0] == pytest.approx(expected, rel=1e-5)
+    assert r.XmaxD[0] == pytest.approx(L / 2, abs=L / 999)
+
+
+def test_cantilever_point_load():
+    P, L = 5000, 3
+    r = analyze(E, I, [L], [0, 3], [[PointLoad(P, L)]])
+    assert r.deflection[-1] == pytest.approx(-P * L**3 / (3 * EI), rel=1e-9)
+    assert r.deflection[0] == 0
+
+
+def test_two_equal_spans_udl():
+    # Largest deflection of a two-span continuous beam : q L^4 / (185 EI) at 0.4215 L
+    q, L = 10000, 5
+    r = analyze(E, I, [L, L], [2, 2, 2], [[DistributedLoad(q, 0, L)]] * 2)
+    assert r.maxDeflection[0] == pytest.approx(-q * L**4 / (185 * EI), rel=2e-3)
+    assert r.XmaxD[0] == pytest.approx(0.4215 * L, abs=0.01)
+    assert deflection_at(r, L) == pytest.approx(0, abs=1e-15)
+
+
+def test_adaptive_stations_give_the_same_deflection():
+    q, L = 10000, 6
+    loads = [[DistributedLoad(q, 1, 3), PointLoad(8000, 4.5)]]
+    fine = analyze(E, I, [L], [0, 2], loads)
+    coarse = analyze(E, I, [L], [0, 2], loads, tol=10)
+    assert np.allclose(coarse.deflection, deflection_at(fine, coarse.X), atol=1e-8)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from design_pipeline import design_pipeline
+from flexure import flexure
+from rebar import Rebar
+from stiffness_matrix import DistributedLoad, analyze
+
+rebar = Rebar()
+B, H = 25, 45  # cm
+SPANS = [6, 6]
+SUPPORTS = [2, 2, 2]
+
+
+@pytest.fixture(scope="module")
+def table():
+    I = (1 / 12) * B * H**3 * 1e-8
+    r = analyze(23.5, I, SPANS, SUPPORTS, [[DistributedLoad(75e3, 0, 6)]] * 2)
+    return design_pipeline(r, SPANS, SUPPORTS, B, H)
+
+
+def provided(df, face):
+    return np.array(
+        [N * rebar.A[str(dia)] for N, dia in zip(df[f"N_{face}"], df[f"dia_{face}"])]
+    )
+
+
+def test_bars_carry_the_compression_steel_of_the_other_face(table):
+    support = table[table["kind"] == "M-"]
+    assert (support["As1_top"] > 0).all()
+    assert (provided(support, "bot") >= support["As1_top"] - 1e-9).all()
+
+    for face, other in (("bot", "top"), ("top", "bot")):
+        need = np.maximum(table[f"As_{face}"], table[f"As1_{other}"])
+        assert (provided(table, face) >= need - 1e-9).all()
+
+
+def test_layout_depth_is_rechecked(table):
+    # Required steel at the depth of the chosen layout, not the one-layer depth
+    for face, Mu in (("bot", table["Mu+"]), ("top", table["Mu-"])):
+        f = flexure(Mu.to_numpy(), B, H, d=table[f"d_{face}"].to_numpy())
+        As = np.where(Mu != 0, f["As"], 0)
+        assert (provided(table, face) >= As - 1e-9).all()
+    assert (table["layers_top"] > 1).any()
+    assert (table["d_top"][table["layers_top"] > 1] < H - (3 + 0.9 + 0.8)).all()
+
+
+def test_convergence_is_reported(table):
+    assert (table["status"] == "ok").all()
+
+    I = (1 / 12) * B * H**3 * 1e-8
+    r = analyze(23.5, I, SPANS, SUPPORTS, [[DistributedLoad(75e3, 0, 6)]] * 2)
+    df = design_pipeline(r, SPANS, SUPPORTS, B, H, max_iter=1)
+    assert (df["status"] == "not converged").all()
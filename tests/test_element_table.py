@@ -0,0 +1,51 @@
+import numpy as np
+
+from banded import to_dense
+from element_table import ElementTable
+from stiffness_matrix import BeamB
+
+E = [200, 200, 30]  # GPa
+I = [1e-4, 2e-4, 5e-4]  # m4
+L = [3, 4, 5]  # m
+
+
+def looped_stiffness():
+    K = np.zeros((8, 8))
+    for i in range(3):
+        K[2 * i : 2 * i + 4, 2 * i : 2 * i + 4] += BeamB(E[i], I[i], L[i]).k
+    return K
+
+
+def test_assembly_matches_looped_assembly():
+    e = ElementTable(E, I, L)
+    assert np.allclose(e.dense(), looped_stiffness())
+    for i in range(3):
+        assert np.allclose(e.k[i], BeamB(E[i], I[i], L[i]).k)
+
+
+def test_update_rebuilds_only_the_changed_elements():
+    e = ElementTable(E, I, L)
+    e.update([1], I=1e-4)
+    fresh = ElementTable(E, [1e-4, 1e-4, 5e-4], L)
+    assert np.allclose(e.dense(), fresh.dense())
+    assert np.allclose(e.k[[0, 2]], ElementTable(E, I, L).k[[0, 2]])
+
+
+def test_end_forces_match_each_span():
+    e = ElementTable(E, I, L)
+    rng = np.random.default_rng(0)
+    dy = rng.normal(size=e.ndof) * 1e-3
+    QF = rng.normal(size=(3, 4))
+    u, F = e.end_forces(dy, QF)
+    for i in range(3):
+        assert np.allclose(u[i], dy[2 * i : 2 * i + 4])
+        assert np.allclose(F[i], BeamB(E[i], I[i], L[i]).k @ u[i] + QF[i])
+
+
+def test_consistent_mass_of_a_rigid_translation():
+    m = [100, 250, 80]  # kg/m
+    e = ElementTable(E, I, L, m)
+    M = to_dense(e.banded_mass())
+    rigid = np.tile([1.0, 0.0], e.nodes)
+    assert np.isclose(rigid @ M @ rigid, np.dot(m, L))
+    assert np.allclose(M, M.T)
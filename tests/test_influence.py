@@ -0,0 +1,29 @@
+import numpy as np
+
+from influence import influence_lines
+
+E = 23.5  # GPa
+I = (1 / 12) * 30 * 60**3 * 1e-8  # m4
+SPANS = [4, 5, 3]
+SUPPORTS = [2, 2, 2, 3]
+
+
+def test_stations_are_rows_of_the_full_lines():
+    full = influence_lines(E, I, SPANS, SUPPORTS, numS=51)
+    assert full["V"].shape == (153, 153)
+
+    # Station at the interior support x = 4 belongs to the right span (row 51)
+    rows = [10, 51, 80, 152]
+    il = influence_lines(E, I, SPANS, SUPPORTS, numS=51, stations=full["X"][rows])
+    assert il["M"].shape == (4, 153)
+    assert np.allclose(il["Xr"], full["X"][rows])
+    assert np.allclose(il["X"], full["X"])
+    assert np.allclose(il["M"], full["M"][rows])
+    assert np.allclose(il["V"], full["V"][rows])
+    assert np.allclose(il["R"], full["R"])
+
+
+def test_maxwell_reciprocity():
+    # Moment at a station due to a unit load : symmetric in a simply supported span
+    il = influence_lines(E, I, [6], [2, 2], numS=61)
+    assert np.allclose(il["M"], il["M"].T)
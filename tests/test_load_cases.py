@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from influence import influence_lines
+from load_cases import LoadCases
+from pattern_load import pattern_envelope
+from stiffness_matrix import DistributedLoad, PointLoad, analyze
+
+E = 23.5  # GPa
+SPANS = [4, 6, 5]
+SUPPORTS = [2, 2, 2, 3]
+CASES = {
+    "D": [[DistributedLoad(12000, 0, 4)], [DistributedLoad(12000, 0, 6)], []],
+    "L": [[], [PointLoad(30000, 2)], [DistributedLoad(5000, 1, 3)]],
+}
+
+
+@pytest.mark.parametrize(
+    "I", [[2.0e-3, 4.5e-3, 1.2e-3], np.array([2.0e-3, 4.5e-3, 1.2e-3])]
+)
+def test_per_span_inertia_matches_analyze(I):
+    results = LoadCases(E, I, SPANS, SUPPORTS).analyse(CASES)
+    for name, loads in CASES.items():
+        r = analyze(E, I, SPANS, SUPPORTS, loads)
+        assert np.allclose(results[name]["dy"], r.dy, rtol=1e-10, atol=1e-15)
+        assert np.allclose(results[name]["R"], r.R, rtol=1e-10, atol=1e-6)
+        for F, Fr in zip(results[name]["F"], r.F):
+            assert np.allclose(np.ravel(F), Fr, atol=1e-6)
+
+
+def test_per_span_inertia_in_envelopes():
+    I = [2.0e-3, 4.5e-3, 1.2e-3]
+    il = influence_lines(E, I, SPANS, SUPPORTS, numS=41)
+    # Unit load at 2 m in the second span, as one analysis
+    p = 41 + 20
+    r = analyze(E, I, SPANS, SUPPORTS, [[], [PointLoad(1, il["X"][p] - 4)], []])
+    assert np.allclose(il["R"][:, p], r.R[il["dof"], 0], atol=1e-9)
+
+    env = pattern_envelope(E, I, SPANS, SUPPORTS, CASES["D"], 8000)
+    full = analyze(
+        E,
+        I,
+        SPANS,
+        SUPPORTS,
+        [[DistributedLoad(20000, 0, 4)], [DistributedLoad(20000, 0, 6)], []],
+    )
+    assert np.all(env["Mmax"] >= full.M - 1e-6)
+    assert np.all(env["Mmin"] <= full.M + 1e-6)
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from load_table import DISTRIBUTED, fef
+from stiffness_matrix import DistributedLoad
+
+
+@pytest.mark.parametrize("a, l", [(0.0, 6.0), (0.5, 2.0), (1.0, 4.5), (3.5, 2.5)])
+def test_partial_udl_end_reactions(a, l):
+    q, L = 12000, 6
+    Qf = np.ravel(DistributedLoad(q, a, l).Qf(L))
+    RL, ML, RR, MR = Qf
+
+    # Vertical equilibrium and moments about the left end (counterclockwise +)
+    assert RL + RR == pytest.approx(q * l)
+    assert ML + MR + RR * L == pytest.approx(q * l * (a + l / 2))
+
+    assert np.allclose(fef(DISTRIBUTED, q, a, l, L), Qf)
+
+
+def test_partial_udl_is_the_sum_of_its_parts():
+    q, L = 12000, 6
+    whole = np.ravel(DistributedLoad(q, 1, 4).Qf(L))
+    parts = np.ravel(DistributedLoad(q, 1, 1.5).Qf(L)) + np.ravel(
+        DistributedLoad(q, 2.5, 2.5).Qf(L)
+    )
+    assert np.allclose(whole, parts)
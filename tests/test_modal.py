@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from banded import to_banded, to_dense
+from element_table import ElementTable
+from modal import modal_analysis, subspace_iteration
+
+E = 30  # GPa
+I = 5e-3  # m4
+m = 600  # kg/m
+EI = E * 1e9 * I  # N-m2
+
+
+def test_simply_supported_modes():
+    L = 8
+    r = modal_analysis(E, I, [L], [2, 2], m, n_modes=3)
+    n = np.arange(1, 4)
+    expected = (n * np.pi) ** 2 * np.sqrt(EI / (m * L**4))
+    # Cubic elements (n_sub = 8) : error grows with the mode number
+    assert r["omega"][0] == pytest.approx(expected[0], rel=1e-4)
+    assert np.allclose(r["omega"], expected, rtol=2e-3)
+    assert np.all(r["omega"] >= expected)
+
+    # First mode : half sine
+    assert np.allclose(np.abs(r["modes"][:, 0]), np.sin(np.pi * r["X"] / L), atol=1e-3)
+
+
+def test_cantilever_first_mode():
+    L = 4
+    r = modal_analysis(E, I, [L], [0, 3], m, n_modes=2)
+    assert r["omega"][0] == pytest.approx(
+        1.8751**2 * np.sqrt(EI / (m * L**4)), rel=1e-4
+    )
+    assert r["omega"][1] == pytest.approx(
+        4.6941**2 * np.sqrt(EI / (m * L**4)), rel=1e-4
+    )
+
+
+def test_two_equal_spans_first_mode_is_one_span():
+    L = 6
+    r = modal_analysis(E, I, [L, L], [2, 2, 2], m, n_modes=2)
+    assert r["omega"][0] == pytest.approx(np.pi**2 * np.sqrt(EI / (m * L**4)), rel=1e-4)
+
+
+def test_subspace_iteration_matches_dense_eigenvalues():
+    e = ElementTable(E, I, np.full(12, 0.5), m)
+    J = np.arange(1, e.ndof - 1)  # pinned ends : d1 and dn fixed
+    K = to_dense(e.banded())[np.ix_(J, J)]
+    M = to_dense(e.banded_mass())[np.ix_(J, J)]
+    lam, X, _ = subspace_iteration(to_banded(K), to_banded(M), 4)
+    L = np.linalg.cholesky(M)
+    Li = np.linalg.inv(L)
+    exact = np.linalg.eigvalsh(Li @ K @ Li.T)[:4]
+    assert np.allclose(lam, exact, rtol=1e-8)
+    assert np.allclose(X.T @ M @ X, np.eye(4), atol=1e-8)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from moving_load import moving_envelope
+from stiffness_matrix import PointLoad, analyze
+
+E = 23.5  # GPa
+I = (1 / 12) * 30 * 60**3 * 1e-8  # m4
+
+
+# Direct sweep : one analysis per train position
+def sweep(spans, supports, axles, spacing, X, span_of, x_local, dx):
+    offsets = np.concatenate([[0], np.cumsum(spacing)])
+    edges = np.concatenate([[0], np.cumsum(spans)])
+    Ltotal = edges[-1]
+
+    M, R = [], []
+    for order in (1, -1):
+        P = np.asarray(axles)[::order]
+        o = (offsets[-1] - offsets[::-1]) if order == -1 else offsets
+        for lead in np.arange(0, Ltotal + offsets[-1] + dx / 2, dx):
+            loads = [[] for _ in spans]
+            for p, x in zip(P, lead - o):
+                if -1e-9 <= x <= Ltotal + 1e-9:
+                    i = min(np.searchsorted(edges, x, side="right") - 1, len(spans) - 1)
+                    loads[i].append(PointLoad(p, x - edges[i]))
+            r = analyze(E, I, spans, supports, loads)
+            M.append([r.moment[s](x) for s, x in zip(span_of, x_local)])
+            R.append(r.R[:, 0])
+    return np.array(M), np.array(R)
+
+
+@pytest.mark.parametrize(
+    "spans, supports",
+    [([4, 4], [2, 2, 2]), ([3, 4], [0, 2, 3])],
+)
+def test_moving_envelope_matches_direct_sweep(spans, supports):
+    axles = [30000, 50000, 20000]
+    spacing = [1.0, 1.5]
+    dx = 0.1
+    numS = 41 if spans[0] == 4 else 31
+    env = moving_envelope(E, I, spans, supports, axles, spacing, dx, numS=numS)
+
+    # Stations of the envelope on a coarse subset of the stations
+    span_of = np.repeat(np.arange(len(spans)), env["X"].size // len(spans))
+    starts = np.concatenate([[0], np.cumsum(spans)[:-1]])
+    x_local = env["X"] - starts[span_of]
+    pick = np.arange(0, len(span_of), 5)
+
+    M, R = sweep(
+        spans, supports, axles, spacing, env["X"], span_of[pick], x_local[pick], dx
+    )
+    scale = np.abs(M).max()
+    assert np.allclose(env["Mmax"][pick], M.max(axis=0), atol=1e-6 * scale)
+    assert np.allclose(env["Mmin"][pick], M.min(axis=0), atol=1e-6 * scale)
+    assert np.allclose(
+        env["Rmax"], R.max(axis=0)[env["dof"]], atol=1e-6 * np.abs(R).max()
+    )
+    assert np.allclose(
+        env["Rmin"], R.min(axis=0)[env["dof"]], atol=1e-6 * np.abs(R).max()
+    )
+
+
+def test_fft_matches_shifted_sums():
+    args = (E, I, [5, 6], [2, 2, 2], [10000] * 40, [0.2] * 39)
+    fft = moving_envelope(*args, method="fft")
+    direct = moving_envelope(*args, method="direct")
+    for key in ("Mmax", "Mmin", "Vmax", "Vmin", "Rmax", "Rmin"):
+        assert np.allclose(fft[key], direct[key])
+
+
+def test_grid_ends_at_the_beam_end():
+    # Cantilever 3.03 m, dx = 0.05 does not divide the length : Mmin = -P L
+    env = moving_envelope(E, I, [3.03], [0, 3], [10000], [], dx=0.05)
+    assert env["Mmin"].min() == pytest.approx(-10000 * 3.03)
+    assert env["Rmax"][0] == pytest.approx(10000)
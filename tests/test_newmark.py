@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from newmark import moving_point_load, newmark, rayleigh
+from stiffness_matrix import DistributedLoad, PointLoad, analyze
+
+E = 30  # GPa
+I = 5e-3  # m4
+m = 600  # kg/m
+L = 6  # m
+q = 20000  # N/m
+EI = E * 1e9 * I
+STATIC = -5 * q * L**4 / (384 * EI)  # midspan, Up+
+
+
+def constant(t):
+    return [[DistributedLoad(q, 0, L)]]
+
+
+def run(alpha, beta_K, n_steps, dt=1e-3):
+    return np.array(
+        [
+            w[0]
+            for t, w, M in newmark(
+                E,
+                I,
+                [L],
+                [2, 2],
+                m,
+                constant,
+                dt,
+                n_steps,
+                [L / 2],
+                alpha=alpha,
+                beta_K=beta_K,
+            )
+        ]
+    )
+
+
+def test_damped_response_converges_to_the_static_solution():
+    f1 = np.pi / 2 * np.sqrt(EI / (m * L**4))
+    w = run(*rayleigh(0.2, f1, 10 * f1), 2000)
+    assert w[-1] == pytest.approx(STATIC, rel=1e-4)
+
+
+def test_undamped_step_load_doubles_the_static_deflection():
+    w = run(0.0, 0.0, 200)
+    assert w.min() == pytest.approx(2 * STATIC, rel=2e-2)
+    assert w.max() <= 2e-2 * abs(STATIC)  # higher modes
+
+
+def test_slow_moving_load_is_quasi_static():
+    P, speed = 50000, 0.5  # m/s
+    stations = np.array([L / 2])
+    load = moving_point_load(P, speed, [L])
+    alpha, beta_K = rayleigh(0.2, 20, 200)
+    for t, w, M in newmark(
+        E,
+        I,
+        [L],
+        [2, 2],
+        m,
+        load,
+        2e-3,
+        3000,
+        stations,
+        alpha=alpha,
+        beta_K=beta_K,
+        every=500,
+    ):
+        x = speed * t
+        if 0 < x < L:
+            r = analyze(E, I, [L], [2, 2], [[PointLoad(P, x)]])
+            assert w[0] == pytest.approx(np.interp(L / 2, r.X, r.deflection), rel=1e-2)
@@ -0,0 +1,72 @@
+import itertools
+
+import numpy as np
+
+from combinations import envelope
+from load_table import LoadTable
+from pattern_load import code_patterns, pattern_envelope
+from stiffness_matrix import DistributedLoad, analyze
+
+E = 23.5  # GPa
+I = (1 / 12) * 30 * 60**3 * 1e-8  # m4
+SPANS = [5, 6, 4, 5]
+SUPPORTS = [2, 2, 2, 2, 2]
+DEAD = 12000  # N/m
+LIVE = 8000  # N/m
+
+
+def dead():
+    return [[DistributedLoad(DEAD, 0, L)] for L in SPANS]
+
+
+# Every 2^n live load arrangement, one full analysis each
+def brute_force(gamma_D, gamma_L):
+    M, V, R = [], [], []
+    for p in itertools.product([0, 1], repeat=len(SPANS)):
+        loads = [
+            [DistributedLoad(gamma_D * DEAD + gamma_L * LIVE * on, 0, L)]
+            for on, L in zip(p, SPANS)
+        ]
+        r = analyze(E, I, SPANS, SUPPORTS, loads)
+        M.append(r.M)
+        V.append(r.V)
+        R.append(r.R[:, 0])
+    return np.array(M), np.array(V), np.array(R)
+
+
+def test_pattern_envelope_matches_brute_force():
+    M, V, R = brute_force(1.4, 1.7)
+    env = pattern_envelope(E, I, SPANS, SUPPORTS, dead(), LIVE, 1.4, 1.7)
+    for name, values in (("M", M), ("V", V), ("R", R)):
+        scale = np.abs(values).max()
+        assert np.allclose(env[name + "max"], values.max(axis=0), atol=1e-8 * scale)
+        assert np.allclose(env[name + "min"], values.min(axis=0), atol=1e-8 * scale)
+
+
+def test_all_patterns_equal_sign_based_envelope():
+    patterns = np.array(list(itertools.product([0, 1], repeat=len(SPANS))))
+    worst = pattern_envelope(E, I, SPANS, SUPPORTS, dead(), LIVE)
+    listed = pattern_envelope(E, I, SPANS, SUPPORTS, dead(), LIVE, patterns=patterns)
+    for key in ("Mmax", "Mmin", "Vmax", "Vmin"):
+        assert np.allclose(worst[key], listed[key])
+
+
+def test_code_patterns_bound_the_support_moments():
+    M, _, _ = brute_force(1.0, 1.0)
+    env = pattern_envelope(
+        E, I, SPANS, SUPPORTS, dead(), LIVE, patterns=code_patterns(len(SPANS))
+    )
+    # Interior supports : last station of each span but the last one
+    support = np.cumsum([1000] * len(SPANS))[:-1] - 1
+    assert np.allclose(env["Mmin"][support], M.min(axis=0)[support])
+
+
+def test_combination_envelope():
+    table = LoadTable.from_loads(dead())
+    cases = {"D": table, "L": table.scale(LIVE / DEAD)}
+    env = envelope(E, I, SPANS, SUPPORTS, cases)
+    r = analyze(E, I, SPANS, SUPPORTS, table)
+    # Every combination is a multiple of the dead load case here
+    factors = env["M"][:, 500] / r.M[500]
+    assert np.allclose(env["M"], factors[:, None] * r.M[None, :])
+    assert np.allclose(env["Mmax"], env["M"].max(axis=0))
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from rebar_optimizer import optimize_rebar, ranking, rebar_layouts, select_rebar
+
+B, C, TRAV = 30, 3, 9  # cm, cm, mm
+
+
+@pytest.fixture(scope="module")
+def layouts():
+    return rebar_layouts(B, C, TRAV)
+
+
+def test_layouts_are_feasible(layouts):
+    db = layouts["dia"] / 10
+    width = B - 2 * C - 2 * TRAV / 10 - db
+    assert np.all(layouts["N"] >= 2)
+    assert np.all(layouts["clear"] >= np.maximum(2.5, db) - 1e-12)
+    centre = width / np.maximum(layouts["per_layer"] - 1, 1)
+    assert np.allclose(
+        layouts["clear"][layouts["per_layer"] > 1],
+        (centre - db)[layouts["per_layer"] > 1],
+    )
+    # 8 DB25 do not fit in one layer of a 30 cm beam, 2 layers of 4 do
+    one = (layouts["dia"] == 25) & (layouts["N"] == 8)
+    assert set(layouts["layers"][one]) == {2, 3}
+
+
+@pytest.mark.parametrize("objective", ["steel", "count"])
+def test_selection_is_the_cheapest_feasible_layout(layouts, objective):
+    As_req = np.array([3.0, 9.5, 17.2, 31.0])
+    i = select_rebar(As_req, layouts, objective)
+    assert np.all(i >= 0)
+    assert np.all(layouts["As"][i] >= As_req)
+
+    # Brute force : first of the ranking among the layouts with enough steel
+    order = ranking(layouts, objective)
+    for j, As in zip(i, As_req):
+        ok = order[layouts["As"][order] >= As]
+        assert j == ok[0]
+        key = "As" if objective == "steel" else "N"
+        assert layouts[key][j] == layouts[key][ok].min()
+
+
+def test_no_feasible_layout(layouts):
+    assert select_rebar([1e4], layouts)[0] == -1
+    best, ranked = optimize_rebar(1e4, B, C, TRAV, layouts=layouts)
+    assert best is None and len(ranked) == 0
+
+
+def test_per_layout_requirement(layouts):
+    # Requirement growing with the layers : one-layer layouts are cheaper to satisfy
+    req = 10.0 + 20.0 * (layouts["layers"] - 1)
+    i = select_rebar(req[None, :], layouts)[0]
+    assert layouts["layers"][i] == 1
+    assert layouts["As"][i] >= 10.0
+
+
+def test_optimize_rebar_ranking(layouts):
+    best, ranked = optimize_rebar(12.0, B, C, TRAV, alternatives=5, layouts=layouts)
+    assert len(ranked) == 5
+    assert best["As"] == ranked["As"].iloc[0]
+    assert (ranked["As"] >= 12.0).all()
+    assert (np.diff(ranked["As"]) >= 0).all()
+    assert (ranked["excess"] >= 0).all()
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from session import AnalysisSession
+from stiffness_matrix import DistributedLoad, MomentConcentrated, PointLoad, analyze
+
+E = 200  # GPa
+I = 1e-4  # m4
+SPANS = [3, 4, 5, 2]
+
+
+def loads():
+    return [
+        [DistributedLoad(17000, 0, 3)],
+        [PointLoad(20000, 1.5), MomentConcentrated(-3000, 2.5)],
+        [DistributedLoad(10000, 1, 2)],
+        [PointLoad(3000, 2)],
+    ]
+
+
+def check(session, support_type, loads):
+    r = analyze(E, I, SPANS, support_type, loads)
+    dy, R = session.solve()
+    assert np.allclose(dy, r.dy, rtol=1e-9, atol=1e-14)
+    J = np.abs(r.dy[:, 0]) == 0
+    assert np.allclose(R[J], r.R[J], rtol=1e-9, atol=1e-6)
+    assert np.allclose(session.result().M, r.M, rtol=1e-9, atol=1e-6)
+
+
+def test_load_edits():
+    supports = [2, 2, 0, 2, 3]
+    s = AnalysisSession(E, I, SPANS, supports, loads())
+    check(s, supports, loads())
+
+    edited = loads()
+    edited[1] = [PointLoad(45000, 3)]
+    edited[3] = []
+    s.set_loads(1, edited[1])
+    s.set_loads(3, edited[3])
+    check(s, supports, edited)
+    assert s.refactors == 1
+
+
+def test_support_add_and_remove():
+    supports = [2, 2, 0, 2, 3]
+    s = AnalysisSession(E, I, SPANS, supports, loads())
+
+    supports[4] = 2  # prop the cantilever
+    s.set_support(4, 2)
+    check(s, supports, loads())
+
+    supports[1] = 3  # remove an interior support
+    s.set_support(1, 3)
+    check(s, supports, loads())
+
+    supports[2] = 2  # fixed --> pin
+    s.set_support(2, 2)
+    check(s, supports, loads())
+    assert s.refactors == 1
+
+
+def test_refactorization_threshold():
+    supports = [2, 2, 2, 2, 2]
+    s = AnalysisSession(E, I, SPANS, supports, loads(), max_rank=2)
+    for node in (1, 2, 3):
+        supports[node] = 0  # each fixed node constrains one rotation
+        s.set_support(node, 0)
+        check(s, supports, loads())
+    assert s.refactors == 2
+    assert len(s.A) + len(s.C) <= 2
+
+
+def test_no_free_dof():
+    supports = [0, 0, 0, 0, 0]
+    s = AnalysisSession(E, I, SPANS, supports, loads())
+    check(s, supports, loads())
+
+    supports[4] = 2  # release a rotation from a fully fixed beam
+    s.set_support(4, 2)
+    check(s, supports, loads())
+
+
+def test_unstable_support_change():
+    s = AnalysisSession(E, I, [4], [2, 2], [[PointLoad(1000, 2)]])
+    with pytest.raises(np.linalg.LinAlgError):
+        s.set_support(0, 3)
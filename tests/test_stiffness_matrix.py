@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from banded import banded_dot, ldl_factor, ldl_solve, to_banded, to_dense
+from load_table import LoadTable
+from stiffness_matrix import (
+    DistributedLoad,
+    MomentConcentrated,
+    PointLoad,
+    analyze,
+    free_dofs,
+    moment_values,
+    shear_values,
+)
+from utils import xi_coordinate
+
+E = 200  # GPa
+I = (1000 * 24**3) * 1e-8  # m4
+SPANS = [3, 4, 5, 2]
+SUPPORTS = [2, 2, 0, 2, 3]
+
+
+def loads():
+    return [
+        [DistributedLoad(17000, 0, 3)],
+        [PointLoad(20000, 1.5), MomentConcentrated(-3000, 2.5)],
+        [DistributedLoad(10000, 1, 2), PointLoad(5000, 4)],
+        [PointLoad(3000, 2)],
+    ]
+
+
+## Solver
+def test_banded_storage_round_trip():
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(8, 8))
+    K = np.triu(np.tril(A + A.T, 3), -3)
+    Kb = to_banded(K)
+    assert np.allclose(to_dense(Kb), K)
+    d = rng.normal(size=(8, 2))
+    assert np.allclose(banded_dot(Kb, d), K @ d)
+
+
+def test_ldl_solve_matches_dense():
+    K = analyze(E, I, SPANS, SUPPORTS, loads(), solver="dense").K
+    J = free_dofs(SUPPORTS)
+    Ki = K[np.ix_(J, J)]
+    b = np.arange(1, len(J) + 1, dtype=float)
+    assert np.allclose(ldl_solve(ldl_factor(to_banded(Ki)), b), np.linalg.solve(Ki, b))
+
+
+def test_banded_matches_dense():
+    dense = analyze(E, I, SPANS, SUPPORTS, loads(), solver="dense")
+    band = analyze(E, I, SPANS, SUPPORTS, loads(), solver="banded")
+    assert np.allclose(band.dy, dense.dy, rtol=1e-10, atol=1e-14)
+    assert np.allclose(band.R, dense.R, rtol=1e-10, atol=1e-6)
+    assert np.allclose(band.M, dense.M, rtol=1e-10, atol=1e-6)
+    assert np.allclose(band.V, dense.V, rtol=1e-10, atol=1e-6)
+
+
+def test_equilibrium():
+    r = analyze(E, I, SPANS, SUPPORTS, loads())
+    applied = 17000 * 3 + 20000 + 10000 * 2 + 5000 + 3000
+    assert r.R[0::2, 0].sum() == pytest.approx(applied)
+
+
+def test_closed_form():
+    # Simply supported span : qL2/8 ; propped cantilever : -qL2/8 at the fixed end
+    q, L = 10000, 6
+    r = analyze(E, I, [L], [2, 2], [[DistributedLoad(q, 0, L)]])
+    assert r.maxMoment.max() == pytest.approx(q * L**2 / 8)
+    assert r.maxShear.max() == pytest.approx(q * L / 2)
+
+    r = analyze(E, I, [L], [0, 2], [[DistributedLoad(q, 0, L)]])
+    assert r.minMoment.min() == pytest.approx(-q * L**2 / 8)
+    assert r.maxMoment.max() == pytest.approx(9 * q * L**2 / 128)
+
+
+## Load table
+def test_load_table_matches_load_objects():
+    objects = loads()
+    table = LoadTable.from_loads(objects)
+
+    QF = table.fixed_end_forces(SPANS)
+    for i, L in enumerate(SPANS):
+        expected = sum(np.ravel(f.Qf(L)) for f in objects[i])
+        assert np.allclose(QF[i], expected)
+
+    r = analyze(E, I, SPANS, SUPPORTS, objects)
+    numS, Xt = xi_coordinate(SPANS, 101)
+    stretch = r.stretch
+    for a, b in (
+        (
+            table.shear_values(SPANS, r.F, Xt),
+            shear_values(SPANS, stretch, objects, r.F, Xt),
+        ),
+        (
+            table.moment_values(SPANS, r.F, Xt),
+            moment_values(SPANS, stretch, objects, r.F, Xt),
+        ),
+    ):
+        for x, y in zip(a, b):
+            assert np.allclose(x, y, atol=1e-6)
+
+    by_table = analyze(E, I, SPANS, SUPPORTS, table)
+    assert np.allclose(by_table.M, r.M)
+    assert np.allclose(by_table.R, r.R)
+
+
+## Diagrams
+def test_exact_diagrams_match_stations():
+    r = analyze(E, I, SPANS, SUPPORTS, loads())
+    for s, x in enumerate(r.Xt):
+        i = sum(len(t) for t in r.Xt[:s])
+        M = r.M[i : i + len(x)]
+        assert np.allclose(r.moment[s](x), M, atol=1e-6)
+
+        # Exact extrema bound the sampled values and are reached within one step
+        assert r.maxMoment[s] >= M.max() - 1e-6
+        assert r.minMoment[s] <= M.min() + 1e-6
+        assert r.maxMoment[s] - M.max() < 1e-3 * np.abs(M).max()
+
+
+def test_adaptive_stations_match_exact_diagrams():
+    r = analyze(E, I, SPANS, SUPPORTS, loads(), tol=1)
+    M = np.split(r.M, np.cumsum([len(x) for x in r.Xt])[:-1])
+    for s, x in enumerate(r.Xt):
+        assert np.allclose(r.moment[s](x), M[s], atol=1e-6)
+
+
+def test_banded_dot_rows():
+    rng = np.random.default_rng(1)
+    A = rng.normal(size=(10, 10))
+    K = np.triu(np.tril(A + A.T, 3), -3)
+    d = rng.normal(size=(10, 3))
+    rows = [0, 2, 5, 9]
+    assert np.allclose(banded_dot(to_banded(K), d, rows), (K @ d)[rows])
+    assert np.allclose(banded_dot(to_banded(K), d[:, 0], rows), (K @ d[:, 0])[rows])
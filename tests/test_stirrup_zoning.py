@@ -0,0 +1,80 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from rebar import Rebar
+from shear import beam_traverse
+from stiffness_matrix import DistributedLoad, PointLoad, analyze
+from design_pipeline import station_span
+from stirrup_zoning import stirrup_zoning, zoning
+
+rebar = Rebar()
+B, H = 30, 60  # cm
+D = H - (3 + 0.9 + 0.8)  # cm
+SPANS = [6, 7]
+
+
+@pytest.fixture(scope="module")
+def result():
+    I = (1 / 12) * B * H**3 * 1e-8
+    loads = [
+        [DistributedLoad(60000, 0, 6)],
+        [DistributedLoad(50000, 0, 7), PointLoad(150000, 2)],
+    ]
+    return analyze(23.5, I, SPANS, [2, 2, 2], loads)
+
+
+@pytest.mark.parametrize("max_zones", [1, 3, 5])
+def test_zones_cover_the_span_and_the_demand(result, max_zones):
+    df = stirrup_zoning(result, SPANS, B, H, max_zones=max_zones)
+    Av = 2 * rebar.A["9"]
+    start = np.cumsum(SPANS) - np.array(SPANS)
+    for j, L in enumerate(SPANS):
+        z = df[df["span"] == j]
+        assert 1 <= len(z) <= max_zones
+        assert z["x0"].iloc[0] == 0 and z["x1"].iloc[-1] == pytest.approx(L)
+        assert np.allclose(z["x0"].iloc[1:], z["x1"].iloc[:-1])
+        assert np.allclose(z["s"] % 2.5, 0)
+        assert (z["n"] * z["s"] >= (z["x1"] - z["x0"]) * 100 - 1e-6).all()
+
+        # Spacing of every zone within the spacing allowed at every station of it
+        on = station_span(result.X, SPANS) == j
+        x = result.X[on] - start[j]
+        allowed = beam_traverse(B, D, Av, np.abs(result.V[on]) / 1000, 24, 235)["s"]
+        for x0, x1, s in zip(z["x0"], z["x1"], z["s"]):
+            inside = (x >= x0) & (x <= x1)
+            assert s <= allowed[inside].min() + 1e-9
+
+
+def test_more_zones_never_need_more_stirrups(result):
+    n = [
+        stirrup_zoning(result, SPANS, B, H, max_zones=k, tol=0)["n"].sum()
+        for k in (1, 2, 3, 5)
+    ]
+    assert n == sorted(n, reverse=True)
+    assert n[-1] < n[0]
+
+
+def test_dynamic_programming_matches_brute_force():
+    grid = np.linspace(0, 3, 7)
+    s_cell = np.array([9.0, 14.0, 27.0, 27.0, 12.0, 8.0])
+    count, zones = zoning(grid, s_cell, max_zones=3)
+    for k in range(3):
+        least = np.inf
+        for cuts in itertools.combinations(range(1, 6), k):
+            edges = [0, *cuts, 6]
+            n = 0
+            for i, j in zip(edges[:-1], edges[1:]):
+                s = np.floor(s_cell[i:j].min() / 2.5) * 2.5
+                n += np.ceil((grid[j] - grid[i]) * 100 / s - 1e-9)
+            least = min(least, n)
+        assert count[k] == least
+        assert sum(z[3] for z in zones[k]) == least
+
+
+def test_heavy_shear_is_rejected():
+    X = np.array([0.0, 2.0, 4.0])
+    V = np.array([900e3, 0, -900e3])
+    with pytest.raises(ValueError):
+        stirrup_zoning({"X": X, "V": V, "M": np.zeros(3)}, [4], 20, 40)
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from stiffness_matrix import DistributedLoad, PointLoad
+from utils import adaptive_coordinate
+
+
+def test_distributed_load_is_refined_within_tol():
+    q, tol = 10000, 10
+    numS, Xt = adaptive_coordinate([6], [[DistributedLoad(q, 1, 3)]], tol=tol)
+    x = Xt[0]
+    on = (x[:-1] >= 1) & (x[1:] <= 4)
+    assert on.any()
+    assert (q * np.diff(x)[on] ** 2 / 8 <= tol * (1 + 1e-12)).all()
+    assert numS[0] == len(x)
+
+
+def test_point_load_is_not_refined():
+    numS, Xt = adaptive_coordinate([6], [[PointLoad(8000, 4.5)]], tol=1e-3)
+    assert numS[0] < 20
+
+
+@pytest.mark.parametrize("tol", [0, -1])
+def test_tol_must_be_positive(tol):
+    with pytest.raises(ValueError):
+        adaptive_coordinate([6], [[DistributedLoad(10000, 0, 6)]], tol=tol)